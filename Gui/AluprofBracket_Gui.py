@@ -7,6 +7,7 @@ import logging
 from parts import AluProfBracketPerp, AluProfBracketPerpFlap, AluProfBracketPerpTwin
 from Gui.Advance_Placement_Gui import Advance_Placement_TaskPanel
 from Gui.function_Gui import set_place, ortonormal_axis
+from Gui.tracker_Gui import add_tracking, remove_tracking
 __dir__ = os.path.dirname(__file__)
 
 logging.basicConfig(level=logging.DEBUG)
@@ -341,10 +342,10 @@ class AluprofBracket_Dialog:
         self.form = [self.AluprofBracket.widget, self.Advance.widget]
     
         # Event to track the mouse 
-        self.track = self.v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(self.v, self.position)
 
     def accept(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -438,7 +439,7 @@ class AluprofBracket_Dialog:
             FreeCADGui.Control.closeDialog()  # close the dialog
 
     def reject(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -447,37 +448,18 @@ class AluprofBracket_Dialog:
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
+        if info["Down"] is True:
+            self.placement = not self.placement
+
         if self.placement is True:
-            set_place(self.AluprofBracket,
-                      round(self.v.getPoint(pos)[0], 3),
-                      round(self.v.getPoint(pos)[1], 3),
-                      round(self.v.getPoint(pos)[2], 3))
-        else:
-            pass
-
-        if FreeCAD.Gui.Selection.hasSelection():
+            pos = info["Point"]
+            set_place(self.AluprofBracket, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
                 set_place(self.AluprofBracket, pos.x, pos.y, pos.z)
-            except Exception:
-                None
 
 
 # Command
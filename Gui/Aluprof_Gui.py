@@ -7,6 +7,7 @@ import logging
 from comps_new import AluProf  
 from Gui.Advance_Placement_Gui import Advance_Placement_TaskPanel
 from Gui.function_Gui import set_place, ortonormal_axis
+from Gui.tracker_Gui import add_tracking, remove_tracking
 
 import kcomp
 
@@ -232,10 +233,10 @@ class Aluproft_Dialog:
         self.form = [self.Aluproft.widget, self.Advance.widget]
     
         # Event to track the mouse 
-        self.track = self.v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(self.v, self.position)
 
     def accept(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -283,7 +284,7 @@ class Aluproft_Dialog:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -292,37 +293,18 @@ class Aluproft_Dialog:
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
+        if info["Down"] is True:
+            self.placement = not self.placement
+
         if self.placement is True:
-            set_place(self.Aluproft,
-                      round(self.v.getPoint(pos)[0], 3),
-                      round(self.v.getPoint(pos)[1], 3),
-                      round(self.v.getPoint(pos)[2], 3))
-        else:
-            pass
-
-        if FreeCAD.Gui.Selection.hasSelection():
+            pos = info["Point"]
+            set_place(self.Aluproft, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
                 set_place(self.Aluproft, pos.x, pos.y, pos.z)
-            except Exception:
-                None
 
 
 # Command
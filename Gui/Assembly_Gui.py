@@ -3,7 +3,7 @@ import os
 import FreeCAD
 import FreeCADGui
 
-from grafic import grafic
+from grafic import grafic, snap_select, SNAP_R
 
 __dir__ = os.path.dirname(__file__)
 
@@ -82,6 +82,18 @@ class Assembly_TaskPanel:
         # ---- row 4: Note ----
         self.Text_Note = QtWidgets.QLabel("With Vertexes don't work properly")
 
+        # ---- row 5: Snap ----
+        # with only one object selected, it snaps to the nearest point
+        self.Snap_CheckBox = QtWidgets.QCheckBox("Snap to the nearest point")
+        self.Snap_CheckBox.setToolTip("Select only the object to move: its "
+                                      "hole, face or vertex goes to the "
+                                      "nearest compatible one")
+        self.Snap_Value = QtWidgets.QDoubleSpinBox()
+        self.Snap_Value.setMinimum(0.1)
+        self.Snap_Value.setMaximum(1000)
+        self.Snap_Value.setValue(SNAP_R)
+        self.Snap_Value.setSuffix(' mm')
+
         # row X, column X, rowspan X, colspan X
         layout.addWidget(self.Text_1_Label, 0, 0, 1, 1)
         layout.addWidget(self.ComboBox_ObjSelection1, 0, 1, 1, 1)
@@ -92,6 +104,8 @@ class Assembly_TaskPanel:
         layout.addWidget(self.Text_Selection2, 3, 0, 1, 1)
         layout.addWidget(self.ComboBox_Selection2, 3, 1, 1, 1)
         layout.addWidget(self.Text_Note, 4, 0, 1, 1)
+        layout.addWidget(self.Snap_CheckBox, 5, 0, 1, 1)
+        layout.addWidget(self.Snap_Value, 5, 1, 1, 1)
 
     def accept(self):
         self.ObjSelection1 = FreeCAD.ActiveDocument.Objects[self.ComboBox_ObjSelection1.currentIndex()]
@@ -105,6 +119,17 @@ class Assembly_TaskPanel:
             grafic()
             Assembly_TaskPanel.change_color(self, color=(0.0, 0.0, 0.0), size=2)
             FreeCADGui.Control.closeDialog()  # close the dialog
+        elif (len(FreeCADGui.Selection.getSelection()) == 1
+              and self.Snap_CheckBox.isChecked()):
+            if snap_select(r=self.Snap_Value.value()) is None:
+                message = QtWidgets.QMessageBox()
+                message.setText('No compatible point near the selection')
+                message.setStandardButtons(QtWidgets.QMessageBox.Ok)
+                message.setDefaultButton(QtWidgets.QMessageBox.Ok)
+                message.exec_()
+                return
+            Assembly_TaskPanel.change_color(self, color=(0.0, 0.0, 0.0), size=2)
+            FreeCADGui.Control.closeDialog()  # close the dialog
         else:
             message = QtWidgets.QMessageBox()
             message.setText('Select object to move and placement')
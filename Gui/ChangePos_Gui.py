@@ -3,7 +3,8 @@ import os
 import FreeCAD
 import FreeCADGui
 
-from print_export_fun import print_export
+from print_export_fun import print_export, print_export_batch
+from print_export_fun import get_print_objs, get_doc_print_objs
 
 __dir__ = os.path.dirname(__file__)
 
@@ -41,3 +42,63 @@ class _ChangePosExport_Cmd:
 
 # Command
 FreeCADGui.addCommand('ChangePosExport', _ChangePosExport_Cmd())
+
+
+class _ChangePosExportAll_Cmd:
+    def Activated(self):
+        # the selected objects, or the whole document if nothing is selected
+        selection = FreeCADGui.Selection.getSelection()
+        if len(selection) != 0:
+            obj_list = get_print_objs(selection)
+        else:
+            obj_list = get_doc_print_objs(FreeCAD.ActiveDocument)
+        if len(obj_list) == 0:
+            message = QtWidgets.QMessageBox()
+            message.setIcon(QtWidgets.QMessageBox.Icon.Critical)
+            message.setWindowTitle('Error')
+            message.setText("There are no objects to export")
+            message.setStandardButtons(QtWidgets.QMessageBox.Ok)
+            message.setDefaultButton(QtWidgets.QMessageBox.Ok)
+            message.exec_()
+            return
+        folder_name = QtWidgets.QFileDialog.getExistingDirectory(QtWidgets.QFileDialog(), "Select directory", "c:/",
+                                                                 QtWidgets.QFileDialog.ShowDirsOnly)
+        if folder_name != "":
+            try:
+                manifest = print_export_batch(obj_list, str(folder_name))
+            except RuntimeError as err:  # a meshing process has failed
+                message = QtWidgets.QMessageBox()
+                message.setIcon(QtWidgets.QMessageBox.Icon.Critical)
+                message.setWindowTitle('Error')
+                message.setText("The export has failed:\n" + str(err))
+                message.setStandardButtons(QtWidgets.QMessageBox.Ok)
+                message.setDefaultButton(QtWidgets.QMessageBox.Ok)
+                message.exec_()
+                return
+            message = QtWidgets.QMessageBox()
+            message.setIcon(QtWidgets.QMessageBox.Icon.Information)
+            message.setWindowTitle('Congratulations')
+            message.setText("You export " + str(len(manifest)) + " objects in " + folder_name)
+            message.setStandardButtons(QtWidgets.QMessageBox.Ok)
+            message.setDefaultButton(QtWidgets.QMessageBox.Ok)
+            message.exec_()
+
+    def GetResources(self):
+        MenuText = QtCore.QT_TRANSLATE_NOOP(
+            'Export All',
+            'Export All')
+        ToolTip = QtCore.QT_TRANSLATE_NOOP(
+            '',
+            'Selected objects (or all the document objects, if nothing is selected) '
+            'are exported in .stl at their print position')
+        return {
+            'Pixmap': __dir__ + '/../Resources/icons/MakerWorkbench_ChangePosExport_Cmd.svg',
+            'MenuText': MenuText,
+            'ToolTip': ToolTip}
+
+    def IsActive(self):
+        return not FreeCAD.ActiveDocument is None 
+
+
+# Command
+FreeCADGui.addCommand('ChangePosExportAll', _ChangePosExportAll_Cmd())
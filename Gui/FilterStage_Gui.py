@@ -5,6 +5,10 @@ import FreeCADGui
 import logging
 
 from filter_stage_fun import filter_stage_fun
+from Gui.function_Gui import set_place
+from Gui.tracker_Gui import add_tracking, remove_tracking
+from Gui.preview_Gui import Preview
+from Gui.build_Gui import BuildExecutor, view_fit
 
 __dir__ = os.path.dirname(__file__)
 
@@ -197,47 +201,67 @@ class FilterStage_TaskPanel:
         main_layout.addLayout(thickness_layout)
         main_layout.addLayout(placement_layout)
 
-        self.track = self.v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(self.v, self.position)
+
+        # Preview of the filter stage while the values are changed
+        self.preview = Preview(self.v, self.get_params, 'filter_stage_fun',
+                               'filter_stage_fun', self.build_call)
+        self.preview.connect([self.form])
+        self.preview.changed()
+
+    def get_params(self):
+        selec_base = {0: 5, 1: 10, 2: 15, 3: 20, 4: 30, 5: 40}
+        SizeHolder = {0: 8, 1: 11, 2: 14, 3: 17, 4: 23, 5: 34, 6: 42}
+        return {
+            'move_l': self.move_l_Value.value(),
+            # Filter holder
+            'Filter_Length': self.Filter_Length_Value.value(),
+            'Filter_Width': self.Filter_Width_Value.value(),
+            # tensioner
+            'nut_hole': 3 + self.ComboBox_Nut_Hole.currentIndex(),  # Index star in 0, first value = 3
+            'tens_stroke': self.tens_stroke_Value.value(),
+            'base_w': selec_base[self.ComboBox_base_w.currentIndex()],
+            'wall_thick': self.wall_th_Value.value(),
+            # motor holder
+            'size_motor': SizeHolder[self.ComboBox_Size_Holder.currentIndex()],
+            'h_motor': self.motor_high_Value.value(),
+            'thik_motor': self.Thickness_Value.value(),
+            'pos': FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())}
+
+    def build_args(self, params):
+        return [params['move_l'], params['Filter_Length'],
+                params['Filter_Width'], params['nut_hole'],
+                params['tens_stroke'], params['base_w'],
+                params['wall_thick'], params['size_motor'],
+                params['h_motor'], params['thik_motor'],
+                params['pos']]
+
+    def build_call(self, params):
+        return self.build_args(params), {}
 
     def accept(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
                 FreeCAD.ActiveDocument.removeObject('Point_d_w_h')
 
-        selec_base = {0: 5, 1: 10, 2: 15, 3: 20, 4: 30, 5: 40}
-        move_l = self.move_l_Value.value()
-        # Filter holder
-        Filter_Length = self.Filter_Length_Value.value()
-        Filter_Width = self.Filter_Width_Value.value()
-        # tensioner
-        nut_hole = 3 + self.ComboBox_Nut_Hole.currentIndex()  # Index star in 0, first value = 3
-        tens_stroke = self.tens_stroke_Value.value()
-        base_w = selec_base[self.ComboBox_base_w.currentIndex()]
-        wall_thick = self.wall_th_Value.value()
-        # motor holder
-        SizeHolder = {0: 8, 1: 11, 2: 14, 3: 17, 4: 23, 5: 34, 6: 42}
-        size_motor = SizeHolder[self.ComboBox_Size_Holder.currentIndex()]
-        h_motor = self.motor_high_Value.value()
-        thik_motor = self.Thickness_Value.value()
-
-        pos = FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())
-
-        filter_stage_fun(move_l, Filter_Length, Filter_Width, nut_hole,
-                         tens_stroke, base_w, wall_thick, size_motor,
-                         h_motor, thik_motor, pos)
+        params = self.get_params()
         # pulley_h => belt_pos_h
         # nut_hole => bolttens_mtr
         # tens_stroke => tens_stroke_Var
         # base_w => aluprof_w
         # wall_thick => wall_thick_Var
-        FreeCADGui.activeDocument().activeView().viewAxonometric()
-        FreeCADGui.SendMsgToActiveView("ViewFit")
         FreeCADGui.Control.closeDialog()  # close the dialog
+        # the stage is built without blocking the GUI
+        BuildExecutor('Filter Stage', 'filter_stage_fun', 'filter_stage_fun',
+                      args=self.build_args(params),
+                      on_done=view_fit).start()
 
     def reject(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -246,40 +270,18 @@ class FilterStage_TaskPanel:
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
+        if info["Down"] is True:
+            self.placement = not self.placement
+
         if self.placement is True:
-            self.pos_x.setValue(round(self.v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(self.v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(self.v.getPoint(pos)[2], 3))
-        else:
-            pass
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 # Command
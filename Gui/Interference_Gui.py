@@ -0,0 +1,64 @@
+from PySide import QtCore, QtWidgets
+import os
+import FreeCAD
+import FreeCADGui
+
+from print_export_fun import get_print_objs, get_doc_print_objs
+from interference_fun import check_obj_interference
+
+__dir__ = os.path.dirname(__file__)
+
+
+class _Interference_Cmd:
+    """
+    Checks the interference between the parts of the selection, or of the
+    whole document if nothing is selected.
+    The interfering parts are selected and the common volumes are written
+    on the report view
+    """
+    def Activated(self):
+        selection = FreeCADGui.Selection.getSelection()
+        if len(selection) != 0:
+            obj_list = get_print_objs(selection)
+        else:
+            obj_list = get_doc_print_objs(FreeCAD.ActiveDocument)
+
+        interf_list = check_obj_interference(obj_list)
+
+        FreeCADGui.Selection.clearSelection()
+        for obj1, obj2, vol in interf_list:
+            FreeCAD.Console.PrintMessage(obj1.Name + " - " + obj2.Name
+                                         + ": " + str(round(vol, 3)) + " mm3\n")
+            FreeCADGui.Selection.addSelection(obj1)
+            FreeCADGui.Selection.addSelection(obj2)
+
+        message = QtWidgets.QMessageBox()
+        if len(interf_list) == 0:
+            message.setIcon(QtWidgets.QMessageBox.Icon.Information)
+            message.setText("No interferences between " + str(len(obj_list)) + " objects")
+        else:
+            message.setIcon(QtWidgets.QMessageBox.Icon.Warning)
+            message.setText(str(len(interf_list)) + " interferences found, see the report view")
+        message.setWindowTitle('Interference')
+        message.setStandardButtons(QtWidgets.QMessageBox.Ok)
+        message.setDefaultButton(QtWidgets.QMessageBox.Ok)
+        message.exec_()
+
+    def GetResources(self):
+        MenuText = QtCore.QT_TRANSLATE_NOOP(
+            'Interference',
+            'Interference')
+        ToolTip = QtCore.QT_TRANSLATE_NOOP(
+            '',
+            'Checks the interference between the selected objects, or all the document objects')
+        return {
+            'Pixmap': __dir__ + '/../Resources/icons/MakerWorkbench_Assembly_Cmd.svg',
+            'MenuText': MenuText,
+            'ToolTip': ToolTip}
+
+    def IsActive(self):
+        return not FreeCAD.ActiveDocument is None 
+
+
+# Command
+FreeCADGui.addCommand('Interference', _Interference_Cmd())
@@ -0,0 +1,54 @@
+from PySide import QtCore, QtWidgets
+import os
+import FreeCAD
+import FreeCADGui
+
+import shp_clss
+from fc_clss import rebuild_doc_lod
+
+__dir__ = os.path.dirname(__file__)
+
+# names of the levels of detail, in the order of shp_clss
+LOD_NAMES = {shp_clss.LOD_ENV: 'Envelope',
+             shp_clss.LOD_SIMPLE: 'Simplified',
+             shp_clss.LOD_FULL: 'Full'}
+
+
+class _Lod_Cmd:
+    """
+    Sets the level of detail of the active document: the parts that are
+    created afterwards, and the parts with level of detail that are already
+    in the document, that are built again
+    """
+    def Activated(self):
+        doc = FreeCAD.ActiveDocument
+        lod_list = sorted(LOD_NAMES)
+        name_list = [LOD_NAMES[lod] for lod in lod_list]
+        name, ok = QtWidgets.QInputDialog.getItem(
+                       None, 'Level of detail', 'Level of detail:', name_list,
+                       lod_list.index(shp_clss.get_lod(doc=doc)), False)
+        if not ok:
+            return
+        lod = lod_list[name_list.index(name)]
+        n_obj = rebuild_doc_lod(lod, doc)
+        FreeCAD.Console.PrintMessage("Level of detail: " + name + ", "
+                                     + str(n_obj) + " objects built again\n")
+
+    def GetResources(self):
+        MenuText = QtCore.QT_TRANSLATE_NOOP(
+            'Level of detail',
+            'Level of detail')
+        ToolTip = QtCore.QT_TRANSLATE_NOOP(
+            '',
+            'Sets the level of detail of the document and builds its parts again')
+        return {
+            'Pixmap': __dir__ + '/../Resources/icons/MakerWorkbench_Assembly_Cmd.svg',
+            'MenuText': MenuText,
+            'ToolTip': ToolTip}
+
+    def IsActive(self):
+        return not FreeCAD.ActiveDocument is None
+
+
+# Command
+FreeCADGui.addCommand('Level_Of_Detail', _Lod_Cmd())
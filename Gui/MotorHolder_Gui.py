@@ -6,7 +6,9 @@ import logging
 
 from parts_new import NemaMotorHolder
 from Gui.Advance_Placement_Gui import Advance_Placement_TaskPanel
-from Gui.function_Gui import set_place, ortonormal_axis
+from Gui.function_Gui import set_place, is_ortonormal, axis_message
+from Gui.tracker_Gui import add_tracking, remove_tracking
+from Gui.preview_Gui import Preview
 __dir__ = os.path.dirname(__file__)
 
 logging.basicConfig(level=logging.DEBUG)
@@ -237,64 +239,88 @@ class MotorHolder_Dialog:
         self.form = [self.MotorHolder.widget, self.Advance.widget]
     
         # Event to track the mouse 
-        self.track = self.v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(self.v, self.position)
+
+        # Preview of the holder while the values are changed
+        self.preview = Preview(self.v, self.get_params, 'parts_new',
+                               'NemaMotorHolder', self.build_call)
+        self.preview.connect([self.MotorHolder.widget])
+        self.preview.changed()
+
+    def get_params(self):
+        SizeHolder = {0: 8, 1: 11, 2: 14, 3: 17, 4: 23, 5: 34, 6: 42}
+        params = {
+            'size_motor': SizeHolder[self.MotorHolder.ComboBox_Size_Holder.currentIndex()],
+            'h_motor': self.MotorHolder.motor_high_Value.value(),
+            'thickness': self.MotorHolder.Thickness_Value.value(),
+            'pos': FreeCAD.Vector(self.MotorHolder.pos_x.value(),
+                                  self.MotorHolder.pos_y.value(),
+                                  self.MotorHolder.pos_z.value()),
+            'pos_h': self.MotorHolder.pos_h.currentIndex(),
+            'pos_d': self.MotorHolder.pos_d.currentIndex(),
+            'pos_w': self.MotorHolder.pos_w.currentIndex(),
+            'axis_d': FreeCAD.Vector(self.MotorHolder.axis_d_x.value(),
+                                     self.MotorHolder.axis_d_y.value(),
+                                     self.MotorHolder.axis_d_z.value()),
+            'axis_w': FreeCAD.Vector(self.MotorHolder.axis_w_x.value(),
+                                     self.MotorHolder.axis_w_y.value(),
+                                     self.MotorHolder.axis_w_z.value()),
+            'axis_h': FreeCAD.Vector(self.MotorHolder.axis_h_x.value(),
+                                     self.MotorHolder.axis_h_y.value(),
+                                     self.MotorHolder.axis_h_z.value())}
+        if is_ortonormal(params['axis_d'], params['axis_w'], params['axis_h']) is False:
+            return None
+        return params
+
+    def build_kwargs(self, params):
+        return dict(nema_size=params['size_motor'],
+                    wall_thick=params['thickness'],
+                    motorside_thick=params['thickness'],
+                    reinf_thick=params['thickness'],
+                    motor_min_h=0.,
+                    motor_max_h=params['h_motor'],
+                    rail=1,  # if there is a rail or not at the profile side
+                    motor_xtr_space=2.,  # counting on one side
+                    bolt_wall_d=4.,  # Metric of the wall bolts
+                    bolt_wall_sep=0.,  # optional   30
+                    chmf_r=1.,
+                    axis_h=params['axis_h'],
+                    axis_d=params['axis_d'],
+                    axis_w=params['axis_w'],
+                    pos_h=params['pos_h'],
+                    pos_d=params['pos_d'],
+                    pos_w=params['pos_w'],
+                    pos=params['pos'],
+                    model_type=3,
+                    name='nema_holder')
+
+    def build_call(self, params):
+        return (), self.build_kwargs(params)
+
+    def build(self, params):
+        NemaMotorHolder(**self.build_kwargs(params))
 
     def accept(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
                 FreeCAD.ActiveDocument.removeObject('Point_d_w_h')
 
-        SizeHolder = {0: 8, 1: 11, 2: 14, 3: 17, 4: 23, 5: 34, 6: 42}
-        self.size_motor = SizeHolder[self.MotorHolder.ComboBox_Size_Holder.currentIndex()]
-        h_motor = self.MotorHolder.motor_high_Value.value()
-        Thickness = self.MotorHolder.Thickness_Value.value()
-        pos = FreeCAD.Vector(self.MotorHolder.pos_x.value(),
-                             self.MotorHolder.pos_y.value(),
-                             self.MotorHolder.pos_z.value())
-        pos_h = self.MotorHolder.pos_h.currentIndex()
-        pos_d = self.MotorHolder.pos_d.currentIndex()
-        pos_w = self.MotorHolder.pos_w.currentIndex()
-        axis_d = FreeCAD.Vector(self.MotorHolder.axis_d_x.value(),
-                                self.MotorHolder.axis_d_y.value(),
-                                self.MotorHolder.axis_d_z.value())
-        axis_w = FreeCAD.Vector(self.MotorHolder.axis_w_x.value(),
-                                self.MotorHolder.axis_w_y.value(),
-                                self.MotorHolder.axis_w_z.value())
-        axis_h = FreeCAD.Vector(self.MotorHolder.axis_h_x.value(),
-                                self.MotorHolder.axis_h_y.value(),
-                                self.MotorHolder.axis_h_z.value())
-
-        if ortonormal_axis(axis_d, axis_w, axis_h) is True:
-
-            NemaMotorHolder(nema_size=self.size_motor,
-                            wall_thick=Thickness,
-                            motorside_thick=Thickness,
-                            reinf_thick=Thickness,
-                            motor_min_h=0.,
-                            motor_max_h=h_motor,
-                            rail=1,  # if there is a rail or not at the profile side
-                            motor_xtr_space=2.,  # counting on one side
-                            bolt_wall_d=4.,  # Metric of the wall bolts
-                            bolt_wall_sep=0.,  # optional   30
-                            chmf_r=1.,
-                            axis_h=axis_h,
-                            axis_d=axis_d,
-                            axis_w=axis_w,
-                            pos_h=pos_h,
-                            pos_d=pos_d,
-                            pos_w=pos_w,
-                            pos=pos,
-                            model_type=3,
-                            name='nema_holder')
+        params = self.get_params()
+        if params is None:
+            axis_message()
+        else:
+            self.build(params)
 
             FreeCADGui.activeDocument().activeView().viewAxonometric()
             FreeCADGui.Control.closeDialog()  # close the dialog
             FreeCADGui.SendMsgToActiveView("ViewFit")
     
     def reject(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -303,38 +329,18 @@ class MotorHolder_Dialog:
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement is True:
-            set_place(self.MotorHolder,
-                      round(self.v.getPoint(pos)[0], 3),
-                      round(self.v.getPoint(pos)[1], 3),
-                      round(self.v.getPoint(pos)[2], 3))
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        else:
-            pass
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self.MotorHolder, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
                 set_place(self.MotorHolder, pos.x, pos.y, pos.z)
-            except Exception:
-                None
 
 
 # Command
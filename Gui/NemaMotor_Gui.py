@@ -6,7 +6,9 @@ import logging
 
 from partset_new import NemaMotorPulleySet
 from Gui.Advance_Placement_Gui import Advance_Placement_TaskPanel
-from Gui.function_Gui import set_place, ortonormal_axis
+from Gui.function_Gui import set_place, is_ortonormal, axis_message
+from Gui.tracker_Gui import add_tracking, remove_tracking
+from Gui.preview_Gui import Preview
 
 __dir__ = os.path.dirname(__file__)
 
@@ -331,85 +333,110 @@ class NemaMotor_Dialog:
         self.form = [self.NemaMotor.widget, self.Advance.widget]
     
         # Event to track the mouse 
-        self.track = self.v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(self.v, self.position)
+
+        # Preview of the motor while the values are changed
+        self.preview = Preview(self.v, self.get_params, 'partset_new',
+                               'NemaMotorPulleySet', self.build_call)
+        self.preview.connect([self.NemaMotor.widget])
+        self.preview.changed()
+
+    def get_params(self):
+        dict_size = {0: 8, 1: 11, 2: 14, 3: 17, 4: 23, 5: 34, 6: 42}
+        positions_d = [0, 1, 2, 3, 4]
+        positions_w = [0, 1, 2, 3, 4]
+        positions_h = [0, 1, 2, 3, 4, 5]
+        params = {
+            'size': dict_size[self.NemaMotor.Size.currentIndex()],
+            'base_h': self.NemaMotor.Height.value(),
+            'shaft_l': self.NemaMotor.shaft_h.value(),
+            'shaft_r': self.NemaMotor.shaft_r.value(),
+            'shaft_br': self.NemaMotor.shaft_br.value(),
+            'shaft_hr': self.NemaMotor.shaft_bh.value(),
+            'chmf_r': self.NemaMotor.chmf_r.value(),
+            'bolt_d': self.NemaMotor.bolt_d.value(),
+            'pitch': self.NemaMotor.pulley_pitch.value(),
+            'teeth': self.NemaMotor.pulley_teeth.value(),
+            'top_flan': self.NemaMotor.pulley_top_flan.value(),
+            'bot_flan': self.NemaMotor.pulley_bot_flan.value(),
+            'pos_d': positions_d[self.NemaMotor.pos_d.currentIndex()],
+            'pos_w': positions_w[self.NemaMotor.pos_w.currentIndex()],
+            'pos_h': positions_h[self.NemaMotor.pos_h.currentIndex()],
+            'pos': FreeCAD.Vector(self.NemaMotor.pos_x.value(),
+                                  self.NemaMotor.pos_y.value(),
+                                  self.NemaMotor.pos_z.value()),
+            'axis_d': FreeCAD.Vector(self.NemaMotor.axis_d_x.value(),
+                                     self.NemaMotor.axis_d_y.value(),
+                                     self.NemaMotor.axis_d_z.value()),
+            'axis_w': FreeCAD.Vector(self.NemaMotor.axis_w_x.value(),
+                                     self.NemaMotor.axis_w_y.value(),
+                                     self.NemaMotor.axis_w_z.value()),
+            'axis_h': FreeCAD.Vector(self.NemaMotor.axis_h_x.value(),
+                                     self.NemaMotor.axis_h_y.value(),
+                                     self.NemaMotor.axis_h_z.value())}
+        if is_ortonormal(params['axis_d'], params['axis_w'], params['axis_h']) is False:
+            return None
+        return params
+
+    def build_kwargs(self, params):
+        return dict(nema_size=params['size'],
+                    base_l=params['base_h'],
+                    shaft_l=params['shaft_l'],
+                    shaft_r=params['shaft_r'],
+                    circle_r=params['shaft_br'],
+                    circle_h=params['shaft_hr'],
+                    chmf_r=params['chmf_r'],
+                    rear_shaft_l=0,
+                    bolt_depth=params['bolt_d'],
+                    # pulley parameters
+                    pulley_pitch=params['pitch'],
+                    pulley_n_teeth=params['teeth'],
+                    pulley_toothed_h=7.5,
+                    pulley_top_flange_h=params['top_flan'],
+                    pulley_bot_flange_h=params['bot_flan'],
+                    pulley_tot_h=16.,
+                    pulley_flange_d=15.,
+                    pulley_base_d=15.,
+                    pulley_tol=0,
+                    pulley_pos_h=-1,
+                    # general parameters
+                    axis_d=params['axis_d'],
+                    axis_w=params['axis_w'],  # None
+                    axis_h=params['axis_h'],
+                    pos_d=params['pos_d'],
+                    pos_w=params['pos_w'],
+                    pos_h=params['pos_h'],
+                    pos=params['pos'],
+                    group=1,
+                    name=None)
+
+    def build_call(self, params):
+        return (), self.build_kwargs(params)
+
+    def build(self, params):
+        NemaMotorPulleySet(**self.build_kwargs(params))
 
     def accept(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
                 FreeCAD.ActiveDocument.removeObject('Point_d_w_h')
 
-        dict_size = {0: 8, 1: 11, 2: 14, 3: 17, 5: 23, 6: 34, 7: 42}
-        size = dict_size[self.NemaMotor.Size.currentIndex()]
-        base_h = self.NemaMotor.Height.value()
-        shaft_l = self.NemaMotor.shaft_h.value()
-        shaft_r = self.NemaMotor.shaft_r.value()
-        shaft_br = self.NemaMotor.shaft_br.value()
-        shaft_hr = self.NemaMotor.shaft_bh.value()
-        chmf_r = self.NemaMotor.chmf_r.value()
-        bolt_d = self.NemaMotor.bolt_d.value()
-        pitch = self.NemaMotor.pulley_pitch.value()
-        teeth = self.NemaMotor.pulley_teeth.value()
-        top_flan = self.NemaMotor.pulley_top_flan.value()
-        bot_flan = self.NemaMotor.pulley_bot_flan.value()
-        positions_d = [0, 1, 2, 3, 4]
-        positions_w = [0, 1, 2, 3, 4]
-        positions_h = [0, 1, 2, 3, 4, 5]
-        pos_d = positions_d[self.NemaMotor.pos_d.currentIndex()]
-        pos_w = positions_w[self.NemaMotor.pos_w.currentIndex()]
-        pos_h = positions_h[self.NemaMotor.pos_h.currentIndex()]
-        pos = FreeCAD.Vector(self.NemaMotor.pos_x.value(),
-                             self.NemaMotor.pos_y.value(),
-                             self.NemaMotor.pos_z.value())
-        axis_d = FreeCAD.Vector(self.NemaMotor.axis_d_x.value(),
-                                self.NemaMotor.axis_d_y.value(),
-                                self.NemaMotor.axis_d_z.value())
-        axis_w = FreeCAD.Vector(self.NemaMotor.axis_w_x.value(),
-                                self.NemaMotor.axis_w_y.value(),
-                                self.NemaMotor.axis_w_z.value())
-        axis_h = FreeCAD.Vector(self.NemaMotor.axis_h_x.value(),
-                                self.NemaMotor.axis_h_y.value(),
-                                self.NemaMotor.axis_h_z.value())
-        
-        if ortonormal_axis(axis_d, axis_w, axis_h) is True:
-            NemaMotorPulleySet(nema_size=size,
-                               base_l=base_h,
-                               shaft_l=shaft_l,
-                               shaft_r=shaft_r,
-                               circle_r=shaft_br,
-                               circle_h=shaft_hr,
-                               chmf_r=chmf_r,
-                               rear_shaft_l=0,
-                               bolt_depth=bolt_d,
-                               # pulley parameters
-                               pulley_pitch=pitch,
-                               pulley_n_teeth=teeth,
-                               pulley_toothed_h=7.5,
-                               pulley_top_flange_h=top_flan,
-                               pulley_bot_flange_h=bot_flan,
-                               pulley_tot_h=16.,
-                               pulley_flange_d=15.,
-                               pulley_base_d=15.,
-                               pulley_tol=0,
-                               pulley_pos_h=-1,
-                               # general parameters
-                               axis_d=axis_d,
-                               axis_w=axis_w,  # None
-                               axis_h=axis_h,
-                               pos_d=pos_d,
-                               pos_w=pos_w,
-                               pos_h=pos_h,
-                               pos=pos,
-                               group=1,
-                               name=None)
+        params = self.get_params()
+        if params is None:
+            axis_message()
+        else:
+            self.build(params)
 
             FreeCADGui.activeDocument().activeView().viewAxonometric()
             FreeCADGui.Control.closeDialog()  # close the dialog
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -418,37 +445,18 @@ class NemaMotor_Dialog:
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
+        if info["Down"] is True:
+            self.placement = not self.placement
+
         if self.placement is True:
-            set_place(self.NemaMotor,
-                      round(self.v.getPoint(pos)[0], 3),
-                      round(self.v.getPoint(pos)[1], 3),
-                      round(self.v.getPoint(pos)[2], 3))
-        else:
-            pass
+            pos = info["Point"]
+            set_place(self.NemaMotor, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
                 set_place(self.NemaMotor, pos.x, pos.y, pos.z)
-            except Exception:
-                None
 
 
 # command
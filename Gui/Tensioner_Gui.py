@@ -6,7 +6,10 @@ import logging
 
 from tensioner_clss_new import TensionerSet
 from Gui.Advance_Placement_Gui import Advance_Placement_TaskPanel
-from Gui.function_Gui import set_place, ortonormal_axis
+from Gui.function_Gui import set_place, is_ortonormal, axis_message
+from Gui.tracker_Gui import add_tracking, remove_tracking
+from Gui.preview_Gui import Preview
+from Gui.build_Gui import BuildExecutor, view_fit
 
 import kcomp
 
@@ -262,70 +265,92 @@ class Tensioner_Dialog:
         self.form = [self.Tensioner.widget, self.Advance.widget]
     
         # Event to track the mouse 
-        self.track = self.v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(self.v, self.position)
 
-    def accept(self):
-        self.v.removeEventCallback("SoEvent", self.track)
-
-        for obj in FreeCAD.ActiveDocument.Objects:
-            if 'Point_d_w_h' == obj.Name:
-                FreeCAD.ActiveDocument.removeObject('Point_d_w_h')
+        # Preview of the tensioner while the values are changed
+        self.preview = Preview(self.v, self.get_params, 'tensioner_clss_new',
+                               'TensionerSet', self.build_call)
+        self.preview.connect([self.Tensioner.widget])
+        self.preview.changed()
 
+    def get_params(self):
         IndexNut = {0: 3, 1: 4, 2: 5, 3: 6}
         IndexBase = {0: 10, 1: 15, 2: 20, 3: 30, 4: 40}
-        tensioner_belt_h = self.Tensioner.belt_h_Value.value()
-        nut_hole = IndexNut[self.Tensioner.ComboBox_Nut_Hole.currentIndex()]
-        tens_stroke = self.Tensioner.tens_stroke_Value.value()
-        base_w = IndexBase[self.Tensioner.ComboBox_base_w.currentIndex()]
-        wall_thick = self.Tensioner.wall_th_Value.value()
-        pos = FreeCAD.Vector(self.Tensioner.pos_x.value(), self.Tensioner.pos_y.value(), self.Tensioner.pos_z.value())
         positions_d = [0, 1, 2, 3, 4, 5, 6]
         positions_w = [0, 1, 2]
         positions_h = [0, 1, 2]
-        pos_d = positions_d[self.Tensioner.pos_d.currentIndex()]
-        pos_w = positions_w[self.Tensioner.pos_w.currentIndex()]
-        pos_h = positions_h[self.Tensioner.pos_h.currentIndex()]
-        axis_d = FreeCAD.Vector(self.Tensioner.axis_d_x.value(),
-                                self.Tensioner.axis_d_y.value(),
-                                self.Tensioner.axis_d_z.value())
-        axis_w = FreeCAD.Vector(self.Tensioner.axis_w_x.value(),
-                                self.Tensioner.axis_w_y.value(),
-                                self.Tensioner.axis_w_z.value())
-        axis_h = FreeCAD.Vector(self.Tensioner.axis_h_x.value(),
-                                self.Tensioner.axis_h_y.value(),
-                                self.Tensioner.axis_h_z.value())
-        
-        if ortonormal_axis(axis_d, axis_w, axis_h) is True:
-            TensionerSet(aluprof_w=base_w,  # 20.,
-                         belt_pos_h=tensioner_belt_h,
-                         hold_bas_h=0,
-                         hold_hole_2sides=1,
-                         boltidler_mtr=3,
-                         bolttens_mtr=nut_hole,   # métrica del tensor
-                         boltaluprof_mtr=nut_hole,
-                         tens_stroke=tens_stroke,
-                         wall_thick=wall_thick,
-                         in_fillet=2.,
-                         pulley_stroke_dist=0,
-                         nut_holder_thick=nut_hole,
-                         opt_tens_chmf=0,
-                         min_width=0,
-                         tol=kcomp.TOL,
-                         axis_d=axis_d,  # VY.negative(),
-                         axis_w=axis_w,  # VX.negative(),
-                         axis_h=axis_h,  # VZ,
-                         pos_d=pos_d,
-                         pos_w=pos_w,
-                         pos_h=pos_h,
-                         pos=pos,
-                         name='tensioner_set')
-
-            FreeCADGui.activeDocument().activeView().viewAxonometric()
-            FreeCADGui.SendMsgToActiveView("ViewFit")
+        params = {
+            'belt_h': self.Tensioner.belt_h_Value.value(),
+            'nut_hole': IndexNut[self.Tensioner.ComboBox_Nut_Hole.currentIndex()],
+            'tens_stroke': self.Tensioner.tens_stroke_Value.value(),
+            'base_w': IndexBase[self.Tensioner.ComboBox_base_w.currentIndex()],
+            'wall_thick': self.Tensioner.wall_th_Value.value(),
+            'pos': FreeCAD.Vector(self.Tensioner.pos_x.value(), self.Tensioner.pos_y.value(), self.Tensioner.pos_z.value()),
+            'pos_d': positions_d[self.Tensioner.pos_d.currentIndex()],
+            'pos_w': positions_w[self.Tensioner.pos_w.currentIndex()],
+            'pos_h': positions_h[self.Tensioner.pos_h.currentIndex()],
+            'axis_d': FreeCAD.Vector(self.Tensioner.axis_d_x.value(),
+                                     self.Tensioner.axis_d_y.value(),
+                                     self.Tensioner.axis_d_z.value()),
+            'axis_w': FreeCAD.Vector(self.Tensioner.axis_w_x.value(),
+                                     self.Tensioner.axis_w_y.value(),
+                                     self.Tensioner.axis_w_z.value()),
+            'axis_h': FreeCAD.Vector(self.Tensioner.axis_h_x.value(),
+                                     self.Tensioner.axis_h_y.value(),
+                                     self.Tensioner.axis_h_z.value())}
+        if is_ortonormal(params['axis_d'], params['axis_w'], params['axis_h']) is False:
+            return None
+        return params
+
+    def build_kwargs(self, params):
+        return dict(aluprof_w=params['base_w'],  # 20.,
+                    belt_pos_h=params['belt_h'],
+                    hold_bas_h=0,
+                    hold_hole_2sides=1,
+                    boltidler_mtr=3,
+                    bolttens_mtr=params['nut_hole'],   # métrica del tensor
+                    boltaluprof_mtr=params['nut_hole'],
+                    tens_stroke=params['tens_stroke'],
+                    wall_thick=params['wall_thick'],
+                    in_fillet=2.,
+                    pulley_stroke_dist=0,
+                    nut_holder_thick=params['nut_hole'],
+                    opt_tens_chmf=0,
+                    min_width=0,
+                    tol=kcomp.TOL,
+                    axis_d=params['axis_d'],  # VY.negative(),
+                    axis_w=params['axis_w'],  # VX.negative(),
+                    axis_h=params['axis_h'],  # VZ,
+                    pos_d=params['pos_d'],
+                    pos_w=params['pos_w'],
+                    pos_h=params['pos_h'],
+                    pos=params['pos'],
+                    name='tensioner_set')
+
+    def build_call(self, params):
+        return (), self.build_kwargs(params)
+
+    def accept(self):
+        remove_tracking(self.track)
+        self.preview.close()
+
+        for obj in FreeCAD.ActiveDocument.Objects:
+            if 'Point_d_w_h' == obj.Name:
+                FreeCAD.ActiveDocument.removeObject('Point_d_w_h')
+
+        params = self.get_params()
+        if params is None:
+            axis_message()
+        else:
             FreeCADGui.Control.closeDialog()  # close the dialog
+            # the set is built without blocking the GUI
+            BuildExecutor('Tensioner', 'tensioner_clss_new', 'TensionerSet',
+                          kwargs=self.build_kwargs(params),
+                          on_done=view_fit).start()
     
     def reject(self):
-        self.v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
+        self.preview.close()
 
         for obj in FreeCAD.ActiveDocument.Objects:
             if 'Point_d_w_h' == obj.Name:
@@ -334,37 +359,18 @@ class Tensioner_Dialog:
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
+        if info["Down"] is True:
+            self.placement = not self.placement
+
         if self.placement is True:
-            set_place(self.Tensioner,
-                      round(self.v.getPoint(pos)[0], 3),
-                      round(self.v.getPoint(pos)[1], 3),
-                      round(self.v.getPoint(pos)[2], 3))
-        else:
-            pass
+            pos = info["Point"]
+            set_place(self.Tensioner, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
                 set_place(self.Tensioner, pos.x, pos.y, pos.z)
-            except Exception:
-                None
 
 
 # Command
@@ -0,0 +1,322 @@
+from PySide import QtCore, QtWidgets
+import os
+import shutil
+import tempfile
+import FreeCAD
+import FreeCADGui
+import logging
+
+import build_worker
+import fcfun
+from fcfun import pathOfModule
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+#  _________________________________________________________________
+# |                                                                 |
+# |                          Build Executor                         |
+# |_________________________________________________________________|
+#
+# Builds the objects of a function or class of the workbench without
+# blocking the GUI, with a progress dialog that can cancel the build.
+#   - The build is run in a FreeCADCmd process (build_worker.py), because
+#     the documents and OCC are not thread safe. Cancel kills the process.
+#     When it finishes, its document is opened hidden and its objects are
+#     copied to the active document in one transaction (one undo)
+#   - If FreeCADCmd is not found, or the build fails there (e.g. the class
+#     uses the ViewObject), the error is shown and the user is asked to
+#     build it here, in a hidden document. The resulting objects are copied
+#     to the active document in one transaction. This build blocks FreeCAD:
+#     the GUI is updated for each new object, but cancel cannot stop it,
+#     it only discards the result
+# The view properties are not copied (and FreeCADCmd has no view objects),
+# so the colors are stored in the property build_worker.COLOR_PROP of the
+# objects during the build, and set on the copies
+#
+# module_name, fun_name: module and function (or class) to build, they have
+#                        to be importable without the GUI
+# args, kwargs: arguments of the function. FreeCAD.Vector are supported
+# on_done: function called after the objects are added to the document
+
+_running = []  # executors in progress, to keep their reference
+
+
+class _LocalObserver:
+    """ Document observer of the local build: shows the progress and
+    keeps the GUI alive
+    """
+
+    def __init__(self, executor, doc):
+        self.executor = executor
+        self.doc = doc
+
+    def slotCreatedObject(self, obj):
+        if obj.Document == self.doc:
+            self.executor.progress_obj(obj.Name)
+            QtWidgets.QApplication.processEvents()
+
+
+class BuildExecutor(QtCore.QObject):
+    def __init__(self, label, module_name, fun_name, args=(), kwargs=None,
+                 on_done=None):
+        QtCore.QObject.__init__(self)
+        self.label = label
+        self.module_name = module_name
+        self.fun_name = fun_name
+        self.args = list(args)
+        self.kwargs = dict(kwargs or {})
+        self.on_done = on_done
+        self.doc = FreeCAD.ActiveDocument
+        self.n_obj = 0
+        self.cancelled = False
+        self.process = None
+        self.tmp_dir = None
+        self.buffer = ''
+        self.error = None
+
+        self.dialog = QtWidgets.QProgressDialog(label, 'Cancel', 0, 0,
+                                                FreeCADGui.getMainWindow())
+        self.dialog.setWindowTitle('Building ' + label)
+        self.dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self.dialog.setMinimumDuration(0)
+        self.dialog.canceled.connect(self.cancel)
+
+    def start(self):
+        _running.append(self)
+        self.dialog.show()
+        exe_path = build_worker.find_freecadcmd()
+        if exe_path is None:
+            self.ask_local('FreeCADCmd has not been found.')
+            return
+        self.tmp_dir = tempfile.mkdtemp(prefix='maker_build_')
+        job_file = os.path.join(self.tmp_dir, 'job.json')
+        build_worker.write_job(job_file, pathOfModule(), self.module_name,
+                               self.fun_name, self.args, self.kwargs,
+                               os.path.join(self.tmp_dir, 'build.FCStd'))
+        env = QtCore.QProcessEnvironment.systemEnvironment()
+        env.insert(build_worker.ENV_JOB, job_file)
+        self.process = QtCore.QProcess(self)
+        self.process.setProcessEnvironment(env)
+        self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self.read_output)
+        self.process.finished.connect(self.process_finished)
+        self.progress_stage('start')
+        self.process.start(exe_path, [build_worker.__file__])
+
+    def read_output(self):
+        self.buffer += bytes(self.process.readAllStandardOutput()).decode(
+                                                      'utf-8', 'replace')
+        *line_list, self.buffer = self.buffer.split('\n')
+        for line in line_list:
+            if line.startswith('STAGE '):
+                self.progress_stage(line[6:])
+            elif line.startswith('OBJECT '):
+                self.progress_obj(line.split(' ', 2)[-1])
+            elif line.startswith('ERROR '):
+                self.error = line[6:]
+                logger.error(self.label + ': ' + self.error)
+
+    def progress_stage(self, stage):
+        self.dialog.setLabelText(self.label + ': ' + stage + '\n'
+                                 + str(self.n_obj) + ' objects')
+
+    def progress_obj(self, obj_name):
+        self.n_obj += 1
+        self.dialog.setLabelText(self.label + ': build\n'
+                                 + str(self.n_obj) + ' objects (' + obj_name
+                                 + ')')
+
+    def process_finished(self, exit_code, exit_status=None):
+        if self.cancelled:
+            self.finish()
+            return
+        out_file = os.path.join(self.tmp_dir, 'build.FCStd')
+        if exit_code != 0 or not os.path.isfile(out_file):
+            self.ask_local('The build in FreeCADCmd has failed:\n'
+                           + (self.error or 'exit code ' + str(exit_code)))
+            return
+        self.progress_stage('insert')
+        build_doc = FreeCAD.openDocument(out_file, True)
+        try:
+            self.insert_doc(build_doc)
+        finally:
+            FreeCAD.closeDocument(build_doc.Name)
+            FreeCAD.setActiveDocument(self.doc.Name)
+        self.finish(done=True)
+
+    def insert_doc(self, build_doc):
+        """ Copies the objects of the build document to the document in
+        one transaction (one undo), and sets the colors of the build
+        """
+        obj_list = [obj for obj in build_doc.Objects if not obj.InList]
+        name_set = set(obj.Name for obj in self.doc.Objects)
+        self.doc.openTransaction(self.label)
+        self.doc.copyObject(obj_list, True)
+        for obj in self.doc.Objects:
+            color = getattr(obj, build_worker.COLOR_PROP, None)
+            if obj.Name not in name_set and color is not None:
+                obj.removeProperty(build_worker.COLOR_PROP)
+                fcfun.set_fco_color(obj, color)
+        self.doc.commitTransaction()
+        self.doc.recompute()
+
+    def ask_local(self, text):
+        """ Shows why the build cannot be made in FreeCADCmd, and asks
+        the user to build it in this process (build_local)
+        """
+        answer = QtWidgets.QMessageBox.question(
+                     FreeCADGui.getMainWindow(), 'Building ' + self.label,
+                     text + '\n\nBuild it in FreeCAD? FreeCAD will be '
+                     'blocked until the build ends, and it cannot be '
+                     'cancelled.',
+                     QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                     QtWidgets.QMessageBox.No)
+        if answer == QtWidgets.QMessageBox.Yes:
+            self.n_obj = 0
+            self.build_local()
+        else:
+            self.finish()
+
+    def build_local(self):
+        build_fun = getattr(__import__(self.module_name,
+                                       fromlist=[self.fun_name]),
+                            self.fun_name)
+        build_doc = FreeCAD.newDocument(name='build', hidden=True, temp=True)
+        observer = _LocalObserver(self, build_doc)
+        FreeCAD.addDocumentObserver(observer)
+        try:
+            FreeCAD.setActiveDocument(build_doc.Name)
+            self.progress_stage('build')
+            # one recompute at the end of the build. The undo is made
+            # when the objects are copied to the document (insert_doc)
+            with fcfun.bulk_insert(self.label, build_doc,
+                                   color_prop=build_worker.COLOR_PROP,
+                                   transaction=0):
+                build_fun(*self.args, **self.kwargs)
+                self.progress_stage('recompute')
+            if not self.cancelled:
+                self.progress_stage('insert')
+                self.insert_doc(build_doc)
+        except Exception as err:
+            logger.error(self.label + ': ' + str(err))
+            QtWidgets.QMessageBox.critical(FreeCADGui.getMainWindow(),
+                                           'Building ' + self.label,
+                                           'The build has failed:\n'
+                                           + str(err))
+            self.cancelled = True
+        finally:
+            FreeCAD.removeDocumentObserver(observer)
+            FreeCAD.closeDocument(build_doc.Name)
+            FreeCAD.setActiveDocument(self.doc.Name)
+        self.finish(done=not self.cancelled)
+
+    def cancel(self):
+        self.cancelled = True
+        if (self.process is not None
+                and self.process.state() != QtCore.QProcess.NotRunning):
+            self.process.kill()  # process_finished is called
+
+    def finish(self, done=False):
+        self.dialog.reset()
+        self.dialog.hide()
+        if self.tmp_dir is not None:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+            self.tmp_dir = None
+        if self in _running:
+            _running.remove(self)
+        if done and self.on_done is not None:
+            self.on_done()
+
+
+class CallExecutor(QtCore.QObject):
+    """ Runs calls of a function of the workbench in a FreeCADCmd process
+    (a job of calls of build_worker), without blocking the GUI and without
+    progress dialog. When the process finishes, on_done is called with the
+    list of results, or on_error with the error message.
+    After kill, none of them is called.
+    The temporary folder (tmp_dir) is removed after on_done, so the
+    files written there by the calls have to be read in on_done
+
+    Parameters
+    ----------
+    module_name, fun_name : str
+        Module and function, see build_worker.run_calls
+    call_list : list of tuples (args, kwargs)
+        Arguments of each call
+    on_done : function
+        Called with the list of results
+    on_error : function
+        Called with the error message
+    """
+
+    def __init__(self, module_name, fun_name, call_list, on_done,
+                 on_error=None):
+        QtCore.QObject.__init__(self)
+        self.module_name = module_name
+        self.fun_name = fun_name
+        self.call_list = list(call_list)
+        self.on_done = on_done
+        self.on_error = on_error
+        self.killed = False
+        self.process = None
+        self.tmp_dir = tempfile.mkdtemp(prefix='maker_call_')
+
+    def start(self):
+        """ Starts the process. Returns False if FreeCADCmd is not found
+        """
+        exe_path = build_worker.find_freecadcmd()
+        if exe_path is None:
+            self.finish()
+            return False
+        job_file = os.path.join(self.tmp_dir, 'job.json')
+        build_worker.write_calls_job(job_file, self.module_name,
+                                     self.fun_name, self.call_list,
+                                     os.path.join(self.tmp_dir, 'out.json'),
+                                     self.tmp_dir, {})
+        env = QtCore.QProcessEnvironment.systemEnvironment()
+        env.insert(build_worker.ENV_JOB, job_file)
+        self.process = QtCore.QProcess(self)
+        self.process.setProcessEnvironment(env)
+        self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.process.finished.connect(self.process_finished)
+        _running.append(self)
+        self.process.start(exe_path, [build_worker.__file__])
+        return True
+
+    def process_finished(self, exit_code, exit_status=None):
+        output = bytes(self.process.readAll()).decode('utf-8', 'replace')
+        out_file = os.path.join(self.tmp_dir, 'out.json')
+        try:
+            if self.killed:
+                return
+            if exit_code != 0 or not os.path.isfile(out_file):
+                error = (build_worker.read_error(output)
+                         or 'exit code ' + str(exit_code))
+                if self.on_error is not None:
+                    self.on_error(error)
+                return
+            self.on_done(build_worker.read_calls_out(out_file))
+        finally:
+            self.finish()
+
+    def kill(self):
+        self.killed = True
+        if (self.process is not None
+                and self.process.state() != QtCore.QProcess.NotRunning):
+            self.process.kill()  # process_finished is called
+        else:
+            self.finish()
+
+    def finish(self):
+        if self.tmp_dir is not None:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+            self.tmp_dir = None
+        if self in _running:
+            _running.remove(self)
+
+
+def view_fit():
+    """ on_done function of the build commands """
+    FreeCADGui.activeDocument().activeView().viewAxonometric()
+    FreeCADGui.SendMsgToActiveView("ViewFit")
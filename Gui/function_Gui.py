@@ -13,8 +13,16 @@ def set_place(self, x, y, z):
 # |_________________________________________________________________|
 
 
-def ortonormal_axis(axis_1, axis_2, axis_3):
+def is_ortonormal(axis_1, axis_2, axis_3):
+    """ Same as ortonormal_axis, without the message """
     if (fc_isperp(axis_1, axis_2) == 0) or (fc_isperp(axis_2, axis_3) == 0) or (fc_isperp(axis_1, axis_3) == 0):
+        return False
+    else:
+        return True
+
+
+def ortonormal_axis(axis_1, axis_2, axis_3):
+    if is_ortonormal(axis_1, axis_2, axis_3) is False:
         axis_message()
         return False
     else:
@@ -0,0 +1,225 @@
+from PySide import QtCore, QtWidgets
+import os
+import collections
+import logging
+import FreeCAD
+import Part
+from pivy import coin
+
+import shp_clss
+from Gui.build_Gui import CallExecutor
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+#  _________________________________________________________________
+# |                                                                 |
+# |                            Preview                              |
+# |_________________________________________________________________|
+#
+# Live preview of the object of a task panel, shown in the 3D view
+# (it is not added to the document).
+# The shapes are built in FreeCADCmd processes (build_worker), so the
+# panel is not blocked. On every change of the panel values:
+#   - if the object has already been built with the same values (except
+#     the position), the Coin node of the built shape is moved to the new
+#     position with a transform, the shape is not converted again
+#   - if not, a proxy is built at once: the object with the envelope level
+#     of detail (shp_clss.LOD_ENV), that has the right size and is faster
+#     to build. The full shape is built when the values (not the
+#     position) have no changes during PREVIEW_DELAY ms.
+#     Nothing is shown until the proxy of the values is built
+# The builds of values that have changed are killed.
+# The signals of the widgets that arrive together (e.g. the 3 spin boxes
+# of the position set by the tracker) are handled once.
+# The Coin nodes of the last PREVIEW_CACHE builds are kept.
+# If FreeCADCmd is not found, there is no preview
+#
+# get_params: function of the panel that returns a dictionary with the
+#             values of the panel (key 'pos' for the position), or None
+#             if the values are not valid
+# module_name, fun_name: module and function (or class) that builds the
+#                        object, importable without the GUI
+# build_call: function of the panel that returns the arguments of the
+#             build function from the dictionary: tuple (args, kwargs)
+
+# Time without changes to build the full preview (ms)
+PREVIEW_DELAY = 600
+
+# Number of built shapes whose Coin nodes are kept
+PREVIEW_CACHE = 16
+
+# Colors of the preview (r, g, b) and transparency
+PROXY_COLOR = (1.0, 0.5, 0.0)
+FULL_COLOR = (0.2, 0.6, 1.0)
+PREVIEW_TRANSP = 0.5
+
+
+class Preview:
+    def __init__(self, view, get_params, module_name, fun_name, build_call):
+        self.v = view
+        self.get_params = get_params
+        self.module_name = module_name
+        self.fun_name = fun_name
+        self.build_call = build_call
+        # root node: transform, material and the node of the shown shape
+        self.node = None
+        self.transform = None
+        self.material = None
+        self.shp_node = None
+        # Coin nodes of the built shapes and the position they were built
+        # key: (values key, lod), the last used at the end
+        self.shp_dict = collections.OrderedDict()
+        # builds in progress, key: (values key, lod)
+        self.executor_dict = {}
+        # key of the values waiting for the full build
+        self.pending_key = None
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(PREVIEW_DELAY)
+        self.timer.timeout.connect(self.build_full)
+        # the signals of the same event loop iteration are handled once
+        self.update_timer = QtCore.QTimer()
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(0)
+        self.update_timer.timeout.connect(self.update)
+
+    def connect(self, widget_list):
+        for widget in widget_list:
+            for spin in (widget.findChildren(QtWidgets.QDoubleSpinBox)
+                         + widget.findChildren(QtWidgets.QSpinBox)):
+                spin.valueChanged.connect(self.changed)
+            for combo in widget.findChildren(QtWidgets.QComboBox):
+                combo.currentIndexChanged.connect(self.changed)
+            for check in widget.findChildren(QtWidgets.QCheckBox):
+                check.stateChanged.connect(self.changed)
+
+    def changed(self, *args):
+        self.update_timer.start()
+
+    def update(self):
+        params = self.get_params()
+        if params is None:
+            self.timer.stop()
+            self.set_pending(None)
+            self.show(None)
+            return
+        key = params_key(params)
+        full_key = (key, shp_clss.LOD_FULL)
+        proxy_key = (key, shp_clss.LOD_ENV)
+        if full_key in self.shp_dict:
+            self.timer.stop()
+            self.set_pending(None)
+            self.show_built(full_key, params['pos'], FULL_COLOR)
+            return
+        if proxy_key in self.shp_dict:
+            self.show_built(proxy_key, params['pos'], PROXY_COLOR)
+        else:
+            self.show(None)
+        # a change of the position only does not restart the wait.
+        # If the build of these values failed, it is not tried again
+        if key != self.pending_key:
+            self.set_pending(key)
+            if proxy_key not in self.shp_dict:
+                self.start_build(params, shp_clss.LOD_ENV)
+            self.timer.start()
+
+    def set_pending(self, key):
+        """ Sets the key of the values waiting to be built, and kills the
+        builds of other values
+        """
+        self.pending_key = key
+        for build_key in list(self.executor_dict):
+            if build_key[0] != key:
+                self.executor_dict.pop(build_key).kill()
+
+    def build_full(self):
+        params = self.get_params()
+        if params is None:
+            return
+        self.start_build(params, shp_clss.LOD_FULL)
+
+    def start_build(self, params, lod):
+        """ Starts the build of the values in a FreeCADCmd process """
+        build_key = (params_key(params), lod)
+        if build_key in self.executor_dict:
+            return
+        pos = params['pos']
+        args, kwargs = self.build_call(params)
+
+        def on_done(result_list):
+            self.executor_dict.pop(build_key, None)
+            shp = Part.read(result_list[0])
+            os.remove(result_list[0])
+            if shp.isNull():
+                return
+            self.shp_dict[build_key] = (shp_node(shp), pos)
+            while len(self.shp_dict) > PREVIEW_CACHE:
+                self.shp_dict.popitem(last=False)
+            self.update()
+
+        def on_error(error):
+            self.executor_dict.pop(build_key, None)
+            FreeCAD.Console.PrintWarning("Preview not built: " + error + "\n")
+
+        executor = CallExecutor('build_worker', 'build_shape_file',
+                                [((self.module_name, self.fun_name,
+                                   args, kwargs), {'lod': lod})],
+                                on_done, on_error)
+        if executor.start():
+            self.executor_dict[build_key] = executor
+        else:
+            logger.debug('FreeCADCmd not found, no preview')
+
+    def show_built(self, build_key, pos, color):
+        """ Shows the node of a built shape at the position pos """
+        node, pos_built = self.shp_dict[build_key]
+        self.shp_dict.move_to_end(build_key)
+        self.show(node, pos - pos_built, color)
+
+    def show(self, node, mov=None, color=FULL_COLOR):
+        """ Shows the node of a shape (None: nothing) moved by mov """
+        scene = self.v.getSceneGraph()
+        if node is None:
+            if self.node is not None:
+                scene.removeChild(self.node)
+            self.node = None
+            self.shp_node = None
+            return
+        if self.node is None:
+            self.node = coin.SoSeparator()
+            self.transform = coin.SoTransform()
+            self.material = coin.SoMaterial()
+            self.material.transparency.setValue(PREVIEW_TRANSP)
+            self.node.addChild(self.transform)
+            self.node.addChild(self.material)
+            scene.addChild(self.node)
+        if node is not self.shp_node:
+            if self.shp_node is not None:
+                self.node.removeChild(self.shp_node)
+            self.node.addChild(node)
+            self.shp_node = node
+        if mov is not None:
+            self.transform.translation.setValue(mov.x, mov.y, mov.z)
+        self.material.diffuseColor.setValue(color[0], color[1], color[2])
+
+    def close(self):
+        self.timer.stop()
+        self.update_timer.stop()
+        self.set_pending(None)
+        self.show(None)
+
+
+def params_key(params):
+    """ Key of the values of the panel, without the position """
+    return tuple(sorted((key, str(value)) for key, value in params.items()
+                        if key != 'pos'))
+
+
+def shp_node(shp):
+    """ Coin node of the shape, converted once, it is moved and colored
+    by the nodes of the preview
+    """
+    node_in = coin.SoInput()
+    node_in.setBuffer(shp.writeInventor())
+    return coin.SoDB.readAll(node_in)
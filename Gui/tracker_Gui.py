@@ -0,0 +1,160 @@
+from PySide import QtCore
+import FreeCAD
+import FreeCADGui
+
+#  _________________________________________________________________
+# |                                                                 |
+# |                          View Tracker                           |
+# |_________________________________________________________________|
+#
+# Only one SoEvent callback is added to each 3D view, and it is shared by
+# all the open panels of the view. The mouse events are coalesced: the
+# panels are updated at most every TRACK_INTERVAL ms, with the last
+# position.
+# The 3D point is picked once per update, and the center of the selected
+# sub-object is only calculated when the selection changes, or when an
+# object changes (it can be the selected object, moved or regenerated).
+#
+# Each panel callback receives a dictionary:
+#   "Point": FreeCAD.Vector, 3D point under the mouse, rounded to 3 decimals
+#   "Down": True if the placement has to be toggled (odd number of clicks)
+#   "Selection": True if there is something selected
+#   "SelPoint": FreeCAD.Vector, point of the selected vertex or center of
+#               the selected edge or face. None if not available
+
+# Minimum time between two updates of the panels (ms)
+TRACK_INTERVAL = 40
+
+
+class _SelectionObserver:
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def addSelection(self, doc, obj, sub, pnt):
+        self.tracker.sel_valid = False
+
+    def removeSelection(self, doc, obj, sub):
+        self.tracker.sel_valid = False
+
+    def setSelection(self, doc):
+        self.tracker.sel_valid = False
+
+    def clearSelection(self, doc):
+        self.tracker.sel_valid = False
+
+
+class _DocumentObserver:
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def slotChangedObject(self, obj, prop):
+        self.tracker.sel_valid = False
+
+    def slotDeletedObject(self, obj):
+        self.tracker.sel_valid = False
+
+
+class ViewTracker:
+    def __init__(self, view):
+        self.v = view
+        self.callback_list = []
+        self.track = None
+        self.position = None
+        self.n_down = 0
+        # selection
+        self.observer = _SelectionObserver(self)
+        self.doc_observer = _DocumentObserver(self)
+        self.sel_valid = False
+        self.sel_info = (False, None)
+        # coalesce the events
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(TRACK_INTERVAL)
+        self.timer.timeout.connect(self.update)
+
+    def add(self, callback):
+        if not self.callback_list:
+            self.track = self.v.addEventCallback("SoEvent", self.event)
+            FreeCADGui.Selection.addObserver(self.observer)
+            FreeCAD.addDocumentObserver(self.doc_observer)
+            self.sel_valid = False
+        self.callback_list.append(callback)
+
+    def remove(self, callback):
+        if callback in self.callback_list:
+            self.callback_list.remove(callback)
+        if not self.callback_list and self.track is not None:
+            self.timer.stop()
+            try:
+                self.v.removeEventCallback("SoEvent", self.track)
+            except Exception:  # the view has been closed
+                pass
+            FreeCADGui.Selection.removeObserver(self.observer)
+            FreeCAD.removeDocumentObserver(self.doc_observer)
+            self.track = None
+
+    def event(self, info):
+        if "Position" in info:
+            self.position = info["Position"]
+        if info.get("State") == "DOWN":
+            self.n_down += 1
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def update(self):
+        if self.position is None or not self.callback_list:
+            return
+        point = self.v.getPoint(self.position)
+        has_sel, sel_point = self.get_selection()
+        info = {"Point": FreeCAD.Vector(round(point[0], 3),
+                                        round(point[1], 3),
+                                        round(point[2], 3)),
+                "Down": self.n_down % 2 == 1,
+                "Selection": has_sel,
+                "SelPoint": sel_point}
+        self.n_down = 0
+        for callback in list(self.callback_list):
+            callback(info)
+
+    def get_selection(self):
+        if self.sel_valid:
+            return self.sel_info
+        sel_point = None
+        has_sel = FreeCADGui.Selection.hasSelection()
+        if has_sel:
+            try:
+                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
+                if hasattr(obj, "Point"):  # Is a Vertex
+                    sel_point = obj.Point
+                else:  # Is an Edge or Face
+                    sel_point = obj.CenterOfMass
+            except Exception:
+                sel_point = None
+        self.sel_info = (has_sel, sel_point)
+        self.sel_valid = True
+        return self.sel_info
+
+
+_tracker_list = []  # trackers of the views with panels
+
+
+def add_tracking(view, callback):
+    """ Adds the callback of a panel to the tracker of its view, and
+    returns the callback, to remove it with remove_tracking.
+    The tracker of a view is created with its first panel
+    """
+    for tracker in _tracker_list:
+        if tracker.v == view:
+            break
+    else:
+        tracker = ViewTracker(view)
+        _tracker_list.append(tracker)
+    tracker.add(callback)
+    return callback
+
+
+def remove_tracking(callback):
+    for tracker in list(_tracker_list):
+        tracker.remove(callback)
+        if not tracker.callback_list:
+            _tracker_list.remove(tracker)
@@ -92,6 +92,8 @@ class MakerWorkbench (Workbench):
 
         import Gui.ChangePos_Gui
         import Gui.Assembly_Gui
+        import Gui.Interference_Gui
+        import Gui.Lod_Gui
         import Gui.test_Gui
 
         import Gui.New_Point_Gui
@@ -148,7 +150,10 @@ class MakerWorkbench (Workbench):
         # +-------------------------------+
 
         modList = ["ChangePosExport",
+                   "ChangePosExportAll",
                    "Assembly",
+                   "Interference",
+                   "Level_Of_Detail",
                    "New_Internal_Point"]  # ,
         #          "test"]
 
@@ -40,10 +40,11 @@ import kcomp
 import kcomp_optic
 import partset
 import beltcl
-from filter_stage_fun import filter_stage_fun
 import tensioner_clss
 import filter_holder_clss
 import fc_clss
+from Gui.tracker_Gui import add_tracking, remove_tracking
+from Gui.build_Gui import BuildExecutor, view_fit
 from print_export_fun import print_export
 
 from parts import AluProfBracketPerp, AluProfBracketPerpFlap, AluProfBracketPerpTwin, PartNemaMotorHolder, ThinLinBearHouse1rail
@@ -291,10 +292,10 @@ class SK_Dialog:
         self.Sk.Size_ComboBox.currentTextChanged.connect(self.change_layout)
     
         # Event to track the mouse 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Size_Value = {0: 6, 1: 8, 2: 10, 3: 12}
         Values_Pillow = {0: 0, 1: 1}
@@ -340,38 +341,22 @@ class SK_Dialog:
         # else: axis_message 
         
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
 
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if self.placementTrue:
-            set_place(self.Sk, round(v.getPoint(pos)[0], 3), round(v.getPoint(pos)[1], 3), round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self.Sk, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                set_place(self, pos.x, pos.y, pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self.Sk, pos.x, pos.y, pos.z)
 
     def change_layout(self):
         if self.Sk.Size_ComboBox.currentText() == "8":
@@ -647,11 +632,11 @@ class IdlePulleyHolder_TaskPanel:
         main_layout.addLayout(EndHigh_layout)
         main_layout.addLayout(placement_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
 
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         self.Aluprof_values = {0: 20, 1: 30}
         self.NutBolt_values = {0: 2.5, 1: 3, 2: 4, 3: 5, 4: 6}
@@ -679,44 +664,22 @@ class IdlePulleyHolder_TaskPanel:
         FreeCADGui.Control.closeDialog()  # close the dialog
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -926,10 +889,10 @@ class SimpleEndStopHolder_TaskPanel:
         main_layout.addLayout(axes_layout)
         main_layout.addLayout(image_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Type_values = {0: kcomp.ENDSTOP_A, 1: kcomp.ENDSTOP_B, 2: kcomp.ENDSTOP_D3V}
         Type = Type_values[self.Type_ComboBox.currentIndex()]
@@ -976,44 +939,22 @@ class SimpleEndStopHolder_TaskPanel:
             FreeCADGui.Control.closeDialog()  # close the dialog
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -1323,7 +1264,7 @@ class AluprofBracket_TaskPanel:
             self.Flap_ComboBox.setEnabled(False)
             self.Dist_Prof_Value.setEnabled(False)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def change_layout(self):
         if self.Type_ComboBox.currentIndex() == 0:
@@ -1340,7 +1281,7 @@ class AluprofBracket_TaskPanel:
             self.Dist_Prof_Value.setEnabled(True)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         NUT = {0: 3, 1: 4, 2: 5, 3: 6}
         Size = {0: 10, 1: 15, 2: 20, 3: 30, 4: 40}
@@ -1431,44 +1372,22 @@ class AluprofBracket_TaskPanel:
             FreeCADGui.Control.closeDialog()  # close the dialog
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -1690,10 +1609,10 @@ class MotorHolderTaskPanel:
         main_layout.addLayout(axes_layout)
         main_layout.addLayout(image_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         SizeHolder = {0: 8, 1: 11, 2: 14, 3: 17, 4: 23, 5: 34, 6: 42}
         self.size_motor = SizeHolder[self.ComboBox_Size_Holder.currentIndex()]
@@ -1740,44 +1659,22 @@ class MotorHolderTaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
     
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -2090,10 +1987,10 @@ class NemaMotorTaskPanel:
         main_layout.addLayout(placement_layout)
         main_layout.addLayout(axes_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         dict_size = {0: 8, 1: 11, 2: 14, 3: 17, 5: 23, 6: 34, 7: 42}
         size = dict_size[self.Size.currentIndex()]
@@ -2156,7 +2053,7 @@ class NemaMotorTaskPanel:
                                        pos_w=pos_w,
                                        pos_h=pos_h,
                                        pos=pos,
-                                       group=1,
+                                       group=2,  # App::Part container
                                        name='')
 
             FreeCADGui.activeDocument().activeView().viewAxonometric()
@@ -2164,44 +2061,22 @@ class NemaMotorTaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -2393,10 +2268,10 @@ class LinBearHouseTaskPanel:
         main_layout.addLayout(axes_layout)
         main_layout.addLayout(image_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Type_values = {0: kcomp.LM6UU,
                        1: kcomp.LM8UU,
@@ -2477,44 +2352,22 @@ class LinBearHouseTaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -2733,10 +2586,10 @@ class stop_holderTaskPanel:
         main_layout.addLayout(axes_layout)
         main_layout.addLayout(image_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Width = self.Width_Value.value()
         Height = self.Heigth_Value.value()
@@ -2789,44 +2642,22 @@ class stop_holderTaskPanel:
             FreeCADGui.Control.closeDialog()  # close the dialog
         
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -3014,10 +2845,10 @@ class FilterStageTaskPanel:
         main_layout.addLayout(thickness_layout)
         main_layout.addLayout(placement_layout)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         self.selec_base = {0: 5, 1: 10, 2: 15, 3: 20, 4: 30, 5: 40}
         move_l = self.move_l_Value.value()
@@ -3037,65 +2868,44 @@ class FilterStageTaskPanel:
 
         pos = FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())
 
-        filter_stage_fun(move_l,
-                         Filter_Length,
-                         Filter_Width,
-                         nut_hole,
-                         tens_stroke,
-                         base_w,
-                         wall_thick,
-                         size_motor,
-                         h_motor,
-                         thik_motor,
-                         pos)
         # pulley_h => belt_pos_h
         # nut_hole => bolttens_mtr
         # tens_stroke => tens_stroke_Var
         # base_w => aluprof_w
         # wall_thick => wall_thick_Var
-        FreeCADGui.activeDocument().activeView().viewAxonometric()
-        FreeCADGui.SendMsgToActiveView("ViewFit")
         FreeCADGui.Control.closeDialog()  # close the dialog
+        # the stage is built without blocking the GUI
+        BuildExecutor('Filter Stage', 'filter_stage_fun', 'filter_stage_fun',
+                      args=[move_l,
+                            Filter_Length,
+                            Filter_Width,
+                            nut_hole,
+                            tens_stroke,
+                            base_w,
+                            wall_thick,
+                            size_motor,
+                            h_motor,
+                            thik_motor,
+                            pos],
+                      on_done=view_fit).start()
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -3267,10 +3077,10 @@ class FilterHolderTaskPanel:  # TODO
 
         main_layout.addWidget(image, 11, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Filter_Length = self.Filter_Length_Value.value()
         Filter_Width = self.Filter_Width_Value.value()
@@ -3337,44 +3147,22 @@ class FilterHolderTaskPanel:  # TODO
             FreeCADGui.Control.closeDialog()  # close the dialog
     
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -3588,10 +3376,10 @@ class TensionerTaskPanel:
 
         layout.addWidget(image, 15, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         IndexNut = {0: 3, 1: 4, 2: 5, 3: 6}
         IndexBase = {0: 10, 1: 15, 2: 20, 3: 30, 4: 40}
@@ -3619,29 +3407,37 @@ class TensionerTaskPanel:
                                 self.axis_h_z.value())
         
         if ortonormal_axis(axis_d, axis_w, axis_h) is True:
-            tensioner_clss.TensionerSet(aluprof_w=base_w,  # 20.,
-                                        belt_pos_h=tensioner_belt_h,
-                                        hold_bas_h=0,
-                                        hold_hole_2sides=1,
-                                        boltidler_mtr=3,
-                                        bolttens_mtr=nut_hole,   # métrica del tensor
-                                        boltaluprof_mtr=nut_hole,
-                                        tens_stroke=tens_stroke,
-                                        wall_thick=wall_thick,
-                                        in_fillet=2.,
-                                        pulley_stroke_dist=0,
-                                        nut_holder_thick=nut_hole,
-                                        opt_tens_chmf=0,
-                                        min_width=0,
-                                        tol=kcomp.TOL,
-                                        axis_d=axis_d,  # VY.negative(),
-                                        axis_w=axis_w,  # VX.negative(),
-                                        axis_h=axis_h,  # VZ,
-                                        pos_d=pos_d,
-                                        pos_w=pos_w,
-                                        pos_h=pos_h,
-                                        pos=pos,
-                                        name='tensioner_set')
+            set_kwargs = dict(aluprof_w=base_w,  # 20.,
+                              belt_pos_h=tensioner_belt_h,
+                              hold_bas_h=0,
+                              hold_hole_2sides=1,
+                              boltidler_mtr=3,
+                              bolttens_mtr=nut_hole,   # métrica del tensor
+                              boltaluprof_mtr=nut_hole,
+                              tens_stroke=tens_stroke,
+                              wall_thick=wall_thick,
+                              in_fillet=2.,
+                              pulley_stroke_dist=0,
+                              nut_holder_thick=nut_hole,
+                              opt_tens_chmf=0,
+                              min_width=0,
+                              tol=kcomp.TOL,
+                              axis_d=axis_d,  # VY.negative(),
+                              axis_w=axis_w,  # VX.negative(),
+                              axis_h=axis_h,  # VZ,
+                              pos_d=pos_d,
+                              pos_w=pos_w,
+                              pos_h=pos_h,
+                              pos=pos,
+                              group=2,  # App::Part container
+                              name='tensioner_set')
+            if Set_Select != 0:
+                # the whole set is built without blocking the GUI
+                FreeCADGui.Control.closeDialog()  # close the dialog
+                BuildExecutor('Tensioner', 'tensioner_clss', 'TensionerSet',
+                              kwargs=set_kwargs, on_done=view_fit).start()
+                return
+            tensioner_clss.TensionerSet(**set_kwargs)
             if Set_Select == 0:  # work only for tens_stroke = 20
                 FreeCAD.ActiveDocument.removeObject("bearing_idlpulley_m3")
                 FreeCAD.ActiveDocument.removeObject("idlpull_bearing")
@@ -3681,44 +3477,22 @@ class TensionerTaskPanel:
             FreeCADGui.Control.closeDialog()  # close the dialog
     
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -3888,10 +3662,10 @@ class BeltClampTaskPanel:
 
         layout.addWidget(image, 10, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Type = self.Type_ComboBox.currentIndex()
         Length = self.Length_Value.value()
@@ -3947,44 +3721,22 @@ class BeltClampTaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -4271,10 +4023,10 @@ class BeltClampedTaskPanel:
 
         layout.addWidget(image, 26, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         pull1_dm = self.Pulley_D1.value()
         pull2_dm = self.Pulley_D2.value()
@@ -4334,44 +4086,22 @@ class BeltClampedTaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -4558,10 +4288,10 @@ class SensorHolderTaskPanel:
 
         layout.addWidget(image, 12, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         Sensor_Pin_Length = self.Sensor_Pin_Length_Value.value()
         Sensor_Pin_Width = self.Sensor_Pin_Width_Value.value()
@@ -4609,44 +4339,22 @@ class SensorHolderTaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -4824,10 +4532,10 @@ class Aluproft_TaskPanel:
 
         layout.addWidget(image, 11, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         prof_type = {0:  5,
                      1: 10,
@@ -4871,44 +4579,22 @@ class Aluproft_TaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -5075,10 +4761,10 @@ class LinGuideBlock_TaskPanel:
 
         layout.addWidget(image, 10, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         dict_block = {0: kcomp.SEBWM16_B, 1: kcomp.SEB15A_B, 2: kcomp.SEB8_B, 3: kcomp.SEB10_B}
         dict_rail = {0: kcomp.SEBWM16_R, 1: kcomp.SEB15A_R, 2: kcomp.SEB8_R, 3: kcomp.SEB10_R}
@@ -5118,44 +4804,22 @@ class LinGuideBlock_TaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
+        if info["Down"] is True:
+            self.placement = not self.placement
+
         if self.placement is True:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -5284,10 +4948,10 @@ class Bolt_TaskPanel:
 
         # layout.addWidget(image, 9, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         metric = {0: 3,
                   1: 4,
@@ -5350,44 +5014,22 @@ class Bolt_TaskPanel:
         FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -5493,10 +5135,10 @@ class TubeLense_TaskPanel:
 
         layout.addWidget(image, 5, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         size = {0: 3, 1: 5, 2: 10, 3: 15, 4: 20, 5: 30}
         sm1l_size = size[self.Length.currentIndex()]
@@ -5515,44 +5157,22 @@ class TubeLense_TaskPanel:
         FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -5684,10 +5304,10 @@ class Lcpb1mBase_TaskPanel:
 
         layout.addWidget(image, 6, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         pos = FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())
         axis_d = FreeCAD.Vector(self.axis_d_x.value(),
@@ -5713,44 +5333,22 @@ class Lcpb1mBase_TaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -5825,10 +5423,10 @@ class CageCube_TaskPanel:
         layout.addWidget(self.Label_pos_z, 4, 1, 1, 2)
         layout.addWidget(self.pos_z, 4, 2, 1, 2)
         
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         # if fc_isperp(axis_d,axis_w) == 1:
         if self.Type.currentIndex() == 0:
@@ -5850,44 +5448,22 @@ class CageCube_TaskPanel:
         #     axis_message()
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -6024,10 +5600,10 @@ class Plate_TaskPanel:
 
         layout.addWidget(image, 7, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         pos = FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())
         axis_d = FreeCAD.Vector(self.axis_d_x.value(),
@@ -6071,44 +5647,22 @@ class Plate_TaskPanel:
             FreeCADGui.SendMsgToActiveView("ViewFit")
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -6220,10 +5774,10 @@ class ThLed30_TaskPanel:
 
         layout.addWidget(image, 5, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         pos = FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())
         axis_w = FreeCAD.Vector(self.axis_w_x.value(),
@@ -6246,44 +5800,22 @@ class ThLed30_TaskPanel:
             axis_message()
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -6395,10 +5927,10 @@ class PrizLed_TaskPanel:
 
         layout.addWidget(image, 5, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         pos = FreeCAD.Vector(self.pos_x.value(), self.pos_y.value(), self.pos_z.value())
         axis_w = FreeCAD.Vector(self.axis_w_x.value(),
@@ -6421,44 +5953,22 @@ class PrizLed_TaskPanel:
             axis_message()
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
+
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 #  _________________________________________________________________
@@ -6588,10 +6098,10 @@ class BreadBoard_TaskPanel:
 
         layout.addWidget(image, 7, 0, 1, 0)
 
-        self.track = v.addEventCallback("SoEvent", self.position)
+        self.track = add_tracking(v, self.position)
 
     def accept(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
 
         length = self.len.value()
         width = self.wid.value()
@@ -6622,44 +6132,22 @@ class BreadBoard_TaskPanel:
             axis_message()
 
     def reject(self):
-        v.removeEventCallback("SoEvent", self.track)
+        remove_tracking(self.track)
         FreeCADGui.Control.closeDialog()
         
     def position(self, info):
-        pos = info["Position"]
-        try: 
-            down = info["State"]
-            if down == "DOWN" and self.placement is True:
-                self.placement = False
-            elif down == "DOWN" and self.placement is False:
-                self.placement = True
-            else:
-                pass
-        except Exception:
-            None
-        
-        if self.placement:
-            self.pos_x.setValue(round(v.getPoint(pos)[0], 3))
-            self.pos_y.setValue(round(v.getPoint(pos)[1], 3))
-            self.pos_z.setValue(round(v.getPoint(pos)[2], 3))
-        else:
-            pass
+        if info["Down"] is True:
+            self.placement = not self.placement
+
+        if self.placement is True:
+            pos = info["Point"]
+            set_place(self, pos.x, pos.y, pos.z)
 
-        if FreeCAD.Gui.Selection.hasSelection():
+        if info["Selection"] is True:
             self.placement = False
-            try:
-                obj = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-                if hasattr(obj, "Point"):  # Is a Vertex
-                    pos = obj.Point
-                else:  # Is an Edge or Face
-                    pos = obj.CenterOfMass
-                print(pos)
-                print("track" + str(self.placement))
-                self.pos_x.setValue(pos.x)
-                self.pos_y.setValue(pos.y)
-                self.pos_z.setValue(pos.z)
-            except Exception:
-                None
+            pos = info["SelPoint"]
+            if pos is not None:  # Vertex point or Edge/Face center
+                set_place(self, pos.x, pos.y, pos.z)
 
 
 ###############################################################################
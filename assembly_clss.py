@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Assembly graph: parts and sets without a FreeCAD document
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# An assembly is a tree of AsmNode:
+#   - part nodes: have a shape, in the frame of the node
+#   - set nodes: have children (parts or sets)
+# Each node has its placement relative to its parent, so moving or rotating
+# a set moves all its children, without touching their shapes.
+# Transforms, bounding boxes, queries and interference checks are done
+# on the graph, without a document. When the assembly is ready, materialize
+# creates all the FreeCAD objects in one batch: one transaction and one
+# recompute.
+#
+# Each node can have a parameter key, e.g. ('Din912Bolt', 3, 20), to find
+# the nodes of the same kind. Parts with the same key are supposed to have
+# the same shape, so they can be materialized as links to one master object
+#
+# The shp_clss objects (and the sets that have them in parts_lst) can be
+# added to the graph with node_from_obj. The graph of a set of the library
+# is given by fc_clss.PartsSet.to_graph
+
+import logging
+
+import FreeCAD
+
+import fcfun
+import interference_fun
+
+from fcfun import V0, V0ROT
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+
+class AsmNode(object):
+    """ Node of the assembly graph, a part or a set of nodes
+
+    Parameters
+    ----------
+    name : str
+        Name of the node, it will be the name of the FreeCAD object
+    shp : TopoShape
+        Shape of the part, in the frame of the node. None for a set
+    place : FreeCAD.Placement or FreeCAD.Vector
+        Placement of the node relative to its parent. A vector is a
+        translation
+    key : hashable
+        Parameter key of the node, to find nodes of the same kind.
+        Parts with the same key have the same shape
+    color : tuple of 3 floats
+        RGB color of the part (or of all the parts of the set), from 0. to 1.
+        If None, the default color (or the color of the parent)
+
+    Attributes
+    ----------
+    children : list of AsmNode
+        Empty for a part
+    parent : AsmNode
+        None for the root of the assembly
+    fco : FreeCAD Object
+        The object created by materialize, None before
+    """
+
+    def __init__(self, name, shp=None, place=None, key=None, color=None):
+        self.name = name
+        self.shp = shp
+        self.place = FreeCAD.Placement()
+        self.set_place(place)
+        self.key = key
+        self.color = color
+        self.children = []
+        self.parent = None
+        self.fco = None
+
+    def is_part(self):
+        """ Returns True if the node is a part (it has a shape) """
+        return self.shp is not None
+
+    def add_child(self, child):
+        """ Adds a node as a child of this set, and returns it """
+        if self.is_part():
+            logger.error(self.name + ' is a part, it cannot have children')
+            return None
+        if child.parent is not None:
+            child.parent.children.remove(child)
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def add_part(self, name, shp, place=None, key=None, color=None):
+        """ Creates a part node, adds it as a child and returns it """
+        return self.add_child(AsmNode(name, shp, place, key, color))
+
+    def add_set(self, name, place=None, key=None, color=None):
+        """ Creates a set node, adds it as a child and returns it """
+        return self.add_child(AsmNode(name, None, place, key, color))
+
+    # ----- transforms
+    def set_place(self, place=None):
+        """ Sets the placement relative to the parent
+
+        Parameters
+        ----------
+        place : FreeCAD.Placement or FreeCAD.Vector
+            A vector is a translation. None: no displacement
+        """
+        if place is None:
+            self.place = FreeCAD.Placement()
+        elif isinstance(place, FreeCAD.Vector):
+            self.place = FreeCAD.Placement(place, V0ROT)
+        else:
+            self.place = FreeCAD.Placement(place)
+
+    def translate(self, vec):
+        """ Moves the node (and its children) along vec, in the frame of
+        the parent
+        """
+        self.place = FreeCAD.Placement(vec, V0ROT).multiply(self.place)
+
+    def rotate(self, rot, center=V0):
+        """ Rotates the node (and its children) around center, in the
+        frame of the parent
+
+        Parameters
+        ----------
+        rot : FreeCAD.Rotation
+        center : FreeCAD.Vector
+        """
+        self.place = FreeCAD.Placement(V0, rot, center).multiply(self.place)
+
+    def get_abs_place(self):
+        """ Returns the placement of the node in the assembly (the
+        placements of all its parents applied)
+        """
+        if self.parent is None:
+            return FreeCAD.Placement(self.place)
+        return self.parent.get_abs_place().multiply(self.place)
+
+    def get_color(self):
+        """ Returns the color of the node, or of its closest parent with a
+        color. None if there is no color
+        """
+        node = self
+        while node is not None:
+            if node.color is not None:
+                return node.color
+            node = node.parent
+        return None
+
+    # ----- queries
+    def iter_nodes(self):
+        """ Generator of this node and all the nodes below, depth first """
+        yield self
+        for child in self.children:
+            for node in child.iter_nodes():
+                yield node
+
+    def get_parts(self):
+        """ Returns the list of the part nodes below this node (or this
+        node, if it is a part)
+        """
+        return [node for node in self.iter_nodes() if node.is_part()]
+
+    def find(self, name):
+        """ Returns the first node with this name, None if not found """
+        for node in self.iter_nodes():
+            if node.name == name:
+                return node
+        return None
+
+    def find_key(self, key):
+        """ Returns the list of the nodes with this parameter key """
+        return [node for node in self.iter_nodes() if node.key == key]
+
+    def count_keys(self):
+        """ Returns a dictionary with the number of parts of each key,
+        e.g. for a bill of materials. Parts without key are counted by name
+        """
+        count_dict = {}
+        for node in self.get_parts():
+            key = node.key if node.key is not None else node.name
+            count_dict[key] = count_dict.get(key, 0) + 1
+        return count_dict
+
+    def get_shp(self):
+        """ Returns a copy of the shape of the part in the assembly frame
+        None if the node is a set
+        """
+        if not self.is_part():
+            return None
+        shp = self.shp.copy()
+        shp.Placement = self.get_abs_place().multiply(self.shp.Placement)
+        return shp
+
+    def get_bbox(self):
+        """ Returns the bounding box of the node in the assembly frame,
+        as a tuple (x_min, y_min, z_min, x_max, y_max, z_max).
+        None if there are no parts
+        """
+        box_list = [interference_fun.bbox_tup(node.get_shp().BoundBox)
+                    for node in self.get_parts()]
+        if not box_list:
+            return None
+        return interference_fun.box_join(box_list)
+
+    def check_interference(self, tol=0, min_vol=interference_fun.MIN_VOL,
+                           workers=None):
+        """ Checks the interference between the parts below this node,
+        see interference_fun.check_interference
+
+        Returns
+        -------
+        list of tuples (node_i, node_j, vol)
+        """
+        part_list = self.get_parts()
+        pair_list = interference_fun.check_interference(
+                                        [node.get_shp() for node in part_list],
+                                        tol=tol, min_vol=min_vol,
+                                        workers=workers)
+        return [(part_list[i], part_list[j], vol) for i, j, vol in pair_list]
+
+    # ----- materialization
+    def materialize(self, doc=None, links=0):
+        """ Creates the FreeCAD objects of the node and all the nodes below
+        in one batch: one transaction (one undo) and one recompute.
+        The parts are Part::Feature and the sets Part::Compound
+
+        Parameters
+        ----------
+        doc : FreeCAD document
+            If None, the active document
+        links : int
+            1: the parts with the same key are links (App::Link) to a
+               hidden master object, that is made with the first of them
+            0: each part is a Part::Feature with its own shape
+
+        Returns
+        -------
+        FreeCAD Object
+            The object of this node
+        """
+        if doc is None:
+            doc = FreeCAD.ActiveDocument
+        master_dict = {}
+        color_list = []
+        doc.openTransaction('materialize ' + self.name)
+        try:
+            self._add_fco(doc, links, master_dict, color_list)
+        except Exception:
+            doc.abortTransaction()
+            raise
+        doc.commitTransaction()
+        doc.recompute()
+        # colors after the recompute, only if there is a GUI
+        for fco, color in color_list:
+            if fco.ViewObject is not None:
+                fco.ViewObject.ShapeColor = color
+        return self.fco
+
+    def _add_fco(self, doc, links, master_dict, color_list):
+        """ Creates the object of the node and of its children, see
+        materialize
+        """
+        if self.is_part():
+            place = self.get_abs_place().multiply(self.shp.Placement)
+            if links == 1 and self.key is not None:
+                master = master_dict.get(self.key)
+                if master is None:
+                    master = doc.addObject('Part::Feature',
+                                           self.name + '_master')
+                    master.Shape = self.shp
+                    if master.ViewObject is not None:
+                        master.ViewObject.Visibility = False
+                    master_dict[self.key] = master
+                fco = doc.addObject('App::Link', self.name)
+                fco.LinkedObject = master
+            else:
+                fco = doc.addObject('Part::Feature', self.name)
+                fco.Shape = self.shp
+            fco.Placement = place
+            color = self.get_color()
+            if color is not None:
+                color_list.append((fco, color))
+        else:
+            for child in self.children:
+                child._add_fco(doc, links, master_dict, color_list)
+            fco = doc.addObject('Part::Compound', self.name)
+            fco.Links = [child.fco for child in self.children
+                         if child.fco is not None]
+        self.fco = fco
+        return fco
+
+
+def node_from_obj(obj, name=None, key=None):
+    """ Returns a node of the assembly graph of an object of the library
+    that has the shape in attribute shp (shp_clss objects), or of a set of
+    them (parts_lst, get_parts()). The document is not used.
+    The placement of a set node is the placement of the whole set
+    (set_placement of fc_clss.PartsSet, that can have rotation), or the
+    displacement that place_fcos would apply: rel_place and extra_mov.
+    The placement of a part node is that displacement and pos_o_adjust.
+    The shape of a part node is in the local frame of the part (see
+    Obj3D.get_local_place), and if no key is given, its key is the master
+    key of the part (class, arguments and LOD, see
+    fc_clss.SinglePart.get_master_key), or if it has none, the class name
+    and the fingerprint of that shape in its local frame
+    (fcfun.shp_geom_fingerprint with placed=1), so equal parts can be
+    links to the same master (see materialize)
+
+    Parameters
+    ----------
+    obj : shp_clss.Obj3D, fc_clss.PartsSet, ...
+    name : str
+        Name of the node, if None, the name of the object
+    key : hashable
+        Parameter key of the node, if None, it is made from the shape
+        for the parts
+
+    Returns
+    -------
+    AsmNode
+    """
+    if name is None:
+        name = getattr(obj, 'name', None) or type(obj).__name__
+    displacement = (getattr(obj, 'rel_place', V0)
+                    + getattr(obj, 'extra_mov', V0))
+    try:
+        part_list = obj.get_parts()
+    except AttributeError:
+        part_list = []
+    if part_list:
+        place = getattr(obj, 'set_placement', None)
+        if place is None:
+            place = FreeCAD.Placement(displacement, V0ROT)
+        node = AsmNode(name, None, place, key, getattr(obj, 'color', None))
+        for part in part_list:
+            child = node_from_obj(part)
+            if child is not None:
+                node.add_child(child)
+    elif getattr(obj, 'shp', None) is not None:
+        displacement = displacement + getattr(obj, 'pos_o_adjust', V0)
+        place = FreeCAD.Placement(displacement, V0ROT)
+        shp = obj.shp
+        try:
+            place0 = obj.get_local_place()
+        except AttributeError:  # not an Obj3D, no local frame
+            place0 = None
+        if place0 is not None:
+            shp = shp.copy()
+            shp.transformShape(place0.inverse().toMatrix())
+            place = place.multiply(place0)
+        if key is None:
+            # only in instancing mode, see fc_clss.SinglePart.shp_needed
+            key = getattr(obj, 'master_key', None)
+            try:
+                hash(key)
+            except TypeError:  # arguments that are lists or dictionaries
+                key = None
+        if key is None:
+            key = (type(obj).__name__,
+                   fcfun.shp_geom_fingerprint(shp, placed=1))
+        node = AsmNode(name, shp, place, key, getattr(obj, 'color', None))
+    else:
+        logger.error(name + ' has no shape and no parts')
+        return None
+    return node
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Functions to calculate the path of a belt over many pulleys
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# The belt goes around an ordered list of pulleys and idlers, and it is
+# closed (from the last pulley it goes back to the first).
+# Each pulley is a tuple (pos, radius, side):
+#   - pos: FreeCAD.Vector, center of the pulley on the plane of the belt
+#   - radius: radius of the belt path on the pulley (for a GT pulley it is
+#             the pitch radius, see pulley_circle)
+#   - side: 1: the belt wraps the pulley counterclockwise (seen from axis_n)
+#           -1: the belt wraps the pulley clockwise
+#     If the list goes counterclockwise, the pulleys inside the belt loop
+#     are 1 and the idlers pressing the belt from outside are -1
+#
+# The tangent segments, wrap angles and total length are calculated
+# analytically with numpy, without shapes, and they can be calculated for
+# many layouts at once (belt_length_sweep), for example to evaluate the
+# positions of an idler or a tensioner. The wire of the belt is only built
+# when needed (wire_belt_path)
+#
+# With signed radii rho = side * radius, the segment from pulley i to
+# pulley i+1 has the angle:
+#    seg_ang = phi - asin((rho_i+1 - rho_i) / D)
+#    phi, D: angle and distance from center i to center i+1
+# and the tangent points are at center + rho * (sin(seg_ang), -cos(seg_ang))
+
+import logging
+import math
+
+import numpy as np
+
+import Part
+import DraftVecUtils
+
+import fcfun
+from fcfun import V0, VZ
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Wrap angles (rad) smaller than this are considered straight, no arc
+WRAP_TOL = 1e-9
+
+
+def plane_axes(axis_n=VZ, axis_x=None):
+    """ Returns the unit axes (axis_x, axis_y) of the plane of the belt,
+    perpendicular to axis_n. If axis_x is None, any perpendicular
+    """
+    axis_n = DraftVecUtils.scaleTo(axis_n, 1)
+    if axis_x is None or axis_x == V0:
+        axis_x = fcfun.get_fc_perpend1(axis_n)
+    axis_x = DraftVecUtils.scaleTo(axis_x, 1)
+    axis_y = axis_n.cross(axis_x)
+    return axis_x, axis_y
+
+
+def pulley_arr(pulley_list, axis_x, axis_y, origin=V0):
+    """ Returns the arrays of the pulleys, coordinates on the plane of
+    the belt
+
+    Returns
+    -------
+    Tuple of 3 numpy arrays:
+        centers : (n, 2) coordinates of the centers along axis_x, axis_y
+        radii : (n,)
+        sides : (n,)
+    """
+    centers = np.array([((pos - origin).dot(axis_x),
+                         (pos - origin).dot(axis_y))
+                        for pos, _, _ in pulley_list], dtype=float)
+    radii = np.array([radius for _, radius, _ in pulley_list], dtype=float)
+    sides = np.array([side for _, _, side in pulley_list], dtype=float)
+    return centers, radii, sides
+
+
+def belt_path_arr(centers, radii, sides):
+    """ Calculates the path of the belt. It is vectorized: centers can
+    have leading dimensions to calculate many layouts at once
+
+    Parameters
+    ----------
+    centers : numpy array (..., n, 2)
+        Coordinates of the centers of the pulleys on the plane
+    radii : numpy array (n,) or (..., n)
+    sides : numpy array (n,) or (..., n)
+
+    Returns
+    -------
+    Tuple of 4 numpy arrays:
+        seg_ang : (..., n) angle of the segment from pulley i to pulley i+1
+        seg_len : (..., n) length of the segment from pulley i to i+1
+        wrap : (..., n) wrap angle of the belt on pulley i (rad)
+        length : (...) total length of the belt
+    The values are nan if the segment cannot be made (a pulley inside
+    the other)
+    """
+    rho = sides * radii
+    d_vec = np.roll(centers, -1, axis=-2) - centers
+    dist = np.hypot(d_vec[..., 0], d_vec[..., 1])
+    rho_diff = np.roll(rho, -1, axis=-1) - rho
+    rho_diff = np.broadcast_to(rho_diff, dist.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = rho_diff / dist
+        ratio = np.where(np.abs(ratio) <= 1, ratio, np.nan)
+        seg_ang = np.arctan2(d_vec[..., 1], d_vec[..., 0]) - np.arcsin(ratio)
+        seg_len = np.sqrt(dist * dist - rho_diff * rho_diff)
+    # the belt turns from the incoming segment to the outgoing segment
+    wrap = np.mod(sides * (seg_ang - np.roll(seg_ang, 1, axis=-1)),
+                  2 * math.pi)
+    length = seg_len.sum(axis=-1) + (radii * wrap).sum(axis=-1)
+    return seg_ang, seg_len, wrap, length
+
+
+def tangent_arr(centers, radii, sides, seg_ang):
+    """ Returns the tangent points of the segments
+
+    Returns
+    -------
+    Tuple of 2 numpy arrays (..., n, 2):
+        pt_out : point where the belt leaves pulley i
+        pt_in : point where the belt arrives to pulley i
+    """
+    rho = sides * radii
+    normal = np.stack((np.sin(seg_ang), -np.cos(seg_ang)), axis=-1)
+    pt_out = centers + rho[..., None] * normal
+    pt_in = (centers
+             + rho[..., None] * np.roll(normal, 1, axis=-2))
+    return pt_out, pt_in
+
+
+def belt_path(pulley_list, axis_n=VZ, axis_x=None):
+    """ Calculates the path of the belt over the pulleys
+
+    Parameters
+    ----------
+    pulley_list : list of tuples (pos, radius, side)
+        See the header of the module, at least 2 pulleys
+    axis_n : FreeCAD.Vector
+        Normal of the plane of the belt (axis of the pulleys)
+    axis_x : FreeCAD.Vector
+        Axis on the plane of the belt, if None, any perpendicular to axis_n
+
+    Returns
+    -------
+    Dictionary:
+        'length' : total length of the belt
+        'seg_len' : list of the lengths of the segments, from pulley i to i+1
+        'wrap' : list of the wrap angles on each pulley (degrees)
+        'pt_in' : list of FreeCAD.Vector, where the belt arrives to pulley i
+        'pt_out' : list of FreeCAD.Vector, where the belt leaves pulley i
+    None if the path cannot be made
+    """
+    if len(pulley_list) < 2:
+        logger.error('belt path needs at least 2 pulleys')
+        return None
+    axis_x, axis_y = plane_axes(axis_n, axis_x)
+    origin = pulley_list[0][0]
+    centers, radii, sides = pulley_arr(pulley_list, axis_x, axis_y, origin)
+    seg_ang, seg_len, wrap, length = belt_path_arr(centers, radii, sides)
+    if np.isnan(length):
+        logger.error('belt path not possible, a pulley is inside another')
+        return None
+    pt_out, pt_in = tangent_arr(centers, radii, sides, seg_ang)
+
+    def fc_pt(pt):
+        return (origin + DraftVecUtils.scale(axis_x, pt[0])
+                + DraftVecUtils.scale(axis_y, pt[1]))
+
+    return {'length': float(length),
+            'seg_len': seg_len.tolist(),
+            'wrap': np.degrees(wrap).tolist(),
+            'pt_in': [fc_pt(pt) for pt in pt_in],
+            'pt_out': [fc_pt(pt) for pt in pt_out]}
+
+
+def belt_length_sweep(pulley_list, pulley_i, pos_list,
+                      axis_n=VZ, axis_x=None):
+    """ Calculates the belt length and the wrap angles for many positions
+    of one of the pulleys (e.g. an idler or a tensioner), all at once,
+    without building shapes
+
+    Parameters
+    ----------
+    pulley_list : list of tuples (pos, radius, side)
+        See the header of the module
+    pulley_i : int
+        Index of the pulley that moves
+    pos_list : list of FreeCAD.Vector
+        Positions of the center of the pulley pulley_i
+    axis_n, axis_x : FreeCAD.Vector
+        Axes of the plane of the belt, see belt_path
+
+    Returns
+    -------
+    Tuple of 2 numpy arrays:
+        length : (n_pos,) belt length for each position, nan if not possible
+        wrap : (n_pos, n_pulleys) wrap angles (degrees)
+    """
+    axis_x, axis_y = plane_axes(axis_n, axis_x)
+    origin = pulley_list[0][0]
+    centers, radii, sides = pulley_arr(pulley_list, axis_x, axis_y, origin)
+    pos_arr = np.array([((pos - origin).dot(axis_x),
+                         (pos - origin).dot(axis_y))
+                        for pos in pos_list], dtype=float)
+    centers = np.repeat(centers[None], len(pos_arr), axis=0)
+    centers[:, pulley_i] = pos_arr
+    _, _, wrap, length = belt_path_arr(centers, radii, sides)
+    return length, np.degrees(wrap)
+
+
+def wire_belt_path(pulley_list, axis_n=VZ, axis_x=None):
+    """ Creates the wire of the belt path over the pulleys, in one pass:
+    an arc on each pulley and a line for each segment
+
+    Parameters
+    ----------
+    pulley_list, axis_n, axis_x :
+        See belt_path
+
+    Returns
+    -------
+    Shape Wire
+        Closed wire of the belt path, None if the path cannot be made
+    """
+    if len(pulley_list) < 2:
+        logger.error('belt path needs at least 2 pulleys')
+        return None
+    axis_x, axis_y = plane_axes(axis_n, axis_x)
+    origin = pulley_list[0][0]
+    centers, radii, sides = pulley_arr(pulley_list, axis_x, axis_y, origin)
+    seg_ang, _, wrap, length = belt_path_arr(centers, radii, sides)
+    if np.isnan(length):
+        logger.error('belt path not possible, a pulley is inside another')
+        return None
+    pt_out, pt_in = tangent_arr(centers, radii, sides, seg_ang)
+    # angle of the arc midpoint from the center of each pulley
+    mid_ang = (np.roll(seg_ang, 1) - sides * math.pi / 2.
+               + sides * wrap / 2.)
+    pt_mid = centers + radii[:, None] * np.stack((np.cos(mid_ang),
+                                                  np.sin(mid_ang)), axis=-1)
+
+    def fc_pt(pt):
+        return (origin + DraftVecUtils.scale(axis_x, float(pt[0]))
+                + DraftVecUtils.scale(axis_y, float(pt[1])))
+
+    edge_list = []
+    n_pulley = len(pulley_list)
+    for ind in range(n_pulley):
+        if wrap[ind] > WRAP_TOL:
+            edge_list.append(Part.Arc(fc_pt(pt_in[ind]),
+                                      fc_pt(pt_mid[ind]),
+                                      fc_pt(pt_out[ind])).toShape())
+        edge_list.append(
+            Part.LineSegment(fc_pt(pt_out[ind]),
+                             fc_pt(pt_in[(ind + 1) % n_pulley])).toShape())
+    return Part.Wire(edge_list)
+
+
+def pulley_circle(pulley, side=1):
+    """ Returns the tuple (pos, radius, side) of the belt path on a GT
+    pulley (comps.ShpGtPulley or PartGtPulley): the center at the middle
+    of the toothed part and the pitch radius
+    """
+    return (pulley.get_pos_h(3), pulley.pitch_r, side)
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Builds FreeCAD objects and runs functions in separate processes
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# This script is run by FreeCADCmd (no GUI) to build the objects of a
+# function or class of the workbench (e.g. filter_stage_fun, TensionerSet)
+# out of the FreeCAD process of the user, so the GUI is not blocked.
+#
+# The job is a json file, its path is in the environment variable ENV_JOB:
+#   {"path": folder of the workbench,
+#    "module": name of the module, "function": name of the function/class,
+#    "args": list, "kwargs": dict, (encoded with encode_value)
+#    "out_file": FCStd file where the resulting document is saved}
+#
+# The job can also be a list of calls of the function (see run_calls), to
+# run OCC operations (tessellation, common, distToShape) in parallel, in
+# several processes, because they do not release the GIL of a thread:
+#   {"path", "module", "function": as above,
+#    "calls": list of [args, kwargs] (encoded with encode_value),
+#    "out_file": json file where the list of results is saved}
+# The shapes of the arguments are passed in BREP files
+#
+# The progress is written to stdout, one message per line:
+#   STAGE <name>          : stage of the build
+#   OBJECT <n> <label>    : a new object has been created, n objects created
+#   CALL <n>              : n calls of the function have been run
+#   DONE                  : the document (or the results) have been saved
+#                           in out_file
+#   ERROR <message>       : the build has failed
+#
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import importlib
+import subprocess
+import traceback
+
+import FreeCAD
+import Part
+
+# environment variable with the path of the job file
+ENV_JOB = 'MAKER_BUILD_JOB'
+
+# property where the colors of the objects are stored: FreeCADCmd has no
+# view objects, and the view properties are not in the saved document.
+# The GUI sets the colors from it when the objects are inserted
+COLOR_PROP = 'BuildColor'
+
+
+def find_freecadcmd():
+    """ Returns the path of the FreeCADCmd executable, None if not found """
+    bin_dir = os.path.join(FreeCAD.getHomePath(), 'bin')
+    for exe_name in ('FreeCADCmd', 'freecadcmd', 'FreeCADCmd.exe'):
+        exe_path = os.path.join(bin_dir, exe_name)
+        if os.path.isfile(exe_path):
+            return exe_path
+    return shutil.which('FreeCADCmd') or shutil.which('freecadcmd')
+
+
+def encode_value(value, shp_dir=None, shp_dict=None):
+    """ Returns the value, with the FreeCAD Vectors and tuples converted
+    to json types (lists and dictionaries).
+    If shp_dir is given, the shapes are written to BREP files in shp_dir,
+    once for each shape: shp_dict has the file of each shape (key: id)
+    """
+    if isinstance(value, FreeCAD.Vector):
+        return {'__vector__': [value.x, value.y, value.z]}
+    if shp_dir is not None and isinstance(value, Part.Shape):
+        if id(value) not in shp_dict:
+            shp_file = os.path.join(shp_dir,
+                                    str(len(shp_dict)) + '.brep')
+            value.exportBrep(shp_file)
+            shp_dict[id(value)] = shp_file
+        return {'__brep__': shp_dict[id(value)]}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(elem, shp_dir, shp_dict) for elem in value]
+    if isinstance(value, dict):
+        return {key: encode_value(elem, shp_dir, shp_dict)
+                for key, elem in value.items()}
+    return value
+
+
+def decode_value(value, shp_dict=None):
+    """ Inverse of encode_value. Each BREP file is read once:
+    shp_dict has the shape of each file
+    """
+    if isinstance(value, dict):
+        if '__vector__' in value:
+            return FreeCAD.Vector(*value['__vector__'])
+        if '__brep__' in value:
+            shp_file = value['__brep__']
+            if shp_file not in shp_dict:
+                shp_dict[shp_file] = Part.read(shp_file)
+            return shp_dict[shp_file]
+        return {key: decode_value(elem, shp_dict)
+                for key, elem in value.items()}
+    if isinstance(value, list):
+        return [decode_value(elem, shp_dict) for elem in value]
+    return value
+
+
+def write_job(job_file, path, module_name, fun_name, args, kwargs,
+              out_file):
+    """ Writes the json file of a job, see the header of the module
+    """
+    job = {'path': path,
+           'module': module_name,
+           'function': fun_name,
+           'args': encode_value(list(args)),
+           'kwargs': encode_value(dict(kwargs)),
+           'out_file': out_file}
+    with open(job_file, 'w') as f_job:
+        json.dump(job, f_job)
+
+
+def write_calls_job(job_file, module_name, fun_name, call_list, out_file,
+                    shp_dir, shp_dict):
+    """ Writes the json file of a job of calls, see the header of the
+    module. The shapes of the arguments are written to BREP files in
+    shp_dir, see encode_value
+
+    Parameters
+    ----------
+    call_list : list of tuples (args, kwargs)
+    """
+    job = {'path': os.path.dirname(os.path.abspath(__file__)),
+           'module': module_name,
+           'function': fun_name,
+           'calls': [encode_value([list(args), dict(kwargs)],
+                                  shp_dir, shp_dict)
+                     for args, kwargs in call_list],
+           'out_file': out_file}
+    with open(job_file, 'w') as f_job:
+        json.dump(job, f_job)
+
+
+def read_calls_out(out_file):
+    """ Returns the list of results of a job of calls """
+    with open(out_file) as f_out:
+        return decode_value(json.load(f_out))
+
+
+def read_error(log_text):
+    """ Returns the first error message of the output of a job, or None
+    """
+    for line in log_text.split('\n'):
+        if line.startswith('ERROR '):
+            return line[6:].strip()
+    return None
+
+
+def message(text):
+    sys.stdout.write(text + '\n')
+    sys.stdout.flush()
+
+
+class _ProgressObserver:
+    """ Document observer that writes a message for each new object """
+
+    def __init__(self):
+        self.n_obj = 0
+
+    def slotCreatedObject(self, obj):
+        self.n_obj += 1
+        message('OBJECT ' + str(self.n_obj) + ' ' + obj.Name)
+
+
+def run_calls_job(job, call_fun):
+    """ Runs the calls of a job and saves the list of results, see the
+    header of the module
+    """
+    shp_dict = {}
+    result_list = []
+    for args, kwargs in job['calls']:
+        result_list.append(encode_value(
+                               call_fun(*decode_value(args, shp_dict),
+                                        **decode_value(kwargs, shp_dict))))
+        message('CALL ' + str(len(result_list)))
+    with open(job['out_file'], 'w') as f_out:
+        json.dump(result_list, f_out)
+    message('DONE')
+
+
+def run_job(job_file):
+    """ Runs the job of the json file, see the header of the module
+    """
+    with open(job_file) as f_job:
+        job = json.load(f_job)
+    if job['path'] not in sys.path:
+        sys.path.append(job['path'])
+    message('STAGE import')
+    fcfun = importlib.import_module('fcfun')
+    build_fun = getattr(importlib.import_module(job['module']),
+                        job['function'])
+    if 'calls' in job:
+        run_calls_job(job, build_fun)
+        return
+    doc = FreeCAD.newDocument('build')
+    observer = _ProgressObserver()
+    FreeCAD.addDocumentObserver(observer)
+    try:
+        message('STAGE build')
+        # one recompute at the end of the build
+        # the document is saved to be copied, it is not undone
+        with fcfun.bulk_insert('build', doc, color_prop=COLOR_PROP,
+                               transaction=0):
+            build_fun(*decode_value(job['args']),
+                      **decode_value(job['kwargs']))
+            message('STAGE recompute')
+    finally:
+        FreeCAD.removeDocumentObserver(observer)
+    message('STAGE save')
+    doc.saveAs(job['out_file'])
+    FreeCAD.closeDocument(doc.Name)
+    message('DONE')
+
+
+def build_shape_file(module_name, fun_name, args=(), kwargs=None, lod=None,
+                     shp_file=None):
+    """ Builds the objects of a function or class of the workbench in a
+    new document, and writes to a BREP file the compound of the shapes
+    of the objects that are not used by other objects (the result of the
+    build). The previews of the panels run it in a FreeCADCmd process
+    (see run_calls and Gui/preview_Gui)
+
+    Parameters
+    ----------
+    module_name, fun_name : str
+        Module and function (or class) to build
+    args, kwargs :
+        Arguments of the function
+    lod : int
+        Level of detail of the document, see shp_clss.set_doc_lod.
+        If None, the default
+    shp_file : str
+        BREP file where the shape is written. If None, a new temporary
+        file, that the caller has to remove
+
+    Returns
+    -------
+    str
+        shp_file
+    """
+    build_fun = getattr(importlib.import_module(module_name), fun_name)
+    if shp_file is None:
+        f_shp, shp_file = tempfile.mkstemp(prefix='maker_shp_',
+                                           suffix='.brep')
+        os.close(f_shp)
+    doc = FreeCAD.newDocument('shp_build')
+    try:
+        if lod is not None:
+            importlib.import_module('shp_clss').set_doc_lod(lod, doc)
+        build_fun(*args, **(kwargs or {}))
+        doc.recompute()
+        shp_list = [Part.getShape(obj) for obj in doc.Objects
+                    if not obj.InList]
+        Part.makeCompound([shp for shp in shp_list
+                           if not shp.isNull()]).exportBrep(shp_file)
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    return shp_file
+
+
+def run_calls(module_name, fun_name, call_list, workers=None):
+    """ Calls a function of the workbench with each of the arguments of
+    call_list, in FreeCADCmd processes that run at the same time.
+    OCC does not release the GIL, so the threads do not run the
+    tessellations and boolean operations in parallel, the processes do.
+    The shapes of the arguments are written once to BREP files, and each
+    process reads them once. The results have to be json types or
+    FreeCAD.Vector.
+    Starting FreeCADCmd takes about a second, so it is worth for long
+    calls. If workers is 1, or FreeCADCmd is not found, the calls are run
+    here, one after the other
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module of the function, it has to be importable
+        without the GUI
+    fun_name : str
+        Name of the function
+    call_list : list of tuples (args, kwargs)
+        Arguments of each call: tuple and dictionary
+    workers : int
+        Maximum number of processes, each one runs consecutive calls.
+        If None, it is the number of processors
+
+    Returns
+    -------
+    list
+        Results of the calls, in the order of call_list
+
+    Raises
+    ------
+    RuntimeError
+        If a process fails
+    """
+
+    call_list = list(call_list)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(call_list))
+    exe_path = find_freecadcmd() if workers > 1 else None
+    if exe_path is None:
+        call_fun = getattr(importlib.import_module(module_name), fun_name)
+        return [call_fun(*args, **kwargs) for args, kwargs in call_list]
+
+    tmp_dir = tempfile.mkdtemp(prefix='maker_calls_')
+    proc_list = []
+    try:
+        shp_dict = {}
+        n_calls = -(-len(call_list) // workers)  # calls of each process
+        for i_proc in range(workers):
+            job_file = os.path.join(tmp_dir, 'job' + str(i_proc) + '.json')
+            out_file = os.path.join(tmp_dir, 'out' + str(i_proc) + '.json')
+            write_calls_job(job_file, module_name, fun_name,
+                            call_list[i_proc * n_calls:
+                                      (i_proc + 1) * n_calls],
+                            out_file, tmp_dir, shp_dict)
+            env = dict(os.environ)
+            env[ENV_JOB] = job_file
+            # the messages go to a file: a pipe could get full
+            with open(os.path.join(tmp_dir, 'log' + str(i_proc) + '.txt'),
+                      'w') as f_log:
+                proc_list.append(subprocess.Popen(
+                                    [exe_path, os.path.abspath(__file__)],
+                                    env=env, stdout=f_log,
+                                    stderr=subprocess.STDOUT))
+        result_list = []
+        for i_proc, proc in enumerate(proc_list):
+            proc.wait()
+            out_file = os.path.join(tmp_dir, 'out' + str(i_proc) + '.json')
+            if proc.returncode != 0 or not os.path.isfile(out_file):
+                with open(os.path.join(tmp_dir, 'log' + str(i_proc)
+                                       + '.txt')) as f_log:
+                    error = read_error(f_log.read())
+                raise RuntimeError(module_name + '.' + fun_name
+                                   + ' failed in FreeCADCmd: '
+                                   + (error or 'exit code '
+                                      + str(proc.returncode)))
+            result_list.extend(read_calls_out(out_file))
+        return result_list
+    finally:
+        for proc in proc_list:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# only when run by the build process, not when imported by the workbench
+# (or by the modules that the build process imports)
+if __name__ == '__main__' and os.environ.get(ENV_JOB):
+    try:
+        run_job(os.environ[ENV_JOB])
+    except Exception:
+        message('ERROR ' + traceback.format_exc().replace('\n', ' | '))
+        sys.exit(1)
+    sys.exit(0)
@@ -36,6 +36,7 @@ import kcomp
 import kcomp_optic
 import fcfun
 import kparts 
+import shp_clss
 
 from fcfun import V0, VX, VY, VZ, V0ROT, addBox, addCyl, addCyl_pos, fillet_len
 from fcfun import VXN, VYN, VZN
@@ -92,11 +93,29 @@ class CageCube (object):
         There are 6 possible orientations:
         Thru-rods can be on X, Y or Z axis
         thru-hole can be on X, Y, or Z axis, but not in the same as thru-rods
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
+    name: str
+        Name of the FreeCAD object
+    lod: int
+        Level of detail, if None, the LOD of the document (see
+        shp_clss.get_lod)
+
+            * LOD_FULL: all the holes and taps
+            * LOD_SIMPLE: only the centered thru-holes
+            * LOD_ENV: the box of the cube
     """
     ROD_SCREWS = kcomp_optic.ROD_SCREWS
     THRU_RODS = kcomp_optic.THRU_RODS
     THRU_HOLE = kcomp_optic.THRU_HOLE  
 
+    # features that are not made at each level of detail
+    lod_drop = {shp_clss.LOD_SIMPLE: ('rod_holes', 'rod_taps', 'cover_taps'),
+                shp_clss.LOD_ENV: ('rod_holes', 'rod_taps', 'cover_taps',
+                                   'center_holes')}
+
     def __init__(self,
                  side_l,
                  thru_hole_d,
@@ -111,10 +130,13 @@ class CageCube (object):
                  tap_sep_s,
                  axis_thru_rods='x',
                  axis_thru_hole='y',
-                 name='cagecube'):
+                 wfco=1,
+                 name='cagecube',
+                 lod=None):
 
         doc = FreeCAD.ActiveDocument
 
+        self.lod = shp_clss.get_lod(lod)
         self.base_place = (0, 0, 0)
         self.side_l = side_l
         self.thru_hole_d = thru_hole_d
@@ -169,7 +191,10 @@ class CageCube (object):
 
         # thru-holes for the rods:
         # dimensions are added to the axis other than the normal
-        fc_list = fcfun.get_fclist_4perp2_vecname(axis_thru_rods)
+        if self.lod_has('rod_holes'):
+            fc_list = fcfun.get_fclist_4perp2_vecname(axis_thru_rods)
+        else:
+            fc_list = []
         for fcvec in fc_list: 
             fc_dist = DraftVecUtils.scale(fcvec, thru_rod_sep/2.)
             shp_thru_hole_rod = fcfun.shp_cylcenxtr(r=thru_rod_d/2.,
@@ -182,7 +207,10 @@ class CageCube (object):
         # taps to connect rods. 4 in 4 sides (not on the side of the thru-holes
         # for the rods
         # get the four directions, of the normals
-        fc_rodtap_list = fcfun.get_fclist_4perp_vecname(axis_thru_rods)
+        if self.lod_has('rod_taps'):
+            fc_rodtap_list = fcfun.get_fclist_4perp_vecname(axis_thru_rods)
+        else:
+            fc_rodtap_list = []
         for vnormal in fc_rodtap_list:
             # for each normal, we take the other 4 perpendicular axis
             # for example, is vnormal is (1,0,0), the 4 perpendicular axis
@@ -204,7 +232,12 @@ class CageCube (object):
 
         # taps for mounting a cover, on the 2 sides of the centered thru-hole
         # direction: self.v_thru_hole and negated
-        for vnormal in [self.v_thru_hole, DraftVecUtils.neg(self.v_thru_hole)]:
+        if self.lod_has('cover_taps'):
+            cover_normal_list = [self.v_thru_hole,
+                                 DraftVecUtils.neg(self.v_thru_hole)]
+        else:
+            cover_normal_list = []
+        for vnormal in cover_normal_list:
             vnormal_coord = DraftVecUtils.scale(vnormal,
                                                 (side_l/2. - tap_l))
             # the large separation is the same as the thru rods
@@ -227,22 +260,39 @@ class CageCube (object):
                                                   pos=fc_coord)
                     holes.append(shp_tap)
 
-        shp_holes = shp_thru_hole_cen0.multiFuse(holes)
-        shp_holes = shp_holes.removeSplitter()
+        if self.lod_has('center_holes'):
+            shp_holes = shp_thru_hole_cen0.multiFuse(holes)
+            shp_holes = shp_holes.removeSplitter()
+            shp_cage = shp_cage_box.cut(shp_holes)
+        else:  # envelope
+            shp_cage = shp_cage_box
 
-        shp_cage = shp_cage_box.cut(shp_holes)
+        self.shp = shp_cage
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_cage = doc.addObject("Part::Feature", name)
+            fco_cage.Shape = shp_cage
+            self.fco = fco_cage
 
-        doc.recompute()
-        fco_cage = doc.addObject("Part::Feature", name)
-        fco_cage.Shape = shp_cage
-        self.fco = fco_cage
+    def lod_has(self, feature):
+        """ Returns True if the feature is made at the level of detail
+        of the cube, see lod_drop
+        """
+        return feature not in self.lod_drop.get(self.lod, ())
 
     def BasePlace(self, position=(0, 0, 0)):
         self.base_place = position
-        self.fco.Placement.Base = FreeCAD.Vector(position)
+        if self.wfco == 1:
+            self.fco.Placement.Base = FreeCAD.Vector(position)
+        else:
+            self.shp.Placement.Base = FreeCAD.Vector(position)
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
     def vec_face(self, fcv):
         """Return which face of the cube corresponds to the direction fcv
@@ -296,8 +346,10 @@ class CageCube (object):
 def f_cagecube(d_cagecube,
                axis_thru_rods='x',
                axis_thru_hole='y',
+               wfco=1,
                name='cagecube',
-               toprint_tol=0):
+               toprint_tol=0,
+               lod=None):
 
     """ 
     Creates a cage cube, it creates from a dictionary
@@ -319,12 +371,21 @@ def f_cagecube(d_cagecube,
         Thru-rods can be on X, Y or Z axis
         thru-hole can be on X, Y, or Z axis, but not in the same as thru-rods
 
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (attribute .shp)
+
     toprint_tol: float
         
         * 0, dimensions as they are.
         * >0 value of tolerances of the holes.
           multiplies the normal tolerance in kcomp.TOL
 
+    lod: int
+        Level of detail, see CageCube. If toprint_tol > 0 it is always
+        shp_clss.LOD_FULL
+
     Returns
     -------
         CageCube. The freeCAD object can be accessed by the
@@ -334,6 +395,7 @@ def f_cagecube(d_cagecube,
     if toprint_tol > 0:
         tol = toprint_tol * kcomp.TOL
         tol_plus = 1.5 * toprint_tol * kcomp.TOL
+        lod = shp_clss.LOD_FULL  # it is going to be printed
     else:
         tol = 0
         tol_plus = 0
@@ -354,7 +416,9 @@ def f_cagecube(d_cagecube,
                     tap_sep_s=d_cagecube['tap_sep_s'],
                     axis_thru_rods=axis_thru_rods,
                     axis_thru_hole=axis_thru_hole,
-                    name=name)
+                    wfco=wfco,
+                    name=name,
+                    lod=lod)
 
     return cage
 
@@ -426,6 +490,10 @@ class CageCubeHalf (object):
         There are 24 possible orientations:
         6 possible axis_1 and 4 axis_2 for each axis_1
     
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
     name: str
         Name of the freecad object
     """
@@ -446,6 +514,7 @@ class CageCubeHalf (object):
                  tap_dist,
                  axis_1='x',
                  axis_2='y',
+                 wfco=1,
                  name='cagecube'):
 
         doc = FreeCAD.ActiveDocument
@@ -486,7 +555,6 @@ class CageCubeHalf (object):
                                     normal=v_halfout,
                                     pos=pos_halfout)
       
-        doc.recompute()
         # Part.show(shp_halfout)
 
         # hole on the 45 face, for the lense
@@ -502,7 +570,6 @@ class CageCubeHalf (object):
         shp_45cut = shp_halfout.fuse(shp_lensehole)
         shp_cage_half = shp_cage_box.cut(shp_45cut)
         shp_cage_half = shp_cage_half.removeSplitter()
-        doc.recompute()
         # Part.show(shp_cage_half)
    
         holes = []
@@ -590,27 +657,36 @@ class CageCubeHalf (object):
 
         shp_holes = shp_thread_1.multiFuse(holes)
         shp_holes = shp_holes.removeSplitter()
-        doc.recompute()
         # Part.show(shp_holes)
 
         shp_cage_holes = shp_cage_half.cut(shp_holes)
 
-        doc.recompute()
-        fco_cage = doc.addObject("Part::Feature", name)
-        fco_cage.Shape = shp_cage_holes
-        self.fco = fco_cage
+        self.shp = shp_cage_holes
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_cage = doc.addObject("Part::Feature", name)
+            fco_cage.Shape = shp_cage_holes
+            self.fco = fco_cage
 
     def BasePlace(self, position=(0, 0, 0)):
         self.base_place = position
-        self.fco.Placement.Base = FreeCAD.Vector(position)
+        if self.wfco == 1:
+            self.fco.Placement.Base = FreeCAD.Vector(position)
+        else:
+            self.shp.Placement.Base = FreeCAD.Vector(position)
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 
 def f_cagecubehalf(d_cagecubehalf,
                    axis_1='x',
                    axis_2='y',
+                   wfco=1,
                    name='cagecubehalf'):
 
     """ 
@@ -635,6 +711,11 @@ def f_cagecubehalf(d_cagecubehalf,
         There are 24 possible orientations:
         6 possible axis_1 and 4 axis_2 for each axis_1
     
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (attribute .shp)
+
     name: str
         Name of the freecad object
 
@@ -655,6 +736,7 @@ def f_cagecubehalf(d_cagecubehalf,
                         tap_dist=d_cagecubehalf['tap_dist'],
                         axis_1=axis_1,
                         axis_2=axis_2,
+                        wfco=wfco,
                         name=name)
 
     return cage
@@ -728,6 +810,10 @@ class Lb1cPlate (object):
         Position of the center. The center is on the 
         center of the plate, but on the axis_h can be in either side
         depending on ref_in
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
     name: str
         Name 
 
@@ -739,6 +825,7 @@ class Lb1cPlate (object):
                  fc_axis_l=VX,
                  ref_in=1,
                  pos=V0,
+                 wfco=1,
                  name='lb1c_plate'):
 
         doc = FreeCAD.ActiveDocument
@@ -834,13 +921,19 @@ class Lb1cPlate (object):
         shp_holes = shp_cenhole.multiFuse(holes)
 
         shp_plate = shp_box.cut(shp_holes)
-        doc.recompute()
-        fco_plate = doc.addObject("Part::Feature", name)
-        fco_plate.Shape = shp_plate
-        self.fco = fco_plate
+        self.shp = shp_plate
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_plate = doc.addObject("Part::Feature", name)
+            fco_plate.Shape = shp_plate
+            self.fco = fco_plate
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 # doc = FreeCAD.newDocument()
 # doc = FreeCAD.ActiveDocument
@@ -1085,6 +1178,10 @@ class Lb2cPlate (object):
         center of the plate, but on the axis_h can be in either side
         depending on ref_in
 
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
     name: str
         Name 
     
@@ -1095,6 +1192,7 @@ class Lb2cPlate (object):
                  fc_axis_l,
                  cl=1, cw=1, ch=0,
                  pos=V0,
+                 wfco=1,
                  name='lb2c_plate'):
 
         doc = FreeCAD.ActiveDocument
@@ -1134,17 +1232,26 @@ class Lb2cPlate (object):
         self.pos = pos
         self.name = name
 
-        doc.recompute()
-        fco_plate = doc.addObject("Part::Feature", name)
-        fco_plate.Shape = shp_plate
-        self.fco = fco_plate
+        self.shp = shp_plate
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_plate = doc.addObject("Part::Feature", name)
+            fco_plate.Shape = shp_plate
+            self.fco = fco_plate
 
     def BasePlace(self, position=(0, 0, 0)):
         self.base_place = position
-        self.fco.Placement.Base = FreeCAD.Vector(position)
+        if self.wfco == 1:
+            self.fco.Placement.Base = FreeCAD.Vector(position)
+        else:
+            self.shp.Placement.Base = FreeCAD.Vector(position)
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 # doc = FreeCAD.newDocument()
 # doc = FreeCAD.ActiveDocument
@@ -1347,7 +1454,6 @@ class PlateThruholeMhole (object):
             shp_box = fcfun.shp_filletchamfer_dir(shp_box, axis_h,
                                                   fillet=0, radius=chmf_r)
 
-        doc.recompute()
 
         # getting the offset of the center coordinates
         if cm == 1:
@@ -1981,6 +2087,10 @@ class SM1TubelensSm2 (object):
         * 1: if there is ring
         * 0: there is no ring, so just the thread, at it is not drawn
 
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
     name: str
         Name of the freecad object
     """
@@ -1991,6 +2101,7 @@ class SM1TubelensSm2 (object):
                  ref_sm1=1,
                  pos=V0,
                  ring=1,
+                 wfco=1,
                  name='tubelens_sm1_sm2'):
 
         doc = FreeCAD.ActiveDocument
@@ -2043,17 +2154,26 @@ class SM1TubelensSm2 (object):
                                                   normal=fc_axis,
                                                   pos=pos)
 
-        doc.recompute()
-        fco_sm1_tube_sm2 = doc.addObject("Part::Feature", name)
-        fco_sm1_tube_sm2.Shape = shp_sm1_tube_sm2
-        self.fco = fco_sm1_tube_sm2
+        self.shp = shp_sm1_tube_sm2
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_sm1_tube_sm2 = doc.addObject("Part::Feature", name)
+            fco_sm1_tube_sm2.Shape = shp_sm1_tube_sm2
+            self.fco = fco_sm1_tube_sm2
 
     def BasePlace(self, position=(0, 0, 0)):
         self.base_place = position
-        self.fco.Placement.Base = FreeCAD.Vector(position)
+        if self.wfco == 1:
+            self.fco.Placement.Base = FreeCAD.Vector(position)
+        else:
+            self.shp.Placement.Base = FreeCAD.Vector(position)
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 
 # ---------------------- ThLed30 --------------------------
@@ -2096,6 +2216,10 @@ class ThLed30 (object):
         axis on the direction of the cable
     pos: FreeCAD.Vector
         Placement of the object
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
     name: str
         Object name
                                 
@@ -2105,6 +2229,7 @@ class ThLed30 (object):
                  fc_axis=VY,
                  fc_axis_cable=VZN,
                  pos=V0,
+                 wfco=1,
                  name='thled30'):
 
         self.fc_axis = fc_axis
@@ -2167,13 +2292,19 @@ class ThLed30 (object):
         fuse_list.append(shp_cable)
         shp_led = shp_cyl_body.multiFuse(fuse_list)
 
-        doc.recompute()
-        fco_led = doc.addObject("Part::Feature", name)
-        fco_led.Shape = shp_led
-        self.fco = fco_led
+        self.shp = shp_led
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_led = doc.addObject("Part::Feature", name)
+            fco_led.Shape = shp_led
+            self.fco = fco_led
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 # doc = FreeCAD.newDocument()
 # doc = FreeCAD.ActiveDocument
@@ -2233,19 +2364,22 @@ class PrizLed (object):
         indicating to keep clear
     pos: FreeCAD.Vector
         Position of the LED, on the center of the SM1 thread
+    wfco: int
+        
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (self.shp), the document is not used
     name: str
         Object name
     """
 
     def __init__(self, fc_axis_led=VX, fc_axis_clear=VZN,
-                 pos=V0, name='prizmatix_led'):
+                 pos=V0, wfco=1, name='prizmatix_led'):
 
         self.fc_axis_led = fc_axis_led
         self.fc_axis_clear = fc_axis_clear
         self.pos = pos
         self.d_led = kcomp_optic.PRIZ_UHP_LED  # the dictionary
         doc = FreeCAD.ActiveDocument
-        doc.recompute() 
 
         d_led = kcomp_optic.PRIZ_UHP_LED
 
@@ -2379,14 +2513,20 @@ class PrizLed (object):
         shp_holes = shp_cyl_sm1.multiFuse(threadholes_list)
 
         shp_block = shp_block.cut(shp_holes)
-        doc.recompute() 
 
-        fco_prizled = doc.addObject("Part::Feature", name)
-        fco_prizled.Shape = shp_block
-        self.fco = fco_prizled
+        self.shp = shp_block
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_prizled = doc.addObject("Part::Feature", name)
+            fco_prizled.Shape = shp_block
+            self.fco = fco_prizled
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 # doc = FreeCAD.newDocument()
 # doc = FreeCAD.ActiveDocument
@@ -2418,6 +2558,7 @@ class BreadBoard (object):
                  fc_dir_h=VZ,
                  fc_dir_w=VY,
                  pos=V0,
+                 wfco=1,
                  name='breadboard'):
 
         doc = FreeCAD.ActiveDocument
@@ -2561,13 +2702,19 @@ class BreadBoard (object):
 
         allholes = cboresholes.multiFuse(tapholes)
         shp_breadboard = shp_box.cut(allholes)
-        doc.recompute()
-        fco_breadboard = doc.addObject("Part::Feature", name)
-        fco_breadboard.Shape = shp_breadboard
-        self.fco = fco_breadboard
+        self.shp = shp_breadboard
+        self.wfco = wfco
+        if wfco == 1:
+            # a freeCAD object is created
+            fco_breadboard = doc.addObject("Part::Feature", name)
+            fco_breadboard.Shape = shp_breadboard
+            self.fco = fco_breadboard
 
     def color(self, color=(1, 1, 1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
 
 def f_breadboard(d_breadboard,
@@ -2579,6 +2726,7 @@ def f_breadboard(d_breadboard,
                  fc_dir_h=VZ,
                  fc_dir_w=VY,
                  pos=V0,
+                 wfco=1,
                  name='breadboard'
                  ):
     """
@@ -2606,6 +2754,9 @@ def f_breadboard(d_breadboard,
         Vector with the direction of the width
     pos: FreeCAD.Vector
         Placement of the model
+    wfco: int
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created (attribute .shp)
     name: str
         object name
     
@@ -2637,7 +2788,8 @@ def f_breadboard(d_breadboard,
                             fc_dir_h=fc_dir_h,
                             fc_dir_w=fc_dir_w,
                             pos=pos,
-                            name='breadboard')
+                            wfco=wfco,
+                            name=name)
 
     return breadboard
 
@@ -2655,3 +2807,96 @@ def f_breadboard(d_breadboard,
 #              pos = V0,
 #              name = 'breadboard'
 #              )
+
+
+# ---------------------- Shapes of the components -------------------------
+# The f_ functions can make the components without the document (wfco=0),
+# the shapes are cached by the name of the kcomp_optic dictionary and the
+# arguments, so the same component (e.g. CAGE_CUBE_60) is made just once.
+# Then add_fco inserts them in the document
+
+# {(function name, kcomp_optic key, arguments): component with wfco=0}
+_comp_dict = {}
+
+
+def _key_arg(arg):
+    """ Returns a hashable value of an argument, to be part of the key """
+    if isinstance(arg, FreeCAD.Vector):
+        return tuple(round(coord, 9) for coord in arg)
+    return arg
+
+
+def shp_comp(f_comp, d_key, pos=V0, **kwargs):
+    """
+    Returns the shape of an optical component made by a function of this
+    module that takes a kcomp_optic dictionary as its first argument
+    (f_cagecube, f_cagecubehalf, f_breadboard, lcp01m_plate, lcpb1m_base).
+    The document is not used, so it can be used to make the shapes of
+    many components before inserting them (see add_fco).
+    The components are cached by the function, d_key, kwargs and the
+    level of detail (the lod argument, or the LOD of the active document
+    if it is not given, see shp_clss.get_lod), the shape returned is a
+    copy, moved pos
+
+    Parameters
+    ----------
+    f_comp: function
+        Function that makes the component, it has to have the wfco argument
+    d_key: str
+        Name of the dictionary in kcomp_optic, e.g. 'CAGE_CUBE_60'
+    pos: FreeCAD.Vector
+        Vector to move the shape
+    kwargs:
+        Other arguments of f_comp, but not wfco and name
+
+    Returns
+    -------
+    Shape
+        Copy of the shape of the component
+
+    Example
+    -------
+    shp_cube = shp_comp(f_cagecube, 'CAGE_CUBE_60',
+                        axis_thru_rods='z', axis_thru_hole='x')
+    add_fco(shp_cube, 'cube60')
+    """
+
+    key = ((f_comp.__name__, d_key, shp_clss.get_lod(kwargs.get('lod')))
+           + tuple(sorted((arg_name, _key_arg(arg))
+                          for arg_name, arg in kwargs.items()
+                          if arg_name != 'lod')))
+    comp = _comp_dict.get(key)
+    if comp is None:
+        comp = f_comp(getattr(kcomp_optic, d_key), wfco=0, **kwargs)
+        _comp_dict[key] = comp
+    shp = comp.shp.copy()
+    if pos != V0:
+        shp.translate(pos)
+    return shp
+
+
+def add_fco(shp, name, color=None):
+    """
+    Inserts a shape in the active document, as a Part::Feature
+
+    Parameters
+    ----------
+    shp: Shape
+        Shape of the component, e.g. from shp_comp
+    name: str
+        Name of the FreeCAD object
+    color: tuple
+        Color of the object, if None, the default
+
+    Returns
+    -------
+    FreeCAD Object
+        The Part::Feature created
+    """
+
+    doc = FreeCAD.ActiveDocument
+    fco = doc.addObject("Part::Feature", name)
+    fco.Shape = shp
+    if color is not None:
+        fco.ViewObject.ShapeColor = color
+    return fco
@@ -955,13 +955,8 @@ class AluProf(object):
 
         fcvec_axis = self.fcvec_axis
 
-        # vectors of the points
-        vecpoints = fcfun.aluprof_vec(width, thick, slot, insquare)
         doc.recompute()
 
-        # wire Face
-        wire_aluprof = fcfun.wire_sim_xy(vecpoints)
-
         # if it is not centered on X, and the axis doesn't go along X
         if cx == 0 and axis != 'x':
             posx = width / 2.
@@ -995,24 +990,14 @@ class AluProf(object):
         pos = FreeCAD.Vector(posx, posy, posz)  # Position
         vec_axis = fcfun.getfcvecofname(axis)
 
-        face_ext = Part.Face(wire_aluprof)
-        # since vec2 of calc_rot is referenced to VNZ, vec_facenomal is negated
-        vec_naxis = DraftVecUtils.neg(vec_axis)
-        vrot = fcfun.fc_calc_rot(V0, vec_naxis)
-        face_ext.Placement.Rotation = vrot
-        face_ext.Placement.Base = pos
-
-        # inner hole
-        if indiam > 0:
-            hole = Part.makeCircle(indiam / 2.,  # Radius
-                                   pos,  # Position
-                                   vec_axis)  # direction
-            wire_hole = Part.Wire(hole)
-            face_hole = Part.Face(wire_hole)
-
-            face_profile = face_ext.cut(face_hole)
-        else:
-            face_profile = face_ext
+        # the profile is symmetric, any perpendicular axes are the same
+        vec_axis_x = fcfun.get_fc_perpend1(vec_axis)
+        face_profile = fcfun.shp_aluface_dir(width, thick, slot, insquare,
+                                             indiam,
+                                             fc_axis_x=vec_axis_x,
+                                             fc_axis_y=vec_axis.cross(
+                                                           vec_axis_x),
+                                             pos=pos)
 
         shp_profile = fcfun.shp_extrud_face(face=face_profile,
                                             length=length,
@@ -1229,24 +1214,13 @@ class AluProf_dir(object):
 
         basecen_pos = base_pos + ref2center_w + ref2center_p
 
-        shp_alu_wire = fcfun.shp_aluwire_dir(width, thick, slot, insquare,
+        # face with the inner hole, cached
+        shp_alu_face = fcfun.shp_aluface_dir(width, thick, slot, insquare,
+                                             indiam,
                                              fc_axis_x=axis_w,
                                              fc_axis_y=axis_p,
-                                             ref_x=1,  # already centered
-                                             ref_y=1,  # already centered
                                              pos=basecen_pos)
 
-        # make a face of the wire
-        shp_alu_face = Part.Face(shp_alu_wire)
-        # inner hole
-        if indiam > 0:
-            hole = Part.makeCircle(indiam / 2.,  # Radius
-                                   basecen_pos,  # Position
-                                   axis_l)  # direction
-            wire_hole = Part.Wire(hole)
-            face_hole = Part.Face(wire_hole)
-            shp_alu_face = shp_alu_face.cut(face_hole)
-
         # extrude it
         dir_extrud = DraftVecUtils.scaleTo(axis_l, length + xtr_nl + xtr_l)
         shp_aluprof = shp_alu_face.extrude(dir_extrud)
@@ -1328,6 +1302,58 @@ def getaluprof_dir(aludict, length,
     return h_aluprof
 
 
+def getaluprof_list(aludict, length_list,
+                    fc_axis_l=VX, fc_axis_w=VY, fc_axis_p=V0,
+                    pos_list=None, name="aluprof"):
+    """ Creates many aluminum profiles of the same kind and orientation,
+    but different lengths, in one call. The cross-section is made once
+    (fcfun.shp_aluface_dir) and each distinct length is extruded once
+
+    Parameters
+    ----------
+    aludict : dictionary
+        Dictionary of the aluminum profile, from kcomp.py
+    length_list : list of float
+        Lengths of the profiles
+    fc_axis_l : FreeCAD.Vector
+        Axis along the length of the profiles
+    fc_axis_w : FreeCAD.Vector
+        Axis along the width of the profiles
+    fc_axis_p : FreeCAD.Vector
+        Axis along the other width, if V0: fc_axis_l x fc_axis_w
+    pos_list : list of FreeCAD.Vector
+        Position of the center of the start of each profile
+        (ref_l=0, ref_w=1, ref_p=1 of AluProf_dir). If None, at the origin
+    name : str
+        Base name of the FreeCAD objects
+
+    Returns
+    -------
+    list of FreeCAD objects
+        The profiles, in the same order as length_list
+    """
+    doc = FreeCAD.ActiveDocument
+    shp_list = fcfun.shp_aluprof_lengths(width=aludict['w'],
+                                         thick=aludict['t'],
+                                         slot=aludict['slot'],
+                                         insquare=aludict['insq'],
+                                         indiam=aludict['indiam'],
+                                         length_list=length_list,
+                                         fc_axis_l=fc_axis_l,
+                                         fc_axis_x=fc_axis_w,
+                                         fc_axis_y=fc_axis_p,
+                                         pos_list=pos_list)
+    fco_list = []
+    for shp_aluprof in shp_list:
+        fco_aluprof = doc.addObject("Part::Feature", name)
+        fco_aluprof.Shape = shp_aluprof
+        if fco_aluprof.ViewObject is not None:
+            fco_aluprof.ViewObject.LineColor = (0.5, 0.5, 0.5)
+            fco_aluprof.ViewObject.LineWidth = 1.
+        fco_list.append(fco_aluprof)
+    return fco_list
+
+
 # doc =FreeCAD.newDocument()
 # h_aluprof = getaluprof_dir(aludict= kcomp.ALU_MOTEDIS_20I5,
 #                         length=50, 
@@ -1473,15 +1499,25 @@ class ShpAluProf(shp_clss.Obj3D):
          |______|  |______| ....thick
                   0   1 2 3   pos_w = pos_h
    
+    lod : int
+        Level of detail, if None, the LOD of the document (see
+        shp_clss.get_lod)
+            * LOD_FULL: all the features
+            * LOD_SIMPLE: outer square with the slots, no inner square or hole
+            * LOD_ENV: a box of width x width x total length
    
     """
 
+    lod_drop = {shp_clss.LOD_SIMPLE: ('profile',),
+                shp_clss.LOD_ENV: ('profile', 'slots')}
+
     def __init__(self, width, depth, thick, slot,
                  insquare, indiam,
                  xtr_d=0, xtr_nd=0,
                  axis_d=VX, axis_w=VY, axis_h=V0,
                  pos_d=0, pos_w=0, pos_h=0,
-                 pos=V0):
+                 pos=V0,
+                 lod=None):
 
         # either axis_w or axis_h can be V0, but not both
         if (axis_w is None) or (axis_w == V0):
@@ -1496,6 +1532,7 @@ class ShpAluProf(shp_clss.Obj3D):
             axis_h = axis_d.cross(axis_w)
 
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
+        self.set_lod(lod)
 
         # save the arguments as attributes:
         frame = inspect.currentframe()
@@ -1538,23 +1575,26 @@ class ShpAluProf(shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-        shp_alu_wire = fcfun.shp_aluwire_dir(width, thick, slot, insquare,
-                                             fc_axis_x=self.axis_w,
-                                             fc_axis_y=self.axis_h,
-                                             ref_x=1,  # pos_o is centered
-                                             ref_y=1,  # pos_o is centered
-                                             pos=self.pos_o)
-
-        # make a face of the wire
-        shp_alu_face = Part.Face(shp_alu_wire)
-        # inner hole
-        if indiam > 0:
-            hole = Part.makeCircle(indiam / 2.,  # Radius
-                                   self.pos_o,  # Position
-                                   self.axis_d)  # direction
-            wire_hole = Part.Wire(hole)
-            face_hole = Part.Face(wire_hole)
-            shp_alu_face = shp_alu_face.cut(face_hole)
+        if self.lod_has('profile'):
+            # face with the inner hole, cached
+            shp_alu_face = fcfun.shp_aluface_dir(width, thick, slot, insquare,
+                                                 indiam,
+                                                 fc_axis_x=self.axis_w,
+                                                 fc_axis_y=self.axis_h,
+                                                 pos=self.pos_o)
+        elif self.lod_has('slots'):
+            shp_alu_wire = fcfun.shp_aluwire_simple_dir(
+                width, thick, slot,
+                fc_axis_x=self.axis_w,
+                fc_axis_y=self.axis_h,
+                ref_x=1, ref_y=1,
+                pos=self.pos_o)
+            shp_alu_face = Part.Face(shp_alu_wire)
+        else:  # envelope: square
+            corner_list = [self.get_pos_dwh(0, w_i, h_i)
+                           for w_i, h_i in ((3, 3), (3, -3), (-3, -3), (-3, 3))]
+            shp_alu_wire = Part.makePolygon(corner_list + corner_list[:1])
+            shp_alu_face = Part.Face(shp_alu_wire)
 
         # extrude it
         dir_extrud = DraftVecUtils.scaleTo(self.axis_d, self.tot_d)
@@ -1622,6 +1662,8 @@ class PartAluProf(fc_clss.SinglePart, ShpAluProf):
 
     name : str
         Name of the object
+    lod : int
+        Level of detail, see ShpAluProf
 
     """
 
@@ -1632,7 +1674,8 @@ class PartAluProf(fc_clss.SinglePart, ShpAluProf):
                  pos_d=0, pos_w=0, pos_h=0,
                  pos=V0,
                  model_type=1,  # dimensional model
-                 name=''):
+                 name='',
+                 lod=None):
 
         default_name = ('aluprof_w' + str(int(aluprof_dict['w']))
                         + 'l_' + str(int(xtr_nd + depth + xtr_d)))
@@ -1651,7 +1694,8 @@ class PartAluProf(fc_clss.SinglePart, ShpAluProf):
                             axis_w=axis_w,
                             axis_h=axis_h,
                             pos_d=pos_d, pos_w=pos_w, pos_h=pos_h,
-                            pos=pos)
+                            pos=pos,
+                            lod=lod)
 
         # creation of the part
         fc_clss.SinglePart.__init__(self)
@@ -2086,11 +2130,21 @@ class ShpNemaMotor(shp_clss.Obj3D):
 
     pos : FreeCAD.Vector
         Position of the motor, at the point defined by pos_d, pos_w, pos_h
+    lod : int
+        Level of detail, if None, the LOD of the document (see
+        shp_clss.get_lod). If cut_extra > 0, it is always LOD_FULL
+            * LOD_FULL: all the features
+            * LOD_SIMPLE: no bolt holes, no chamfer
+            * LOD_ENV: the base box and the shaft, not fused
 
     Attributes:
     ----------
     """
 
+    lod_drop = {shp_clss.LOD_SIMPLE: ('bolt_holes', 'chamfer'),
+                shp_clss.LOD_ENV: ('bolt_holes', 'chamfer', 'circle',
+                                   'rear_shaft', 'fuse')}
+
     def __init__(self,
                  nema_size=17,
                  base_l=32.,
@@ -2109,12 +2163,16 @@ class ShpNemaMotor(shp_clss.Obj3D):
                  pos_d=0,
                  pos_w=0,
                  pos_h=1,
-                 pos=V0):
+                 pos=V0,
+                 lod=None):
 
         if (axis_w is None) or (axis_w == V0):
             axis_w = axis_h.cross(axis_d)
 
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
+        if cut_extra > 0:  # shape to cut, it needs all the features
+            lod = shp_clss.LOD_FULL
+        self.set_lod(lod)
 
         # save the arguments as attributes:
         frame = inspect.currentframe()
@@ -2189,9 +2247,10 @@ class ShpNemaMotor(shp_clss.Obj3D):
                                      cw=1, cd=1, ch=0,
                                      pos=self.get_pos_h(4))
 
-        shp_base = fcfun.shp_filletchamfer_dir(shp_base, self.axis_h,
-                                               fillet=0, radius=chmf_r)
-        shp_base = shp_base.removeSplitter()
+        if self.lod_has('chamfer'):
+            shp_base = fcfun.shp_filletchamfer_dir(shp_base, self.axis_h,
+                                                   fillet=0, radius=chmf_r)
+            shp_base = shp_base.removeSplitter()
 
         fuse_list = []
         holes_list = []
@@ -2200,6 +2259,8 @@ class ShpNemaMotor(shp_clss.Obj3D):
         for pt_d in (-3, 3):
             for pt_w in (-3, 3):
                 if cut_extra == 0:  # there will be holes for the bolts
+                    if not self.lod_has('bolt_holes'):
+                        continue
                     # pos_h=3 is at the end of the hole for the bolts
                     bolt_pos = self.get_pos_dwh(pt_d, pt_w, 3)
                     shp_hole = fcfun.shp_cylcenxtr(r=self.nemabolt_r,
@@ -2222,7 +2283,7 @@ class ShpNemaMotor(shp_clss.Obj3D):
                                                    pos=bolt_pos)
                     fuse_list.append(shp_hole)
 
-        if cut_extra == 0:
+        if cut_extra == 0 and self.lod_has('bolt_holes'):
             shp_holes = fcfun.fuseshplist(holes_list)
             shp_base = shp_base.cut(shp_holes)
             shp_base = shp_base.removeSplitter()
@@ -2230,7 +2291,7 @@ class ShpNemaMotor(shp_clss.Obj3D):
         # -------- circle (flat cylinder) at the base of the shaft
         # could add cut_extra to circle_h or circle_r, but it can be 
         # set in the arguments
-        if circle_r > 0 and circle_h > 0:
+        if circle_r > 0 and circle_h > 0 and self.lod_has('circle'):
             shp_circle = fcfun.shp_cylcenxtr(r=circle_r,
                                              h=circle_h,
                                              normal=self.axis_h,
@@ -2252,7 +2313,7 @@ class ShpNemaMotor(shp_clss.Obj3D):
                                         pos=self.pos_o)
         fuse_list.append(shp_shaft)
 
-        if rear_shaft_l > 0:
+        if rear_shaft_l > 0 and self.lod_has('rear_shaft'):
             shp_rearshaft = fcfun.shp_cylcenxtr(r=self.shaft_r,
                                                 h=self.rear_shaft_l,
                                                 normal=self.axis_h,
@@ -2263,8 +2324,11 @@ class ShpNemaMotor(shp_clss.Obj3D):
 
             fuse_list.append(shp_rearshaft)
 
-        shp_motor = shp_base.multiFuse(fuse_list)
-        shp_motor = shp_motor.removeSplitter()
+        if self.lod_has('fuse'):
+            shp_motor = shp_base.multiFuse(fuse_list)
+            shp_motor = shp_motor.removeSplitter()
+        else:
+            shp_motor = Part.makeCompound([shp_base] + fuse_list)
         self.shp = shp_motor
 
 
@@ -2303,7 +2367,8 @@ class PartNemaMotor(fc_clss.SinglePart, ShpNemaMotor):
                  pos_w=0,
                  pos_h=0,
                  pos=V0,
-                 name=''):
+                 name='',
+                 lod=None):
 
         default_name = 'nema' + str(nema_size) + '_motor_l' + str(int(base_l))
         self.set_name(name, default_name, change=0)
@@ -2326,7 +2391,8 @@ class PartNemaMotor(fc_clss.SinglePart, ShpNemaMotor):
                               pos_d=pos_d,
                               pos_w=pos_w,
                               pos_h=pos_h,
-                              pos=pos)
+                              pos=pos,
+                              lod=lod)
 
         # Second, the part is created
         fc_clss.SinglePart.__init__(self)
@@ -3045,6 +3111,112 @@ class FlexCoupling(object):
 
 # ---------------------- LinGuide -----------------------------------
 
+# The rails are made by shp_lgrail_dir, that caches the section of the rail
+# and the bolt hole tool for each rail dimensions and orientation, and the
+# rails for each length, so rails of the same length are made once
+
+# {(rail_w, rail_h, bolt_wsep, bolt_d, bolth_d, bolth_h, axes):
+#  (face of the section, list of the bolt hole tools)}
+_lgrailsec_dict = {}
+# {(key of _lgrailsec_dict, rail_d, bolt_lsep, boltend_sep, nbolt_l): rail}
+_lgrail_dict = {}
+
+
+def shp_lgrail_dir(rail_d, rail_w, rail_h,
+                   bolt_lsep, bolt_wsep, bolt_d,
+                   bolth_d, bolth_h, boltend_sep, nbolt_l,
+                   axis_d=VX, axis_w=V0, axis_h=VZ,
+                   pos=V0, plain=0):
+    """ Returns the shape of a linear guide rail, with its bolt holes.
+    The section of the rail and the bolt hole tool are made once for
+    each rail dimensions and orientation, and the holes are placed along
+    axis_d as a linear pattern, cut in one boolean. The rails are cached
+    by their length, the shape returned is a copy.
+    See ShpLinGuideRail for the drawing and the parameters
+
+    Parameters
+    ----------
+    boltend_sep : float
+        Separation from the beginning of the rail to the first bolt
+    nbolt_l : int
+        Number of bolt holes (or pairs of holes) along axis_d
+    pos : FreeCAD.Vector
+        Position of the beginning of the rail, at the bottom, centered
+        on axis_w (pos_d = 0, pos_w = 0, pos_h = 0 in ShpLinGuideRail)
+    plain : int
+        1: the rail without the bolt holes (the section extruded)
+        0: the rail with the bolt holes
+
+    Returns
+    -------
+    Shape
+        Shape of the rail
+    """
+
+    axis_d = DraftVecUtils.scaleTo(axis_d, 1)
+    axis_h = DraftVecUtils.scaleTo(axis_h, 1)
+    if (axis_w is None) or (axis_w == V0):
+        axis_w = axis_h.cross(axis_d)
+    axis_w = DraftVecUtils.scaleTo(axis_w, 1)
+    sec_key = ((rail_w, rail_h, bolt_wsep, bolt_d, bolth_d, bolth_h)
+               + tuple(tuple(round(coord, 9) for coord in axis)
+                       for axis in (axis_d, axis_w, axis_h)))
+    if plain == 1:
+        rail_key = sec_key + (rail_d,)
+    else:
+        rail_key = sec_key + (rail_d, bolt_lsep, boltend_sep, nbolt_l)
+    shp_rail = _lgrail_dict.get(rail_key)
+    if shp_rail is None:
+        sec = _lgrailsec_dict.get(sec_key)
+        if sec is None:
+            wire_rail = fcfun.wire_lgrail(rail_w=rail_w, rail_h=rail_h,
+                                          axis_w=axis_w, axis_h=axis_h,
+                                          pos_w=0, pos_h=0, pos=V0)
+            if bolt_wsep == 0:  # just one bolt
+                bolt_w_list = [V0]
+            else:
+                bolt_w_list = [DraftVecUtils.scale(axis_w, bolt_wsep / 2.),
+                               DraftVecUtils.scale(axis_w, -bolt_wsep / 2.)]
+            bolt_list = [fcfun.shp_bolt_dir(r_shank=bolt_d / 2.,
+                                            l_bolt=rail_h,
+                                            r_head=bolth_d / 2.,
+                                            l_head=bolth_h,
+                                            xtr_head=1, xtr_shank=1,
+                                            support=0,
+                                            fc_normal=axis_h.negative(),
+                                            pos_n=0,
+                                            pos=(bolt_w
+                                                 + DraftVecUtils.scale(
+                                                     axis_h, rail_h)))
+                         for bolt_w in bolt_w_list]
+            sec = (Part.Face(wire_rail), bolt_list)
+            _lgrailsec_dict[sec_key] = sec
+        shp_face_rail, bolt_list = sec
+        shp_plainrail = shp_face_rail.extrude(
+                                      DraftVecUtils.scale(axis_d, rail_d))
+        # linear pattern of the bolt holes
+        holes_list = []
+        if plain == 1:
+            nbolt_l = 0
+        for i in range(0, int(nbolt_l)):
+            vec_bolt = DraftVecUtils.scale(axis_d,
+                                           boltend_sep + i * bolt_lsep)
+            for shp_bolt in bolt_list:
+                shp_hole = shp_bolt.copy()
+                shp_hole.translate(vec_bolt)
+                holes_list.append(shp_hole)
+        if holes_list:
+            # the holes don't overlap: one boolean with all of them
+            shp_rail = shp_plainrail.cut(holes_list)
+            shp_rail = shp_rail.removeSplitter()
+        else:
+            shp_rail = shp_plainrail
+        _lgrail_dict[rail_key] = shp_rail
+    shp_rail = shp_rail.copy()
+    if pos != V0:
+        shp_rail.translate(pos)
+    return shp_rail
+
 # ---------------------- LinGuideRail -------------------------------
 # Makes the Rail of a linear guide
 # Arguments:
@@ -3078,7 +3250,7 @@ class FlexCoupling(object):
 # Attributes:
 # The Arguments and:
 # ###shp_face_rail : the shape of the face of the section of the rail
-# shp_plainrail : the shape of the plain rail
+# shp_plainrail : the shape of the plain rail, made when it is asked
 # nbolt_l : number of bolts lines (can be pairs, counted as one) on the l
 #           direction
 # fco : the freecad object of the rail
@@ -3105,13 +3277,8 @@ class LinGuideRail(object):
         self.axis_b = axis_b
 
         doc = FreeCAD.ActiveDocument
-        shp_face_rail = fcfun.shp_face_lgrail(rail_w, rail_h, axis_l, axis_b)
-        # self.shp_face_rail = shp_face_rail
-        # vector on the direction of the rail length. Extrusion
+        # vector on the direction of the rail length
         vdir_l = fcfun.getfcvecofname(axis_l)
-        vdir_extr = DraftVecUtils.scaleTo(vdir_l, rail_l)
-        shp_plainrail = shp_face_rail.extrude(vdir_extr)
-        self.shp_plainrail = shp_plainrail
 
         if boltend_sep != 0:
             nbolt_l = (rail_l - boltend_sep) // bolt_lsep  # integer division
@@ -3125,90 +3292,69 @@ class LinGuideRail(object):
             self.boltend_sep = rail_rem / 2.
         # there will be one bolt more than nbolt_l
         self.nbolt_l = nbolt_l + 1
-        # bolt holes
-        bolth_posz = rail_h - bolth_h
-        doc.recompute()
-        if bolt_wsep == 0:  # just one bolt hole per line
-            shp_boltshank = fcfun.shp_cyl(r=bolt_d / 2., h=rail_h - bolth_h + 2,
-                                          normal=VZ, pos=FreeCAD.Vector(0, 0, -1))
-            shp_bolthead = fcfun.shp_cyl(r=bolth_d / 2., h=bolth_h + 1,
-                                         normal=VZ, pos=FreeCAD.Vector(0, 0, bolth_posz))
-            shp_bolt = shp_boltshank.fuse(shp_bolthead)
-            if bolthole_d != 0:
+        # the rail with the bolt holes, cached by length
+        shp_rail = shp_lgrail_dir(rail_d=rail_l, rail_w=rail_w,
+                                  rail_h=rail_h,
+                                  bolt_lsep=bolt_lsep, bolt_wsep=bolt_wsep,
+                                  bolt_d=bolt_d,
+                                  bolth_d=bolth_d, bolth_h=bolth_h,
+                                  boltend_sep=self.boltend_sep,
+                                  nbolt_l=self.nbolt_l,
+                                  axis_d=vdir_l,
+                                  axis_h=fcfun.getfcvecofname(axis_b).negative())
+
+        if bolthole_d != 0:
+            if bolt_wsep == 0:  # just one bolt hole per line
                 fco_bolthole = addBolt(bolthole_d / 2., bolthole_l,
                                        bolthole_nutd / 2., bolthole_nuth,
                                        hex_head=1, extra=1, support=1,
                                        headdown=1, name=name + "_bolthole")
-        else:
-            shp_boltshank1 = fcfun.shp_cyl(r=bolt_d / 2., h=rail_h - bolth_h + 2,
-                                           normal=VZ, pos=FreeCAD.Vector(0, bolt_wsep / 2., -1))
-            shp_bolthead1 = fcfun.shp_cyl(r=bolth_d / 2., h=bolth_h + 1,
-                                          normal=VZ,
-                                          pos=FreeCAD.Vector(0, bolt_wsep / 2., bolth_posz))
-            shp_bolt1 = shp_boltshank1.fuse(shp_bolthead1)
-            shp_boltshank2 = fcfun.shp_cyl(r=bolt_d / 2., h=rail_h - bolth_h + 2,
-                                           normal=VZ, pos=FreeCAD.Vector(0, -bolt_wsep / 2., -1))
-            shp_bolthead2 = fcfun.shp_cyl(r=bolth_d / 2., h=bolth_h + 1,
-                                          normal=VZ,
-                                          pos=FreeCAD.Vector(0, -bolt_wsep / 2., bolth_posz))
-            shp_bolt2 = shp_boltshank2.fuse(shp_bolthead2)
-            shp_bolt = shp_bolt2.fuse(shp_bolt1)
-            if bolthole_d != 0:
+            else:
                 fco_bolthole1 = addBolt(bolthole_d / 2., bolthole_l,
                                         bolthole_nutd / 2., bolthole_nuth,
                                         hex_head=1, extra=1, support=1,
-                                        headdown=1, name=name + "_bolthole_1")
-                fco_bolthole1.Placement.Base = FreeCAD.Vector(0, bolt_wsep / 2., 0)
+                                        headdown=1,
+                                        name=name + "_bolthole_1")
+                fco_bolthole1.Placement.Base = FreeCAD.Vector(0,
+                                                              bolt_wsep / 2.,
+                                                              0)
                 fco_bolthole2 = addBolt(bolthole_d / 2., bolthole_l,
                                         bolthole_nutd / 2., bolthole_nuth,
                                         hex_head=1, extra=1, support=1,
-                                        headdown=1, name=name + "_bolthole_2")
-                fco_bolthole2.Placement.Base = FreeCAD.Vector(0, -bolt_wsep / 2., 0)
-                fco_bolthole = doc.addObject("Part::Fuse", name + "_bolthole")
+                                        headdown=1,
+                                        name=name + "_bolthole_2")
+                fco_bolthole2.Placement.Base = FreeCAD.Vector(0,
+                                                              -bolt_wsep / 2.,
+                                                              0)
+                fco_bolthole = doc.addObject("Part::Fuse",
+                                             name + "_bolthole")
                 fco_bolthole.Base = fco_bolthole1
                 fco_bolthole.Tool = fco_bolthole2
 
-        # Rotation of the bolt holes
-        vrot = fcfun.calc_rot(fcfun.getvecofname(axis_l),
-                              fcfun.getvecofname(axis_b))
-        shp_bolt.Placement.Rotation = vrot
-
-        doc.recompute()
-        # replicate the bolt holes:
-
-        boltpos = DraftVecUtils.scaleTo(vdir_l, self.boltend_sep)
-        addpos = DraftVecUtils.scaleTo(vdir_l, bolt_lsep)
-        shp_bolt.Placement.Base = boltpos
-        if bolthole_d != 0:
+            # Rotation of the bolt holes
+            vrot = fcfun.calc_rot(fcfun.getvecofname(axis_l),
+                                  fcfun.getvecofname(axis_b))
+            # replicate the bolt holes:
+            boltpos = DraftVecUtils.scaleTo(vdir_l, self.boltend_sep)
+            addpos = DraftVecUtils.scaleTo(vdir_l, bolt_lsep)
             vdir_b = fcfun.getfcvecofname(axis_b)
             bolthole_posz = DraftVecUtils.scaleTo(vdir_b, rail_h)
             fco_bolthole.Placement.Base = boltpos + bolthole_posz
             fco_bolthole.Placement.Rotation = vrot
             bolthole_list = [fco_bolthole]
-        shp_bolt_list = []
-        # starts on 0, because it is one more bolt than nbolt
-        for ibolt in range(0, int(nbolt_l)):
-            boltpos += addpos
-            shp_bolt_i = shp_bolt.copy()
-            shp_bolt_i.Placement.Base = boltpos
-            shp_bolt_list.append(shp_bolt_i)
-            if bolthole_d != 0:
+            # starts on 0, because it is one more bolt than nbolt
+            for ibolt in range(0, int(nbolt_l)):
+                boltpos += addpos
                 fco_bolthole_clone = Draft.clone(fco_bolthole)
                 fco_bolthole_clone.Label = fco_bolthole.Label + str(ibolt)
                 fco_bolthole_clone.Placement.Base = boltpos + bolthole_posz
                 bolthole_list.append(fco_bolthole_clone)
 
-        shp_bolts = shp_bolt.multiFuse(shp_bolt_list)
-
-        shp_rail = shp_plainrail.cut(shp_bolts)
-
-        if bolthole_d != 0:
             fco_bolthole = doc.addObject("Part::MultiFuse", name + "_bolt_hole")
             fco_bolthole.Shapes = bolthole_list
             fco_bolthole.ViewObject.Visibility = False
             self.fco_bolthole = fco_bolthole
 
-        doc.recompute()
         fco_rail = doc.addObject("Part::Feature", name)
         fco_rail.Shape = shp_rail
         self.fco = fco_rail
@@ -3217,6 +3363,22 @@ class LinGuideRail(object):
         self.base_place = position
         self.fco.Placement.Base = FreeCAD.Vector(position)
 
+    @property
+    def shp_plainrail(self):
+        """ shape of the rail without the bolt holes, it is made when it
+        is asked, from the cached section (see shp_lgrail_dir)
+        """
+        return shp_lgrail_dir(
+                      rail_d=self.rail_l, rail_w=self.rail_w,
+                      rail_h=self.rail_h,
+                      bolt_lsep=self.bolt_lsep, bolt_wsep=self.bolt_wsep,
+                      bolt_d=self.bolt_d,
+                      bolth_d=self.bolth_d, bolth_h=self.bolth_h,
+                      boltend_sep=self.boltend_sep, nbolt_l=self.nbolt_l,
+                      axis_d=fcfun.getfcvecofname(self.axis_l),
+                      axis_h=fcfun.getfcvecofname(self.axis_b).negative(),
+                      plain=1)
+
 
 # a dictionary is used with the constants. Defined in kcomp.py
 # hl = f_linguiderail(200, kcomp.SEBWM16_R, 'y', '-z')
@@ -3469,48 +3631,18 @@ class ShpLinGuideRail(shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-        wire_rail = fcfun.wire_lgrail(rail_w=rail_w,
-                                      rail_h=rail_h,
-                                      axis_w=self.axis_w,
-                                      axis_h=self.axis_h,
-                                      pos_w=0, pos_h=0,
-                                      pos=self.pos_o)
-
-        # make a face of the wire 
-        shp_face_rail = Part.Face(wire_rail)
-        shp_plainrail = shp_face_rail.extrude(self.vec_d(rail_d))
-
-        holes_list = []
-        # bolt holes
-        bolthole_pos = self.get_pos_dwh(1, 0, 3)
-        for i in range(0, self.nbolt_l):
-            if bolt_wsep == 0:  # just one bolt
-                shp_bolt = fcfun.shp_bolt_dir(r_shank=bolt_d / 2.,
-                                              l_bolt=rail_h,
-                                              r_head=bolth_d / 2.,
-                                              l_head=bolth_h,
-                                              xtr_head=1, xtr_shank=1,
-                                              support=0,
-                                              fc_normal=self.axis_h.negative(),
-                                              pos_n=0, pos=bolthole_pos)
-                holes_list.append(shp_bolt)
-            else:
-                for i in (-1, 1):
-                    bolthole_pos_i = bolthole_pos + self.get_pos_w(i)
-                    shp_bolt = fcfun.shp_bolt_dir(r_shank=bolt_d / 2.,
-                                                  l_bolt=rail_h,
-                                                  r_head=bolth_d / 2.,
-                                                  l_head=bolth_h,
-                                                  xtr_head=1, xtr_shank=1,
-                                                  support=0,
-                                                  fc_normal=self.axis_h.negative(),
-                                                  pos_n=0, pos=bolthole_pos_i)
-                    holes_list.append(shp_bolt)
-            bolthole_pos = bolthole_pos + self.vec_d(bolt_lsep)
-
-        shp_holes = fcfun.fuseshplist(holes_list)
-        shp_rail = shp_plainrail.cut(shp_holes)
-        shp_rail = shp_rail.removeSplitter()
+        # the rail with the bolt holes, cached by length
+        shp_rail = shp_lgrail_dir(rail_d=rail_d, rail_w=rail_w,
+                                  rail_h=rail_h,
+                                  bolt_lsep=bolt_lsep, bolt_wsep=bolt_wsep,
+                                  bolt_d=bolt_d,
+                                  bolth_d=bolth_d, bolth_h=bolth_h,
+                                  boltend_sep=self.boltend_sep,
+                                  nbolt_l=self.nbolt_l,
+                                  axis_d=self.axis_d,
+                                  axis_w=self.axis_w,
+                                  axis_h=self.axis_h,
+                                  pos=self.pos_o)
 
         self.shp = shp_rail
         # Part.show(shp_rail)
@@ -4072,8 +4204,18 @@ class ShpLinGuideBlock(shp_clss.Obj3D):
                :       rail_w         :
 
             rail_ins_h = block_h - (linguide_h - rail_h)
+
+    lod : int
+        Level of detail, if None, the LOD of the document (see
+        shp_clss.get_lod)
+            * LOD_FULL: all the features
+            * LOD_SIMPLE: no bolt holes
+            * LOD_ENV: a box of block_w x block_d x block_h
     """
 
+    lod_drop = {shp_clss.LOD_SIMPLE: ('bolt_holes',),
+                shp_clss.LOD_ENV: ('bolt_holes', 'rail_hole', 'steps')}
+
     def __init__(self,
                  block_d,
                  block_ds,
@@ -4096,12 +4238,14 @@ class ShpLinGuideBlock(shp_clss.Obj3D):
                  pos_d=0,
                  pos_w=0,
                  pos_h=0,
-                 pos=V0):
+                 pos=V0,
+                 lod=None):
 
         if (axis_w is None) or (axis_w == V0):
             axis_w = axis_h.cross(axis_d)
 
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
+        self.set_lod(lod)
 
         # save the arguments as attributes:
         frame = inspect.currentframe()
@@ -4153,6 +4297,17 @@ class ShpLinGuideBlock(shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        if not self.lod_has('steps'):  # envelope
+            self.shp = fcfun.shp_box_dir(box_w=self.block_w,
+                                         box_d=self.block_d,
+                                         box_h=self.block_h,
+                                         fc_axis_w=self.axis_w,
+                                         fc_axis_d=self.axis_d,
+                                         fc_axis_h=self.axis_h,
+                                         cw=1, cd=1, ch=0,
+                                         pos=self.pos_o)
+            return
+
         # the main block
         shp_mblock = fcfun.shp_box_dir(box_w=self.block_w,
                                        box_d=self.block_ds,
@@ -4179,7 +4334,7 @@ class ShpLinGuideBlock(shp_clss.Obj3D):
         holes_list = []
 
         # rail hole:
-        if self.rail_h > 0 and rail_w > 0:
+        if self.rail_h > 0 and rail_w > 0 and self.lod_has('rail_hole'):
             wire_rail = fcfun.wire_lgrail(rail_w=rail_w,
                                           rail_h=self.rail_h,
                                           axis_w=self.axis_w,
@@ -4197,20 +4352,22 @@ class ShpLinGuideBlock(shp_clss.Obj3D):
             holes_list.append(shp_rail)
 
         # bolt holes:
-        for d_i in (-1, 1):  # positions of the holes along axis_d
-            for w_i in (-2, 2):  # positions of the holes along axis_w
-                shp_bolt = fcfun.shp_cylcenxtr(
-                    r=bolt_d / 2.,
-                    h=self.bolt_l,
-                    normal=axis_h,
-                    ch=0,
-                    xtr_top=1,
-                    xtr_bot=self.thruhole,
-                    pos=self.get_pos_dwh(d_i, w_i, 2))
-                holes_list.append(shp_bolt)
-
-        shp_holes = fcfun.fuseshplist(holes_list)
-        shp_block = shp_block.cut(shp_holes)
+        if self.lod_has('bolt_holes'):
+            for d_i in (-1, 1):  # positions of the holes along axis_d
+                for w_i in (-2, 2):  # positions of the holes along axis_w
+                    shp_bolt = fcfun.shp_cylcenxtr(
+                        r=bolt_d / 2.,
+                        h=self.bolt_l,
+                        normal=axis_h,
+                        ch=0,
+                        xtr_top=1,
+                        xtr_bot=self.thruhole,
+                        pos=self.get_pos_dwh(d_i, w_i, 2))
+                    holes_list.append(shp_bolt)
+
+        if holes_list:
+            shp_holes = fcfun.fuseshplist(holes_list)
+            shp_block = shp_block.cut(shp_holes)
         shp_block = shp_block.removeSplitter()
 
         self.shp = shp_block
@@ -4294,6 +4451,8 @@ class PartLinGuideBlock(fc_clss.SinglePart, ShpLinGuideBlock):
 
     pos: FreeCAD.Vector
         Position at the point defined by pos_d, pos_w, pos_h
+    lod: int
+        Level of detail, see ShpLinGuideBlock
 
     """
 
@@ -4302,7 +4461,8 @@ class PartLinGuideBlock(fc_clss.SinglePart, ShpLinGuideBlock):
                  pos_d=0, pos_w=0, pos_h=0,
                  pos=V0,
                  model_type=1,  # dimensional model
-                 name=''):
+                 name='',
+                 lod=None):
 
         default_name = block_dict['name'] + '_block'
         self.set_name(name, default_name, change=0)
@@ -4337,7 +4497,8 @@ class PartLinGuideBlock(fc_clss.SinglePart, ShpLinGuideBlock):
                                   pos_d=pos_d,
                                   pos_w=pos_w,
                                   pos_h=pos_h,
-                                  pos=pos)
+                                  pos=pos,
+                                  lod=lod)
 
         # creation of the part
         fc_clss.SinglePart.__init__(self)
@@ -4360,7 +4521,9 @@ class PartLinGuideBlock(fc_clss.SinglePart, ShpLinGuideBlock):
 
 
 class ShpGtPulley(shp_clss.Obj3D):
-    """ Creates a GT pulley, no exact dimensions, just for the model
+    """ Creates a GT pulley, no exact dimensions, just for the model.
+    At LOD_FULL the toothed part has the grooves of the belt teeth
+    (fcfun.shp_gtpulley_face), otherwise it is a cylinder
     ::
  
              flange_d
@@ -4508,8 +4671,19 @@ class ShpGtPulley(shp_clss.Obj3D):
 
          pos_o (origin) is at pos_h=0, pos_d=0, pos_w=0 (marked with o)
 
+    lod : int
+        Level of detail, if None, the LOD of the document (see
+        shp_clss.get_lod)
+            * LOD_FULL: all the features, the teeth with the profile of
+              kcomp.GT
+            * LOD_SIMPLE: no teeth
+            * LOD_ENV: a cylinder of the outer radius, without shaft hole
+
     """
 
+    lod_drop = {shp_clss.LOD_SIMPLE: ('teeth',),
+                shp_clss.LOD_ENV: ('teeth', 'steps')}
+
     def __init__(self,
                  pitch=2.,
                  n_teeth=20,
@@ -4527,7 +4701,8 @@ class ShpGtPulley(shp_clss.Obj3D):
                  pos_d=0,
                  pos_w=0,
                  pos_h=0,
-                 pos=V0):
+                 pos=V0,
+                 lod=None):
 
         if (((axis_d is None) or (axis_d == V0)) and
                 ((axis_w is None) or (axis_w == V0))):
@@ -4542,6 +4717,7 @@ class ShpGtPulley(shp_clss.Obj3D):
             # all axis are defined
 
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
+        self.set_lod(lod)
 
         if (top_flange_h > 0 or bot_flange_h > 0) and flange_d == 0:
             logger.debug("Flange height is not null, but diameter is null")
@@ -4611,6 +4787,18 @@ class ShpGtPulley(shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        # normal axes to print without support
+        self.prnt_ax = self.axis_h
+
+        if not self.lod_has('steps'):  # envelope
+            self.shp = fcfun.shp_cylcenxtr(r=max(self.flange_r, self.base_r,
+                                                 self.tooth_out_r),
+                                           h=self.tot_h,
+                                           normal=self.axis_h,
+                                           ch=0, xtr_top=0, xtr_bot=0,
+                                           pos=self.pos_o)
+            return
+
         shp_fuse_list = []
         # Cilynder with a hole, with an extra for the fusion
         # calculation of the extra at the bottom to make the fusion
@@ -4620,15 +4808,30 @@ class ShpGtPulley(shp_clss.Obj3D):
             xtr_bot = self.base_h / 2.
         else:
             xtr_bot = 0
-        # external diameter (maybe later teeth will be made
-        shp_tooth_cyl = fcfun.shp_cylhole_gen(r_out=self.tooth_out_r,
-                                              r_in=self.shaft_r + tol,
-                                              h=self.toothed_h,
-                                              axis_h=self.axis_h,
-                                              pos_h=1,  # position at the bottom
-                                              xtr_top=top_flange_h / 2.,
-                                              xtr_bot=xtr_bot,
-                                              pos=self.get_pos_h(2))
+        if self.lod_has('teeth'):
+            # cached face of the teeth, on the XY plane
+            shp_tooth_face = fcfun.shp_gtpulley_face(pitch, n_teeth)
+        else:
+            shp_tooth_face = None
+        if shp_tooth_face is not None:
+            wire_hole = Part.Wire(Part.makeCircle(self.shaft_r + tol, V0, VZ))
+            shp_tooth_face = shp_tooth_face.cut(Part.Face(wire_hole))
+            shp_tooth_face.Placement = FreeCAD.Placement(
+                                          self.get_pos_h(2)
+                                          - self.vec_h(xtr_bot),
+                                          FreeCAD.Rotation(VZ, self.axis_h))
+            shp_tooth_cyl = shp_tooth_face.extrude(
+                self.vec_h(xtr_bot + self.toothed_h + top_flange_h / 2.))
+        else:
+            # external diameter
+            shp_tooth_cyl = fcfun.shp_cylhole_gen(r_out=self.tooth_out_r,
+                                                  r_in=self.shaft_r + tol,
+                                                  h=self.toothed_h,
+                                                  axis_h=self.axis_h,
+                                                  pos_h=1,  # at the bottom
+                                                  xtr_top=top_flange_h / 2.,
+                                                  xtr_bot=xtr_bot,
+                                                  pos=self.get_pos_h(2))
         shp_fuse_list.append(shp_tooth_cyl)
         if self.bot_flange_h > 0:
             # same width
@@ -4678,9 +4881,6 @@ class ShpGtPulley(shp_clss.Obj3D):
 
         self.shp = shp_pulley
 
-        # normal axes to print without support
-        self.prnt_ax = self.axis_h
-
 
 # shpObjPulley = ShpGtPulley()
 
@@ -4731,7 +4931,8 @@ class PartGtPulley(fc_clss.SinglePart, ShpGtPulley):
                  pos_h=0,
                  pos=V0,
                  model_type=1,  # dimensional model
-                 name=''):
+                 name='',
+                 lod=None):
 
         default_name = 'gt' + str(int(pitch)) + '_pulley_' + str(n_teeth)
         self.set_name(name, default_name, change=0)
@@ -4753,7 +4954,8 @@ class PartGtPulley(fc_clss.SinglePart, ShpGtPulley):
                              pos_d=pos_d,
                              pos_w=pos_w,
                              pos_h=pos_h,
-                             pos=pos)
+                             pos=pos,
+                             lod=lod)
 
         # Then the Part
         fc_clss.SinglePart.__init__(self)
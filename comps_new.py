@@ -548,24 +548,13 @@ class AluProf (Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-        shp_alu_wire = fcfun.shp_aluwire_dir(width, thick, slot, insquare,
+        # face with the inner hole, cached
+        shp_alu_face = fcfun.shp_aluface_dir(width, thick, slot, insquare,
+                                             indiam,
                                              fc_axis_x=self.axis_w,
                                              fc_axis_y=self.axis_h,
-                                             ref_x=1,  # pos_o is centered
-                                             ref_y=1,  # pos_o is centered
                                              pos=self.pos_o)
 
-        # make a face of the wire
-        shp_alu_face = Part.Face(shp_alu_wire)
-        # inner hole
-        if indiam > 0:
-            hole = Part.makeCircle(indiam/2.,   # Radius
-                                   self.pos_o,  # Position
-                                   self.axis_d)  # direction
-            wire_hole = Part.Wire(hole)
-            face_hole = Part.Face(wire_hole)
-            shp_alu_face = shp_alu_face.cut(face_hole)
-
         # extrude it
         dir_extrud = DraftVecUtils.scaleTo(self.axis_d, self.tot_d)
         shp_aluprof = shp_alu_face.extrude(dir_extrud)
@@ -14,6 +14,9 @@ import sys
 import inspect
 import logging
 import math
+import json
+import hashlib
+import importlib
 import FreeCAD
 import FreeCADGui
 import Part
@@ -34,6 +37,8 @@ import kcomp  # import material constants and other constants
 import fcfun  # import my functions for freecad. FreeCad Functions
 import shp_clss
 import kparts
+import build_worker
+import assembly_clss
 
 from fcfun import V0, VX, VY, VZ, V0ROT
 from fcfun import VXN, VYN, VZN
@@ -41,6 +46,161 @@ from fcfun import VXN, VYN, VZN
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Instancing mode: if 1, the parts that can be instanced (bolts, nuts,
+# washers, bearings: class attribute instancing = 1) are created as links
+# (App::Link) to a master object, one master for each different shape
+# of each class. Each link has its own placement.
+# Documents with many repeated parts use less memory, smaller files and
+# are redrawn faster.
+# The masters are found by the class, the arguments that define the shape
+# and the LOD (master key, see SinglePart.get_master_key), so the shape
+# of a part is only built when its master does not exist yet
+INSTANCING = 0
+
+# prefix of the keys of the document Meta where the names of the master
+# objects are kept, see get_master
+MASTER_META = 'master_'
+
+
+def master_meta_key(master_key):
+    """ Returns the key of the document Meta of a master key """
+    return MASTER_META + hashlib.sha1(repr(master_key).encode()).hexdigest()
+
+
+def get_master(master_key, doc=None):
+    """ Returns the master object of a master key in the document, None if
+    there is not one. The names of the masters are kept in the Meta of the
+    document, so they are saved with it and they are not mixed with the
+    masters of other documents
+
+    Parameters
+    -----------
+    master_key : tuple
+        See SinglePart.get_master_key
+    doc : FreeCAD document
+        If None, the active document
+    """
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    name = doc.Meta.get(master_meta_key(master_key))
+    if name is None:
+        return None
+    return doc.getObject(name)
+
+
+def set_master(master_key, master):
+    """ Sets the master object of a master key in its document, see
+    get_master
+    """
+    meta = master.Document.Meta
+    meta[master_meta_key(master_key)] = master.Name
+    master.Document.Meta = meta
+
+
+def master_key_val(value):
+    """ Returns the value of an argument for a master key: the floats and
+    vectors are rounded, so the same values give the same key
+    """
+    if isinstance(value, FreeCAD.Vector):
+        return tuple(fcfun.quant_val(coord) for coord in value)
+    if isinstance(value, float):
+        return fcfun.quant_val(value)
+    return value
+
+
+# properties of the objects of the parts with LOD (their shape class
+# declares lod_drop): the LOD of the shape, and the shape class and its
+# arguments (json), to build the shape again with another LOD.
+# See rebuild_doc_lod
+LOD_PROP = 'Lod'
+LOD_BUILD_PROP = 'LodBuild'
+
+
+def get_lod_shp_class(part_class):
+    """ Returns the shape class (shp_clss.Obj3D) of a part class that
+    declares the features that are dropped at each LOD (lod_drop).
+    None if the part has no LOD
+    """
+    for base in part_class.__mro__:
+        if vars(base).get('lod_drop') and issubclass(base, shp_clss.Obj3D):
+            return base
+    return None
+
+
+def rebuild_doc_lod(lod, doc=None):
+    """ Sets the LOD of the document (shp_clss.set_doc_lod) and builds
+    again, with this LOD, the shapes of the parts with LOD that are already
+    in the document: the objects with the property LOD_BUILD_PROP
+    (see SinglePart.set_fco_lod_build). Their placements are kept.
+    The shapes used to cut keep their LOD (see the shape classes).
+    It is one transaction (one undo) and one recompute
+
+    Parameters
+    -----------
+    lod : int
+        shp_clss.LOD_ENV, LOD_SIMPLE or LOD_FULL
+    doc : FreeCAD document
+        If None, the active document
+
+    Returns
+    --------
+    int
+        Number of objects that have been built again
+    """
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    shp_clss.set_doc_lod(lod, doc)
+    obj_list = [obj for obj in doc.Objects
+                if hasattr(obj, LOD_BUILD_PROP)
+                and getattr(obj, LOD_PROP) != lod]
+    n_obj = 0
+    master_set = set()
+    with fcfun.bulk_insert('LOD', doc):
+        for obj in obj_list:
+            build = json.loads(getattr(obj, LOD_BUILD_PROP))
+            try:
+                shp_class = getattr(importlib.import_module(build['module']),
+                                    build['class'])
+                shp_part = shp_class(
+                               lod=lod,
+                               **build_worker.decode_value(build['kwargs']))
+            except Exception as err:  # the arguments are not valid
+                logger.error(obj.Name + ' not built again: ' + str(err))
+                continue
+            shp = shp_part.shp
+            if build['local'] == 1:  # master of links
+                shp = shp.copy()
+                shp.transformShape(
+                        shp_part.get_local_place().inverse().toMatrix())
+                master_set.add(obj.Name)
+            place = obj.Placement
+            obj.Shape = shp
+            obj.Placement = place
+            setattr(obj, LOD_PROP, shp_part.lod)
+            n_obj += 1
+    if master_set:
+        # the master keys have the old LOD: the new parts with the old LOD
+        # will make their own masters
+        meta = doc.Meta
+        for key in [key for key in meta if key.startswith(MASTER_META)
+                    and meta[key] in master_set]:
+            del meta[key]
+        doc.Meta = meta
+    return n_obj
+
+
+def set_instancing(instancing=1):
+    """ Sets the instancing mode for the parts created from now on
+
+    Parameters
+    -----------
+    instancing : int
+        1: the parts that can be instanced are created as links
+        0: each part is a Part::Feature with its own shape
+    """
+    global INSTANCING
+    INSTANCING = instancing
+
 
 # Possible names: Single Part, Element, Piece
 # Either:
@@ -102,8 +262,20 @@ class SinglePart(object):
         0.: no color on that channel
         1.: full intensity on that channel
 
+    fco_place0 : FreeCAD.Placement
+        Only if fco is a link (instancing mode): placement of the local
+        frame of the part (pos_o and its axes), where the shape of the
+        master object is. None if fco is not a link
+
     """
 
+    # 1: the part is created as a link to a master in instancing mode
+    instancing = 0
+    # arguments of the shape that do not change the shape in the local
+    # frame of the part (see get_local_place), they are not in the master
+    # key. The classes with shapes of revolution add the axes
+    master_free_args = ('pos', 'pos_d', 'pos_w', 'pos_h')
+
     def __init__(self):
         # bring the active document
         self.doc = FreeCAD.ActiveDocument
@@ -113,11 +285,66 @@ class SinglePart(object):
         # self.displacement = V0
         self.rel_place = V0
         self.extra_mov = V0
+        # set that has this part, see PartsSet.append_part
+        self.parent_set = None
+        # placement of fco in the set, without the placement of the sets
+        self.fco_set_place = FreeCAD.Placement()
 
         self.create_fco(self.name)
         # self.tol = tol
         # self.model_type = model_type
 
+    @property
+    def shp(self):
+        """ shape of the part. The parts that are links to an existing
+        master do not build it (see shp_needed), it is taken from the
+        master when it is asked
+        """
+        shp = self.__dict__.get('_shp')
+        if shp is None and getattr(self, 'fco_place0', None) is not None:
+            shp = self.fco.LinkedObject.Shape.copy()
+            shp.transformShape(self.fco_place0.toMatrix())
+            self._shp = shp
+        elif '_shp' not in self.__dict__:
+            raise AttributeError("'" + type(self).__name__
+                                 + "' object has no attribute 'shp'")
+        return shp
+
+    @shp.setter
+    def shp(self, shp):
+        self._shp = shp
+
+    def get_master_key(self, shp_args):
+        """ returns the key of the master object of the part: class, the
+        arguments that define its shape in the local frame, and LOD
+
+        Parameters
+        -----------
+        shp_args : dict
+            Arguments of the shape class
+        """
+        return ((type(self).__name__,
+                 shp_clss.get_lod(shp_args.get('lod')))
+                + tuple(sorted((arg, master_key_val(value))
+                               for arg, value in shp_args.items()
+                               if arg != 'lod'
+                               and arg not in self.master_free_args)))
+
+    def shp_needed(self, shp_args):
+        """ returns False if the part is going to be a link to a master
+        that already exists (instancing mode), so its shape is not built.
+        It is called by the shape class, before the shape is built
+
+        Parameters
+        -----------
+        shp_args : dict
+            Arguments of the shape class
+        """
+        if INSTANCING != 1 or self.instancing != 1:
+            return True
+        self.master_key = self.get_master_key(shp_args)
+        return get_master(self.master_key) is None
+
     def get_parts(self):
         """ returns an empty list, because it is a SinglePart.
         Therefore has no parts
@@ -135,7 +362,8 @@ class SinglePart(object):
         """
         # just in case the value is 0 or 1, and it is an int
         self.color = (float(color[0]), float(color[1]), float(color[2]))
-        self.fco.ViewObject.ShapeColor = self.color
+        # a link gets its own color, that overrides the color of the master
+        fcfun.set_fco_color(self.fco, self.color)
 
     def set_line_color(self, color=(1., 1., 1.)):
         """ Sets a new color for the vertex lines of the piece
@@ -148,7 +376,7 @@ class SinglePart(object):
         """
         # just in case the value is 0 or 1, and it is an int
         self.line_color = (float(color[0]), float(color[1]), float(color[2]))
-        self.fco.ViewObject.LineColor = self.line_color
+        self.get_fco_shp_obj().ViewObject.LineColor = self.line_color
 
     def set_line_width(self, width=1.):
         """ Sets the line width of the vertexes
@@ -160,7 +388,7 @@ class SinglePart(object):
         """
         # just in case the value is 0 or 1, and it is an int
         self.line_width = float(width)
-        self.fco.ViewObject.LineWidth = self.line_width
+        self.get_fco_shp_obj().ViewObject.LineWidth = self.line_width
 
     def set_point_size(self, size=1.):
         """ Sets the point size
@@ -172,7 +400,7 @@ class SinglePart(object):
 
         """
         self.point_size = size
-        self.fco.ViewObject.PointSize = self.point_size
+        self.get_fco_shp_obj().ViewObject.PointSize = self.point_size
 
     def set_name(self, name='', default_name='', change=0):
         """ Sets the name attribute to the value of parameter name
@@ -212,8 +440,118 @@ class SinglePart(object):
         """
         if not name:
             name = self.name
-        fco = fcfun.add_fcobj(self.shp, name, self.doc)
+        if INSTANCING == 1 and self.instancing == 1:
+            self.create_link(name)
+        else:
+            fco = fcfun.add_fcobj(self.shp, name, self.doc)
+            self.fco = fco
+            self.fco_place0 = None
+        self.set_fco_prnt_ax()
+        self.set_fco_lod_build()
+
+    def set_fco_prnt_ax(self):
+        """ Stores the print axis (prnt_ax) of the part in the property
+        PrintAxis of the object that has the shape (the master if fco is
+        a link), in the frame of its shape, so the exports of the document
+        objects can use it (see print_export_fun.get_prnt_ax)
+        """
+        prnt_ax = getattr(self, 'prnt_ax', None)
+        if prnt_ax is None:
+            return
+        shp_obj = self.get_fco_shp_obj()
+        if self.fco_place0 is not None:
+            # the shape of the master is in the local frame of the part
+            prnt_ax = self.fco_place0.Rotation.inverted().multVec(prnt_ax)
+        if not hasattr(shp_obj, 'PrintAxis'):
+            shp_obj.addProperty('App::PropertyVector', 'PrintAxis', 'Print',
+                                'Direction that points up to print')
+        shp_obj.PrintAxis = prnt_ax
+
+    def set_fco_lod_build(self):
+        """ Stores in the object that has the shape (the master if fco is
+        a link) the LOD of the shape and how to build it again: module and
+        name of the shape class, and its arguments. Only for the parts with
+        LOD, see rebuild_doc_lod
+        """
+        shp_class = get_lod_shp_class(type(self))
+        shp_obj = self.get_fco_shp_obj()
+        if shp_class is None or hasattr(shp_obj, LOD_BUILD_PROP):
+            return
+        # the arguments are kept as attributes by the shape class
+        arg_list = list(inspect.signature(shp_class.__init__).parameters)
+        kwargs = {arg: getattr(self, arg) for arg in arg_list[1:]
+                  if arg != 'lod' and hasattr(self, arg)}
+        try:
+            build = json.dumps({'module': shp_class.__module__,
+                                'class': shp_class.__name__,
+                                'kwargs': build_worker.encode_value(kwargs),
+                                'local': int(self.fco_place0 is not None)})
+        except TypeError as err:  # arguments that are not json types
+            logger.debug(self.name + ': LOD cannot be changed: ' + str(err))
+            return
+        shp_obj.addProperty('App::PropertyInteger', LOD_PROP, 'LOD',
+                            'Level of detail of the shape')
+        shp_obj.addProperty('App::PropertyString', LOD_BUILD_PROP, 'LOD',
+                            'Shape class and arguments, to build it again')
+        shp_obj.setEditorMode(LOD_BUILD_PROP, 2)  # hidden
+        setattr(shp_obj, LOD_PROP, self.lod)
+        setattr(shp_obj, LOD_BUILD_PROP, build)
+
+    def create_link(self, name):
+        """ creates the FreeCAD object as a link to the master object of
+        its master key (see shp_needed). The master is created, with the
+        shape in the local frame of the part, if there is not one in the
+        document
+        """
+        place0 = self.get_local_place()
+        master = get_master(self.master_key, self.doc)
+        if master is None:
+            shp_local = self.shp.copy()
+            shp_local.transformShape(place0.inverse().toMatrix())
+            master = fcfun.add_fcobj(shp_local, name + '_master', self.doc)
+            if master.ViewObject is not None:
+                master.ViewObject.Visibility = False
+            set_master(self.master_key, master)
+        fco = self.doc.addObject('App::Link', name)
+        fco.LinkedObject = master
+        fco.Placement = place0
         self.fco = fco
+        self.fco_place0 = place0
+
+    def get_fco_shp_obj(self):
+        """ returns the FreeCAD object that has the shape: fco, or its
+        master if fco is a link
+        """
+        if self.fco_place0 is not None:
+            return self.fco.LinkedObject
+        return self.fco
+
+    def set_fco_place(self, base, rotation=V0ROT):
+        """ Sets the placement of the FreeCAD object. If it is a link,
+        the placement is applied to its local frame
+
+        Parameters
+        -----------
+        base : FreeCAD.Vector
+        rotation : FreeCAD.Rotation
+        """
+        place = FreeCAD.Placement(base, rotation)
+        self.fco_set_place = place
+        if self.parent_set is not None:
+            # placement of the sets that is not done by their containers
+            place = self.parent_set.get_fco_placement().multiply(place)
+        if self.fco_place0 is not None:
+            place = place.multiply(self.fco_place0)
+        self.fco.Placement = place
+
+    def get_abs_placement(self):
+        """ returns the placement of the part in the document, with the
+        placements of the sets that have it. It is calculated when asked
+        """
+        place = self.fco_set_place
+        if self.parent_set is not None:
+            place = self.parent_set.get_abs_placement().multiply(place)
+        return place
 
     # -----
     def place_fcos(self, displacement=V0):
@@ -226,7 +564,7 @@ class SinglePart(object):
         tot_displ = (self.pos_o_adjust + displacement
                      + self.rel_place + self.extra_mov)
         self.tot_displ = tot_displ
-        self.fco.Placement.Base = tot_displ
+        self.set_fco_place(tot_displ)
 
     def set_place(self, place=V0):
         """ Sets a new placement for the piece
@@ -239,7 +577,7 @@ class SinglePart(object):
         if type(place) is tuple:
             place = FreeCAD.Vector(place)  # change to FreeCAD.Vector
         if type(place) is FreeCAD.Vector:
-            self.fco.Placement.Base = place
+            self.set_fco_place(place)
             self.place = place
 
     # ----- Export to STL method
@@ -288,20 +626,18 @@ class SinglePart(object):
         # ----------- option 2. moving the freecad object
 
         # place is no longer used, it should be rel_place or abs_place
-        self.fco.Placement.Base = pos_o.negative() + self.place.negative()
-        self.fco.Placement.Rotation = rotation
+        self.set_fco_place(pos_o.negative() + self.place.negative(), rotation)
         self.doc.recompute()
 
         # exportStl is not working well with FreeCAD 0.17
         # self.fco.Shape.exportStl(self.stl_path + filename + '.stl')
-        mesh_shp = MeshPart.meshFromShape(self.fco.Shape,
+        mesh_shp = MeshPart.meshFromShape(Part.getShape(self.fco),
                                           LinearDeflection=kparts.LIN_DEFL,
                                           AngularDeflection=kparts.ANG_DEFL)
         mesh_shp.write(stl_filename)
         del mesh_shp
 
-        self.fco.Placement.Base = self.place
-        self.fco.Placement.Rotation = V0ROT
+        self.set_fco_place(self.place)
         self.doc.recompute()
 
     def save_fcad(self, prefix="", name=""):
@@ -365,16 +701,41 @@ class PartsSet(shp_clss.Obj3D):
         self.extra_mov = V0
         self.displacement = V0
 
+        # Placement of the whole set, relative to the set that has it,
+        # it can have rotation. See set_set_place
+        self.set_placement = FreeCAD.Placement()
+        self.parent_set = None
+        # App::Part that contains the objects of the set, see make_container
+        self.fco_cont = None
+
     def append_part(self, part):
         """ Appends a new part to the list of parts
         """
         self.parts_lst.append(part)
+        part.parent_set = self
 
     def get_parts(self):
         """ get a list of the parts, 
         """
         return self.parts_lst
 
+    def to_graph(self, name=None):
+        """ Returns the assembly graph of the set: a set node with a node
+        for each part of parts_lst (and for the parts of its sets), see
+        assembly_clss.node_from_obj. It can be transformed, queried and
+        checked for interferences without the document
+
+        Parameters
+        -----------
+        name : str
+            Name of the root node, if None, the name of the set
+
+        Returns
+        --------
+        assembly_clss.AsmNode
+        """
+        return assembly_clss.node_from_obj(self, name)
+
     def make_group(self):
         self.fco = self.doc.addObject("Part::Compound", self.name)
         list_fco = []
@@ -389,6 +750,136 @@ class PartsSet(shp_clss.Obj3D):
         self.fco.Links = list_fco
         self.doc.recompute()
 
+    def make_fco_group(self, group):
+        """ Groups the objects of the set
+
+        Parameters
+        -----------
+        group : int
+            0: they are not grouped
+            1: Part::Compound of the objects, see make_group
+            2: App::Part container, see make_container. The set is moved
+               as a unit by its container
+        """
+        if group == 1:
+            self.make_group()
+        elif group == 2:
+            self.make_container()
+
+    def make_container(self, name=''):
+        """ Creates an App::Part that contains the objects of the set, and
+        the containers of its sets. The placement of the set is the
+        placement of the container, so moving the set (set_set_place,
+        mov_set, rot_set) changes only the container, not every part
+
+        Parameters
+        -----------
+        name : str
+            Name of the container, if empty self.name
+
+        Returns
+        --------
+        FreeCAD Object
+            The App::Part
+        """
+        if self.fco_cont is not None:
+            return self.fco_cont
+        if not name:
+            name = self.name
+        fco_cont = self.doc.addObject('App::Part', name)
+        for part in self.get_parts():
+            if isinstance(part, PartsSet) and not hasattr(part, 'fco'):
+                fco_i = part.make_container()
+            else:  # a part, or a set grouped in a compound
+                fco_i = part.fco
+            fco_cont.addObject(fco_i)
+        self.fco_cont = fco_cont
+        # the placement of the set is now in the container: the objects
+        # and the containers of the sets are placed again in it
+        self.place_container()
+        self.update_set_place()
+        return fco_cont
+
+    def place_container(self):
+        """ Sets the placement of the container: the placement of the
+        set, and the placement of the sets that have it that is not done
+        by their containers
+        """
+        place = self.set_placement
+        if self.parent_set is not None:
+            place = self.parent_set.get_fco_placement().multiply(place)
+        self.fco_cont.Placement = place
+
+    def get_abs_placement(self):
+        """ returns the placement of the set in the document, with the
+        placements of the sets that have it. It is calculated when asked
+        """
+        if self.parent_set is None:
+            return self.set_placement
+        return self.parent_set.get_abs_placement().multiply(
+                                                      self.set_placement)
+
+    def get_fco_placement(self):
+        """ returns the placement of the sets (this and the ones that have
+        it) that is not done by their containers, so it has to be in the
+        placement of the objects of the parts (and of the containers of
+        the sets) of this set
+        """
+        if self.fco_cont is not None:
+            return FreeCAD.Placement()
+        if self.parent_set is None:
+            return self.set_placement
+        return self.parent_set.get_fco_placement().multiply(
+                                                      self.set_placement)
+
+    def set_set_place(self, place):
+        """ Sets the placement of the whole set, relative to the set that
+        has it. If the set has a container, only its placement changes,
+        otherwise the objects of all the parts are placed again
+
+        Parameters
+        -----------
+        place : FreeCAD.Placement or FreeCAD.Vector
+        """
+        if isinstance(place, FreeCAD.Vector):
+            place = FreeCAD.Placement(place, V0ROT)
+        self.set_placement = FreeCAD.Placement(place)
+        if self.fco_cont is not None:
+            self.place_container()
+        else:
+            self.update_set_place()
+
+    def mov_set(self, vec):
+        """ Moves the whole set along vec, see set_set_place """
+        self.set_set_place(FreeCAD.Placement(vec, V0ROT).multiply(
+                                                      self.set_placement))
+
+    def rot_set(self, rotation, center=V0):
+        """ Rotates the whole set around center, see set_set_place
+
+        Parameters
+        -----------
+        rotation : FreeCAD.Rotation
+        center : FreeCAD.Vector
+        """
+        self.set_set_place(FreeCAD.Placement(V0, rotation, center).multiply(
+                                                      self.set_placement))
+
+    def update_set_place(self):
+        """ Places again the objects of the parts, and the containers of
+        the sets, with the placement of the sets that is not done by
+        their containers
+        """
+        for part in self.get_parts():
+            if isinstance(part, PartsSet):
+                if part.fco_cont is not None:
+                    part.place_container()
+                else:
+                    part.update_set_place()
+            elif hasattr(part, 'fco'):
+                part.set_fco_place(part.fco_set_place.Base,
+                                   part.fco_set_place.Rotation)
+
     def get_abs_place(self):
         """ gets the placement of the object, with any adjustment
         So the shape has been created at pos, and this is any movement done
@@ -435,7 +926,7 @@ class PartsSet(shp_clss.Obj3D):
         displacement = (self.pos_o - self.pos) + vec_o_to_childpart + self.place
         child_part.place = child_part.place + displacement
         try:
-            child_part.fco.Placement.Base = child_part.place
+            child_part.set_fco_place(child_part.place)
         except AttributeError:  # only SimpleParts objects have fco, not PartsSet
             pass
         # add this displacement to all the children
@@ -468,23 +959,32 @@ class PartsSet(shp_clss.Obj3D):
 
     # ----- 
     def place_fcos(self, displacement=V0):
-        """ Place the freecad objects
-        """
-        # if type(place) is tuple:
-        #   place = FreeCAD.Vector(place) # change to FreeCAD.Vector
+        """ Place the freecad objects. The displacement of the set
+        (rel_place, extra_mov) is the translation of the placement of the
+        whole set (set_placement), its rotation is kept.
+        If the set has a container, only the container is placed
 
+        Parameters
+        -----------
+        displacement : FreeCAD.Vector
+            Extra displacement of the set. The displacement of the sets that
+            have this set is not needed: it is in their placement
+        """
         # having pos_o_adjust and rel_place made the sum twice
         # tot_displ = (  self.pos_o_adjust + displacement
         tot_displ = (displacement
                      + self.rel_place + self.extra_mov)
         self.tot_displ = tot_displ
-        # if this set has been grouped, we don't have to go to its children
-        try:
-            self.fco.Placement.Base = tot_displ
-        except AttributeError:
-            # Not grouped: set the new position for every freecad object
+        place = FreeCAD.Placement(tot_displ, self.set_placement.Rotation)
+        if self.fco_cont is not None:
+            self.set_set_place(place)
+        else:
+            # the parts are placed relative to the set, with their own
+            # displacements. A compound of the set (make_group) follows
+            # its parts
+            self.set_placement = place
             for part in self.parts_lst:
-                part.place_fcos(tot_displ)
+                part.place_fcos()
 
     # ----- Export to STL method
     def export_stl(self, part_i=0, prefix=""):
@@ -596,6 +1096,11 @@ class Washer(SinglePart, shp_clss.ShpCylHole):
 
     """
 
+    instancing = 1  # created as a link in instancing mode
+    # the shape is a revolution around axis_h, see SinglePart
+    master_free_args = SinglePart.master_free_args + ('axis_h', 'axis_d',
+                                                      'axis_w')
+
     def __init__(self, r_out, r_in, h, axis_h, pos_h, tol=0, pos=V0,
                  model_type=0,  # exact
                  name=''):
@@ -830,6 +1335,11 @@ class BearingOutl(SinglePart, shp_clss.ShpCylHole):
 
     """
 
+    instancing = 1  # created as a link in instancing mode
+    # the shape is a revolution around axis_h, see SinglePart
+    master_free_args = SinglePart.master_free_args + ('axis_h', 'axis_d',
+                                                      'axis_w')
+
     def __init__(self, bearing_nb, axis_h, pos_h,
                  axis_d=None, axis_w=None,
                  pos_d=0, pos_w=0, tol=0, pos=V0,
@@ -940,6 +1450,8 @@ class Nut(SinglePart, shp_clss.ShpPrismHole):
 
     """
 
+    instancing = 1  # created as a link in instancing mode
+
     def __init__(self, r_out, h, r_in,
                  axis_d_apo=0, h_offset=0,
                  axis_h=VZ, axis_d=None, axis_w=None,
@@ -1176,6 +1688,9 @@ class Bolt(SinglePart, shp_clss.ShpBolt):
         not to print, just an outline
     name : str
         name of the bolt
+    lod : int
+        Level of detail, see shp_clss.ShpBolt. If None, the LOD of the
+        document
 
     Attributes
     -----------
@@ -1217,6 +1732,8 @@ class Bolt(SinglePart, shp_clss.ShpBolt):
 
     """
 
+    instancing = 1  # created as a link in instancing mode
+
     def __init__(self,
                  shank_r,
                  shank_l,
@@ -1232,7 +1749,8 @@ class Bolt(SinglePart, shp_clss.ShpBolt):
                  pos_h=0, pos_d=0, pos_w=0,
                  pos=V0,
                  model_type=0,
-                 name=''):
+                 name='',
+                 lod=None):
 
         if not hasattr(self, 'metric'):
             metric = 2 * shank_r
@@ -1259,7 +1777,8 @@ class Bolt(SinglePart, shp_clss.ShpBolt):
                                   axis_d=axis_d,
                                   axis_w=axis_w,
                                   pos_h=pos_h, pos_d=pos_d, pos_w=pos_w,
-                                  pos=pos)
+                                  pos=pos,
+                                  lod=lod)
 
         # Then the Part
         SinglePart.__init__(self)
@@ -1377,6 +1896,9 @@ class Din912Bolt(Bolt):
         Not to print, just an outline
     name : str
         Name of the bolt
+    lod : int
+        Level of detail, see shp_clss.ShpBolt. If None, the LOD of the
+        document
     """
 
     def __init__(self, metric, shank_l,
@@ -1387,7 +1909,8 @@ class Din912Bolt(Bolt):
                  pos_h=0, pos_d=0, pos_w=0,
                  pos=V0,
                  model_type=0,
-                 name=''):
+                 name='',
+                 lod=None):
 
         if metric >= 3:
             str_metric = str(int(metric))
@@ -1438,7 +1961,8 @@ class Din912Bolt(Bolt):
                           axis_h=axis_h, axis_d=axis_d, axis_w=axis_w,
                           pos_h=pos_h, pos_d=pos_d, pos_w=pos_w,
                           pos=pos,
-                          model_type=model_type)
+                          model_type=model_type,
+                          lod=lod)
 
 # doc = FreeCAD.newDocument()
 # bolt = Din912Bolt ( metric = 3, shank_l = 24,
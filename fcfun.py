@@ -14,7 +14,10 @@ import FreeCAD
 import Part
 import math
 import logging
+import contextlib
+import hashlib
 import DraftVecUtils
+import numpy as np
 
 #from FreeCAD import Base
 
@@ -103,6 +106,36 @@ COS45 = 0.707
 def pathOfModule():
     return os.path.dirname(__file__)
 
+
+def vecl_arr (vec_list):
+    """ Returns a numpy array (n, 3) with the coordinates of a list of
+    FreeCAD.Vector, to use the batch (_arr) functions
+    """
+    return np.array([(vec.x, vec.y, vec.z) for vec in vec_list],
+                    dtype=float).reshape(-1, 3)
+
+
+def arr_vecl (arr):
+    """ Returns a list of FreeCAD.Vector from a numpy array (n, 3), to
+    convert the results of the batch (_arr) functions
+    """
+    return [FreeCAD.Vector(*pt) for pt in np.asarray(arr, dtype=float).tolist()]
+
+
+def vec_arr (vec):
+    """ Returns the numpy array (3,) of a FreeCAD.Vector. If it is already
+    an array (or a tuple), it is returned as an array
+    """
+    if isinstance(vec, FreeCAD.Vector):
+        return np.array((vec.x, vec.y, vec.z), dtype=float)
+    return np.asarray(vec, dtype=float)
+
+
+def unit_arr (arr):
+    """ Normalizes the vectors of an array (..., 3) """
+    norm = np.linalg.norm(arr, axis=-1, keepdims=True)
+    return arr / np.where(norm > 0, norm, 1.)
+
 def rotateview(axisX=1.0,axisY=0.0,axisZ=0.0,angle=45.0):
     """Rotate the camara"""
     import math
@@ -634,6 +667,117 @@ def get_tangent_2circles (center1_pt,
 #Part.show(line_2)
 
 
+def get_tangent_circle_arr (ext_pt, center_pt, rad, axis_n,
+                            axis_side = None):
+    """
+    Batch version of get_tangent_circle_pt, with numpy arrays.
+    The arguments can be arrays of many external points, centers and radii,
+    they are broadcasted
+
+    Parameters
+    ----------
+    ext_pt : numpy array (..., 3) or FreeCAD.Vector
+        External points
+    center_pt : numpy array (..., 3) or FreeCAD.Vector
+        Centers of the circles
+    rad : numpy array (...) or float
+        Radii of the circles
+    axis_n : numpy array (..., 3) or FreeCAD.Vector
+        Direction of the normal of the circles
+    axis_side : numpy array (..., 3) or FreeCAD.Vector
+        Direction to the side of the tangent point, see get_tangent_circle_pt
+
+    Returns
+    -------
+    numpy array
+        * If axis_side is not given: (..., 2, 3) the 2 tangent points
+        * If axis_side is given: (..., 3) the tangent point on that side
+        The points are nan if the external point is inside the circle
+    """
+    E_pt = vec_arr(ext_pt)
+    C_pt = vec_arr(center_pt)
+    rad = np.asarray(rad, dtype=float)
+    axis_n = unit_arr(vec_arr(axis_n))
+
+    EC = C_pt - E_pt
+    EC_d = np.linalg.norm(EC, axis=-1)
+    axis_c = unit_arr(EC)
+    axis_p = np.cross(axis_n, axis_c)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ET_d = np.sqrt(np.where(rad < EC_d, EC_d * EC_d - rad * rad, np.nan))
+        cos_alpha = ET_d / EC_d
+        sin_alpha = rad / EC_d
+    # projections of the cathetus on axis_c and axis_p
+    pt_c = E_pt + axis_c * (ET_d * cos_alpha)[..., None]
+    vec_p = axis_p * (ET_d * sin_alpha)[..., None]
+    if axis_side is not None:
+        side = np.sum(vec_arr(axis_side) * axis_p, axis=-1)
+        sign = np.where(side < 0, -1., 1.)
+        return pt_c + vec_p * sign[..., None]
+    return np.stack((pt_c + vec_p, pt_c - vec_p), axis=-2)
+
+
+def get_tangent_2circles_arr (center1_pt, center2_pt, rad1, rad2, axis_n,
+                              axis_side = None):
+    """
+    Batch version of get_tangent_2circles, with numpy arrays.
+    The arguments can be arrays of many pairs of circles, they are
+    broadcasted
+
+    Parameters
+    ----------
+    center1_pt, center2_pt : numpy array (..., 3) or FreeCAD.Vector
+        Centers of the circles 1 and 2
+    rad1, rad2 : numpy array (...) or float
+        Radii of the circles 1 and 2
+    axis_n : numpy array (..., 3) or FreeCAD.Vector
+        Direction of the normal of the circles
+    axis_side : numpy array (..., 3) or FreeCAD.Vector
+        Direction to the side of the first tangent line,
+        see get_tangent_2circles
+
+    Returns
+    -------
+    numpy array (..., 2, 2, 3)
+        Element [..., i, j] is the point of the tangent line i on the
+        circle j (same order as get_tangent_2circles).
+        The points are nan if a circle is inside the other
+    """
+    C1_pt = vec_arr(center1_pt)
+    C2_pt = vec_arr(center2_pt)
+    r1 = np.asarray(rad1, dtype=float)
+    r2 = np.asarray(rad2, dtype=float)
+    axis_n = unit_arr(vec_arr(axis_n))
+
+    # axis_c goes from the smaller circle to the larger
+    small1 = (r1 < r2)[..., None]
+    C1_C2 = np.where(small1, C2_pt - C1_pt, C1_pt - C2_pt)
+    C1_C2_d = np.linalg.norm(C1_C2, axis=-1)
+    axis_c = unit_arr(C1_C2)
+    axis_p = np.cross(axis_n, axis_c)
+    if axis_side is not None:
+        side = np.sum(vec_arr(axis_side) * axis_p, axis=-1)
+        axis_p = axis_p * np.where(side < 0, -1., 1.)[..., None]
+    r_diff = np.abs(r2 - r1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        T1_T2_d = np.sqrt(np.where(r_diff < C1_C2_d,
+                                   C1_C2_d * C1_C2_d - r_diff * r_diff,
+                                   np.nan))
+        cos_beta = r_diff / C1_C2_d
+        sin_beta = T1_T2_d / C1_C2_d
+
+    def tangent_pts(C_pt, rad):
+        # points of the 2 lines on the circle
+        pt_c = C_pt - axis_c * (rad * cos_beta)[..., None]
+        vec_p = axis_p * (rad * sin_beta)[..., None]
+        return pt_c + vec_p, pt_c - vec_p
+
+    L1_T1, L2_T1 = tangent_pts(C1_pt, r1)
+    L1_T2, L2_T2 = tangent_pts(C2_pt, r2)
+    return np.stack((np.stack((L1_T1, L1_T2), axis=-2),
+                     np.stack((L2_T1, L2_T2), axis=-2)), axis=-3)
+
+
 
  
 
@@ -670,7 +814,404 @@ def add_fcobj(shp, name, doc = None):
     fcobj = doc.addObject("Part::Feature", name)
     fcobj.Shape = shp
     return fcobj
-  
+
+
+def quant_val(value, digits = 6):
+    """ Returns the value rounded to a number of significant digits
+    (+ 0. to have the same value for 0. and -0.)
+    """
+    return float('%.*g' % (digits, value)) + 0.
+
+
+# Linear deflection of the tessellation used to calculate the chirality
+# of the shapes (shp_chirality), it only needs the sign of the moments
+CHIRAL_DEFL = 0.2
+# Relative size of the third moments (and of the differences of the
+# principal moments) considered 0, see shp_chirality
+CHIRAL_TOL = 1e-3
+
+
+def third_moments_arr(points, facets, com, axes):
+    """ Returns the third moments of the volume enclosed by a triangle
+    mesh along some axes: integral of (u)^3 dV, u being the coordinate
+    along each axis from com. They are calculated on the surface
+    (divergence theorem): integral of u^4 / 4 * (axis . normal) dA, that
+    on each triangle is area / 15 * h4(u1, u2, u3), h4 being the sum of
+    all the monomials of degree 4 of the coordinates of its vertexes
+
+    Parameters
+    ----------
+    points : numpy array (n, 3)
+    facets : numpy array (n_tri, 3) of int
+        Triangles, their vertexes counterclockwise seen from outside
+    com : numpy array (3,)
+        Origin of the coordinates, the center of mass
+    axes : numpy array (n_axes, 3)
+        Unit vectors of the axes
+
+    Returns
+    -------
+    numpy array (n_axes,)
+    """
+
+    tri = points[facets] - com  # (n_tri, 3 vertexes, 3)
+    # area vectors (area * normal)
+    area_vec = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0]) / 2.
+    coord = tri.dot(axes.T)  # (n_tri, 3 vertexes, n_axes)
+    u1, u2, u3 = coord[:, 0], coord[:, 1], coord[:, 2]
+    h4 = sum(u1**i * u2**j * u3**(4 - i - j)
+             for i in range(5) for j in range(5 - i))
+    return (h4 / 15. * area_vec.dot(axes.T)).sum(axis=0) / 4.
+
+
+def shp_chirality(shp):
+    """ Returns the handedness of a shape: 1 or -1, its mirror image has
+    the other value. 0 if it cannot be told, for shapes with a symmetry
+    (or close to it).
+    Each principal axis of inertia is given the sense where the third
+    moment of the volume is positive, and the handedness is the sign of
+    the determinant of the 3 axes. If 2 principal moments are equal, the
+    axes are not defined, and the handedness cannot be told
+
+    Parameters
+    ----------
+    shp : TopoShape
+
+    Returns
+    -------
+    int
+    """
+
+    inertia, com = shp_inertia(shp)
+    moments, axes = np.linalg.eigh(inertia)
+    if (moments[-1] <= 0
+            or min(np.diff(moments)) < CHIRAL_TOL * moments[-1]):
+        return 0
+    points, facets = shp.tessellate(CHIRAL_DEFL)
+    if not facets:
+        return 0
+    points = np.array([(pt.x, pt.y, pt.z) for pt in points], dtype=float)
+    third = third_moments_arr(points, np.array(facets, dtype=int),
+                              np.array((com.x, com.y, com.z)), axes.T)
+    # size of the third moments of the shape: volume * size**3
+    size = shp.BoundBox.DiagonalLength
+    if min(np.abs(third)) < CHIRAL_TOL * abs(shp.Volume) * size**3:
+        return 0
+    return int(np.sign(np.linalg.det(axes * np.sign(third))))
+
+
+def shp_inertia(shp):
+    """ Returns the matrix of inertia (density 1) of the solids of a
+    shape about their common center of mass, and the center of mass
+
+    Returns
+    -------
+    Tuple:
+        numpy array (3, 3)
+        FreeCAD.Vector
+    """
+
+    inertia = np.zeros((3, 3))
+    com = V0
+    solid_list = shp.Solids
+    mass = sum(abs(solid.Volume) for solid in solid_list)
+    if mass > 0:
+        com = sum((DraftVecUtils.scale(solid.CenterOfMass, abs(solid.Volume))
+                   for solid in solid_list), V0)
+        com = DraftVecUtils.scale(com, 1. / mass)
+        for solid in solid_list:
+            mat = np.array(solid.MatrixOfInertia.A).reshape(4, 4)[:3, :3]
+            dist = solid.CenterOfMass - com
+            dist = np.array((dist.x, dist.y, dist.z))
+            inertia += mat + abs(solid.Volume) * (dist.dot(dist) * np.eye(3)
+                                                 - np.outer(dist, dist))
+    return inertia, com
+
+
+def shp_geom_fingerprint(shp, digits = 6, placed = 0):
+    """ Returns a fingerprint of the geometry of a shape that does not
+    depend on its position: equal parts at different positions have the
+    same fingerprint, unless placed is 1.
+    It is a hash of the quantized values of:
+      - number of solids, shells, faces, edges and vertexes
+      - volume and area
+      - principal moments of inertia (density 1), about the center of mass
+      - sorted lengths of the bounding box (they do not change with
+        translations and rotations of 90 degrees about the axes)
+      - handedness (shp_chirality), because the other values do not
+        change with a reflection: mirrored parts (left and right) have
+        different fingerprints, unless their handedness cannot be told
+      - if placed is 1, the sorted coordinates of the vertexes
+
+    Parameters
+    ----------
+    shp : TopoShape
+    digits : int
+        Number of significant digits of the quantized values
+    placed : int
+        1: the fingerprint depends on the position and orientation of the
+           shape: only equal shapes at the same placement have the same
+           fingerprint (e.g. shapes in the local frame of their parts)
+        0: it does not depend on them
+
+    Returns
+    -------
+    str
+        Hexadecimal digest, it can be used as a key of dictionaries, file
+        names or manifests
+
+    """
+
+    inertia, _ = shp_inertia(shp)
+    moment_list = sorted(np.linalg.eigvalsh(inertia))
+    bbox = shp.BoundBox
+    len_list = sorted((bbox.XLength, bbox.YLength, bbox.ZLength))
+    key = ((len(shp.Solids), len(shp.Shells), len(shp.Faces),
+            len(shp.Edges), len(shp.Vertexes))
+           + tuple(quant_val(val, digits)
+                   for val in [abs(shp.Volume), shp.Area]
+                              + moment_list + len_list)
+           + (shp_chirality(shp),))
+    if placed == 1:
+        key = key + tuple(sorted((quant_val(vtx.X, digits),
+                                  quant_val(vtx.Y, digits),
+                                  quant_val(vtx.Z, digits))
+                                 for vtx in shp.Vertexes))
+    return hashlib.sha1(repr(key).encode('ascii')).hexdigest()
+
+
+# Relative difference of the volumes of 2 shapes that coincide, see
+# shp_coincide
+COINCIDE_TOL = 1e-4
+
+
+def shp_coincide(shp1, shp2, tol = COINCIDE_TOL):
+    """ Returns True if 2 shapes fill the same space: the volume of their
+    common part is the volume of each of them
+
+    Parameters
+    ----------
+    shp1, shp2 : TopoShape
+    tol : float
+        Relative tolerance of the volumes
+    """
+
+    vol = abs(shp1.Volume)
+    if vol == 0 or abs(abs(shp2.Volume) - vol) > tol * vol:
+        return False
+    try:
+        common_vol = abs(shp1.common(shp2).Volume)
+    except Exception as err:  # OCC errors are not specific
+        logger.warning('common failed: ' + str(err))
+        return False
+    return vol - common_vol <= tol * vol
+
+
+def shp_dedupe(shp_list, digits = 6, check_list = None):
+    """ Finds the repeated shapes of a list, with shp_geom_fingerprint.
+    The fingerprint does not tell mirrored shapes apart when their
+    handedness cannot be told (shp_chirality is 0). For these shapes, if
+    check_list is given, a shape is a repetition of another only if their
+    shapes of check_list coincide (shp_coincide), otherwise it is not
+    repeated
+
+    Parameters
+    ----------
+    shp_list : list of TopoShape
+    digits : int
+        See shp_geom_fingerprint
+    check_list : list of TopoShape
+        Shapes to compare, one for each shape of shp_list, at the position
+        where equal shapes coincide (e.g. at their print position)
+
+    Returns
+    -------
+    Tuple of 2 lists, with an element for each shape:
+        list of the fingerprints
+        list of the indexes of the first shape that it repeats
+        (the index of the shape itself if it is not repeated)
+
+    """
+
+    fp_list = [shp_geom_fingerprint(shp, digits) for shp in shp_list]
+    # shapes that are not repeated, for each fingerprint
+    first_dict = {}
+    chiral_dict = {}
+    first_list = []
+    for shp_i, fp in enumerate(fp_list):
+        first_i = shp_i
+        for cand_i in first_dict.get(fp, []):
+            if check_list is None:
+                first_i = cand_i
+                break
+            # the handedness is the same for the shapes of a fingerprint
+            if cand_i not in chiral_dict:
+                chiral_dict[cand_i] = shp_chirality(shp_list[cand_i])
+            if (chiral_dict[cand_i] != 0
+                    or shp_coincide(check_list[cand_i], check_list[shp_i])):
+                first_i = cand_i
+                break
+        if first_i == shp_i:
+            first_dict.setdefault(fp, []).append(shp_i)
+        first_list.append(first_i)
+    return fp_list, first_list
+
+
+def shp_from_build(build_fun, *args, **kwargs):
+    """ Calls a function (or class) that builds FreeCAD objects in the
+    active document, but the objects are built in a hidden temporary
+    document, so the active document is not changed.
+    Returns the compound of the shapes of the objects that are not used
+    by other objects (the result of the build)
+
+    Parameters
+    ----------
+    build_fun : function or class
+        It will be called with the rest of the arguments
+    args, kwargs :
+        Arguments of build_fun
+
+    Returns
+    -------
+    TopoShape
+        Compound of the resulting shapes
+
+    """
+
+    doc_act = FreeCAD.ActiveDocument
+    doc = FreeCAD.newDocument(name = 'shp_build', hidden = True, temp = True)
+    try:
+        FreeCAD.setActiveDocument(doc.Name)
+        build_fun(*args, **kwargs)
+        doc.recompute()
+        shp_list = [obj.Shape for obj in doc.Objects
+                    if not obj.InList and hasattr(obj, 'Shape')
+                    and not obj.Shape.isNull()]
+        shp = Part.makeCompound(shp_list)
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+        if doc_act is not None:
+            FreeCAD.setActiveDocument(doc_act.Name)
+    return shp
+
+
+# Bulk insertion, see bulk_insert. Stack of the documents of the nested
+# bulk_insert, and the colors waiting to be set
+_bulk_doc_list = []
+_bulk_color_dict = {}
+
+
+@contextlib.contextmanager
+def bulk_insert(name = 'Insert', doc = None, frozen = 1, color_prop = None,
+                transaction = 1):
+    """
+    Context to insert many objects in a document at once:
+
+    * All the changes are in one transaction, that is one undo step
+    * The recomputes are frozen (if frozen), the doc.recompute() calls
+      of the classes do nothing, and there is one recompute at the end
+    * The colors set by set_fco_color are set at the end, only the last
+      one of each object. The placements are set at once, so they can
+      be read inside
+
+    It can be nested, only the outer context does the transaction and
+    the recompute
+
+    Example
+    -------
+    with fcfun.bulk_insert('Tensioner'):
+        TensionerSet(...)
+
+    Parameters
+    ----------
+    name : str
+        Name of the transaction (the undo step)
+    doc : FreeCAD document
+        If None, the active document
+    frozen : int
+        * 1: recomputes frozen. The objects are not recomputed inside the
+          context, so the shapes of parametric objects (Part::Cut, ...)
+          cannot be read inside
+        * 0: recomputes are not frozen
+    color_prop : str
+        If given, the colors are also stored in this property of the
+        objects (App::PropertyColor), so they are kept when the view
+        properties are lost: documents without GUI (FreeCADCmd), or
+        objects copied to another document
+    transaction : int
+        * 1: the changes are in one transaction
+        * 0: no transaction, for documents that are not undone, e.g. a
+          temporary document where the objects are built to be copied
+    """
+
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    if doc in _bulk_doc_list:
+        # nested: the outer context does everything
+        yield doc
+        return
+    _bulk_doc_list.append(doc)
+    # RecomputesFrozen is not in old versions of FreeCAD
+    frozen = frozen and hasattr(doc, 'RecomputesFrozen')
+    if frozen:
+        frozen_prev = doc.RecomputesFrozen
+        doc.RecomputesFrozen = True
+    if transaction:
+        doc.openTransaction(name)
+    try:
+        yield doc
+    except Exception:
+        if transaction:
+            doc.abortTransaction()
+        raise
+    else:
+        if color_prop is not None:
+            for fco, color in _bulk_color_dict.values():
+                if not hasattr(fco, color_prop):
+                    fco.addProperty('App::PropertyColor', color_prop,
+                                    'Base', 'Color of the object')
+                setattr(fco, color_prop, color)
+        if transaction:
+            doc.commitTransaction()
+    finally:
+        _bulk_doc_list.remove(doc)
+        color_list = list(_bulk_color_dict.values())
+        _bulk_color_dict.clear()
+        if frozen:
+            doc.RecomputesFrozen = frozen_prev
+    doc.recompute()
+    # the colors of the view, they are not in the transaction
+    for fco, color in color_list:
+        set_vobj_color(fco, color)
+
+
+def set_fco_color(fco, color):
+    """ Sets the color of a FreeCAD object, if inside bulk_insert, it is
+    set at the end of the insertion
+    """
+    if fco.Document in _bulk_doc_list:
+        _bulk_color_dict[id(fco)] = (fco, color)
+    else:
+        set_vobj_color(fco, color)
+
+
+def set_vobj_color(fco, color):
+    """ Sets the color of the view object of a FreeCAD object, if there
+    is GUI. The links (App::Link) get their own material, that overrides
+    the color of the linked object
+    """
+    vobj = fco.ViewObject
+    if vobj is None:
+        return
+    color = tuple(color)[:3]
+    if hasattr(vobj, 'ShapeColor'):
+        vobj.ShapeColor = color
+    else:
+        material = vobj.ShapeMaterial
+        material.DiffuseColor = color
+        vobj.ShapeMaterial = material
+        vobj.OverrideMaterial = True
+
 
 def addBox(x, y, z, name, cx= False, cy=False):
     """
@@ -819,8 +1360,6 @@ def shp_boxcen(x, y, z, cx= False, cy=False, cz=False, pos=V0):
     TopoShape
         Shape of a box
     """
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
 
     if cx == True:
         x0 = -x/2.0
@@ -849,7 +1388,6 @@ def shp_boxcen(x, y, z, cx= False, cy=False, cz=False, pos=V0):
     shp_face_sq = Part.Face(shp_wire_sq)
     shp_box = shp_face_sq.extrude(FreeCAD.Vector(0,0,z))
 
-    doc.recompute()
     
     return shp_box
 
@@ -934,9 +1472,6 @@ def shp_boxcenxtr(x, y, z, cx= False, cy=False, cz=False,
         Shape of a box
 
     """
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-
     if cx == True:
         x0 = -x/2.0 - xtr_nx
         x1 =  x/2.0 + xtr_x
@@ -953,19 +1488,9 @@ def shp_boxcenxtr(x, y, z, cx= False, cy=False, cz=False,
         z0 = -z/2.0 - xtr_nz
     else:
         z0 = 0 - xtr_nz
+    z1 = z0 + z + xtr_z + xtr_nz
 
-    p00 = FreeCAD.Vector (x0,y0,z0) + pos
-    p10 = FreeCAD.Vector (x1,y0,z0) + pos
-    p11 = FreeCAD.Vector (x1,y1,z0) + pos
-    p01 = FreeCAD.Vector (x0,y1,z0) + pos
-    # the square
-    shp_wire_sq = Part.makePolygon([p00, p10, p11, p01, p00])
-    # the face
-    shp_face_sq = Part.Face(shp_wire_sq)
-    shp_box = shp_face_sq.extrude(FreeCAD.Vector(0,0, z+xtr_z+xtr_nz))
-
-    doc.recompute()
-    
+    shp_box = shp_box_frame(x0, x1, y0, y1, z0, z1, pos=pos)
     return shp_box
 
 # same as shp_boxcen but with a filleted dimension
@@ -1080,6 +1605,172 @@ def shp_boxcenchmf (x, y, z, chmfrad,
     shp_boxchmf = shp_box.makeChamfer(chmfrad, edg_list)
     return (shp_boxchmf)
 
+
+#  ---------------- primitives made in their final frame ---------------
+# The solids are made directly where they go: their points are calculated
+# from pos and the unit axes of the frame, and they are made in one
+# construction, without making them at the origin and then rotating and
+# moving them.
+# The extent along each axis is given by its coordinates from pos:
+# from w0 to w1 along axis_w, from d0 to d1 along axis_d, from h0 to h1
+# along axis_h
+
+def get_frame_axes (axis_h = VZ, axis_d = VY, axis_w = V0):
+    """
+    Normalizes the axes of a frame and calculates the missing one:
+    if axis_w is V0 (or None) it will be axis_d x axis_h, and
+    if axis_d is V0 (or None) it will be axis_h x axis_w.
+    If both are missing, axis_d will be any perpendicular to axis_h
+
+    Parameters
+    ----------
+    axis_h : FreeCAD.Vector
+        Direction of the height
+    axis_d : FreeCAD.Vector
+        Direction of the depth, perpendicular to axis_h
+    axis_w : FreeCAD.Vector
+        Direction of the width, perpendicular to the others
+
+    Returns
+    -------
+    Tuple of 3 FreeCAD.Vector
+        The unit axes (axis_w, axis_d, axis_h)
+    """
+
+    axis_h = DraftVecUtils.scaleTo(axis_h, 1)
+    if axis_d is None or axis_d == V0:
+        if axis_w is None or axis_w == V0:
+            axis_d = get_fc_perpend1(axis_h)
+        else:
+            axis_d = axis_h.cross(axis_w)
+    axis_d = DraftVecUtils.scaleTo(axis_d, 1)
+    if axis_w is None or axis_w == V0:
+        axis_w = axis_d.cross(axis_h)
+    else:
+        axis_w = DraftVecUtils.scaleTo(axis_w, 1)
+    return axis_w, axis_d, axis_h
+
+
+def shp_box_frame (w0, w1, d0, d1, h0, h1,
+                   axis_w = VX, axis_d = VY, axis_h = VZ, pos = V0):
+    """
+    Makes a box in its final frame, from w0 to w1 along axis_w, from d0 to
+    d1 along axis_d and from h0 to h1 along axis_h, taking pos as the
+    origin. The base is made with its final points and extruded once
+
+    Parameters
+    ----------
+    w0, w1, d0, d1, h0, h1 : float
+        Coordinates of the box along each axis, from pos
+    axis_w, axis_d, axis_h : FreeCAD.Vector
+        Unit and perpendicular axes of the frame, see get_frame_axes
+    pos : FreeCAD.Vector
+        Origin of the frame
+
+    Returns
+    -------
+    TopoShape
+        Shape of a box
+    """
+
+    pos_0 = pos + axis_h * h0
+    pt_list = [pos_0 + axis_w * w + axis_d * d
+               for (w, d) in ((w0, d0), (w1, d0), (w1, d1), (w0, d1), (w0, d0))]
+    shp_facebase = Part.Face(Part.makePolygon(pt_list))
+    return shp_facebase.extrude(axis_h * (h1 - h0))
+
+
+def shp_cyl_frame (r, h0, h1, axis_h = VZ, pos = V0):
+    """
+    Makes a cylinder in its final frame, from h0 to h1 along axis_h,
+    taking pos as the origin (on the axis of the cylinder).
+    It is one primitive, without making the circle, its face and the
+    extrusion
+
+    Parameters
+    ----------
+    r : float
+        Radius
+    h0, h1 : float
+        Coordinates of the bases along axis_h, from pos
+    axis_h : FreeCAD.Vector
+        Unit vector of the axis of the cylinder
+    pos : FreeCAD.Vector
+        Origin of the frame
+
+    Returns
+    -------
+    TopoShape
+        Shape of a cylinder
+    """
+
+    return Part.makeCylinder(r, h1 - h0, pos + axis_h * h0, axis_h)
+
+
+def shp_cylhole_frame (r_out, r_in, h0, h1, axis_h = VZ, pos = V0):
+    """
+    Makes a hollow cylinder in its final frame, from h0 to h1 along axis_h,
+    taking pos as the origin (on the axis of the cylinder).
+    The face is made with the hole, so there are no boolean operations
+
+    Parameters
+    ----------
+    r_out : float
+        Outside radius
+    r_in : float
+        Inside radius
+    h0, h1 : float
+        Coordinates of the bases along axis_h, from pos
+    axis_h : FreeCAD.Vector
+        Unit vector of the axis of the cylinder
+    pos : FreeCAD.Vector
+        Origin of the frame
+
+    Returns
+    -------
+    TopoShape
+        Shape of a cylinder with hole
+    """
+
+    pos_0 = pos + axis_h * h0
+    wire_out = Part.Wire(Part.makeCircle(r_out, pos_0, axis_h))
+    wire_in = Part.Wire(Part.makeCircle(r_in, pos_0, axis_h))
+    face_hole = Part.Face([wire_out, wire_in], 'Part::FaceMakerBullseye')
+    return face_hole.extrude(axis_h * (h1 - h0))
+
+
+def shp_regprism_frame (n_sides, radius, h0, h1,
+                        axis_h = VZ, axis_v = VX, pos = V0):
+    """
+    Makes a regular prism in its final frame, from h0 to h1 along axis_h,
+    taking pos as the origin (on the axis of the prism)
+
+    Parameters
+    ----------
+    n_sides : int
+        Number of sides of the polygon
+    radius : float
+        Circumradius of the polygon
+    h0, h1 : float
+        Coordinates of the bases along axis_h, from pos
+    axis_h : FreeCAD.Vector
+        Unit vector of the axis of the prism
+    axis_v : FreeCAD.Vector
+        Direction of the first vertex, perpendicular to axis_h
+    pos : FreeCAD.Vector
+        Origin of the frame
+
+    Returns
+    -------
+    TopoShape
+        Shape of a regular prism
+    """
+
+    pt_arr = regpolygon_arr(n_sides, radius, axis_h, axis_v,
+                            pos + axis_h * h0)
+    shp_facebase = Part.Face(Part.makePolygon(arr_vecl(pt_arr)))
+    return shp_facebase.extrude(axis_h * (h1 - h0))
+
 # Makes a box with width, depth, height.
 # Originally:
 # box_w: The width is X
@@ -1235,49 +1926,16 @@ def shp_box_dir (box_w, box_d, box_h,
         #      cw, cd, ch
 
     # normalize the axis, just in case:
-    axis_h = DraftVecUtils.scaleTo(fc_axis_h,1)
-    axis_d = DraftVecUtils.scaleTo(fc_axis_d,1)
-    if fc_axis_w == V0:
-        axis_w = axis_d.cross(axis_h)
-    else:
-        axis_w = DraftVecUtils.scaleTo(fc_axis_w,1)
-
-    #get the points of the base: width x depth
-    # if not centered, the first vertex of the base is on V0
-    if cw == 1:
-        # just scale and not scaleTo because they are unit vectors
-        w_neg = DraftVecUtils.scale(axis_w, -box_w/2.)
-        w_pos = DraftVecUtils.scale(axis_w,  box_w/2.)
-    else:
-        w_neg = V0
-        w_pos = DraftVecUtils.scale(axis_w,  box_w)
-
-    if cd == 1:
-        d_neg = DraftVecUtils.scale(axis_d, -box_d/2.)
-        d_pos = DraftVecUtils.scale(axis_d,  box_d/2.)
-    else:
-        d_neg = V0
-        d_pos = DraftVecUtils.scale(axis_d,  box_d)
-
-    if ch == 1:
-        h_neg = DraftVecUtils.scale(axis_h, -box_h/2.)
-    else:
-        h_neg = V0
-        
-
-    v1 = pos + w_neg + d_neg + h_neg
-    v2 = pos + w_pos + d_neg + h_neg
-    v3 = pos + w_pos + d_pos + h_neg
-    v4 = pos + w_neg + d_pos + h_neg
+    axis_w, axis_d, axis_h = get_frame_axes(fc_axis_h, fc_axis_d, fc_axis_w)
 
-    # make a wire with the points
-    wire_base = Part.makePolygon([v1,v2,v3,v4,v1])
+    # coordinates of the box from pos
+    # if not centered, the first vertex of the base is on pos
+    w0 = -box_w/2. if cw == 1 else 0
+    d0 = -box_d/2. if cd == 1 else 0
+    h0 = -box_h/2. if ch == 1 else 0
 
-    # make the face of the wire
-    shp_facebase = Part.Face(wire_base)
-    # length of the extrusion
-    v_extr = DraftVecUtils.scale(axis_h, box_h)
-    shp_box = shp_facebase.extrude(v_extr)
+    shp_box = shp_box_frame(w0, w0 + box_w, d0, d0 + box_d, h0, h0 + box_h,
+                            axis_w, axis_d, axis_h, pos)
 
     return(shp_box)
 
@@ -1386,58 +2044,28 @@ def shp_box_dir_xtr (box_w, box_d, box_h,
 
     Returns
     -------- 
-    TopoShape
-        FreeCAD.Object with a shape of a box
-
-    Notes
-    -----
-    **fc_axis_w** not necessary, unless cw=0, then it indicates the 
-    direction of w, it has to be perpendicular to the previous
-
-    """
-    # normalize the axis, just in case:
-    axis_h = DraftVecUtils.scaleTo(fc_axis_h,1)
-    axis_d = DraftVecUtils.scaleTo(fc_axis_d,1)
-    if fc_axis_w == V0:
-        axis_w = axis_d.cross(axis_h)
-    else:
-        axis_w = DraftVecUtils.scaleTo(fc_axis_w,1)
-
-    #get the points of the base: width x depth
-    # if not centered, the first vertex of the base is on V0
-    if cw == 1:
-        w_neg = DraftVecUtils.scale(axis_w, -box_w/2. - xtr_nw)
-        w_pos = DraftVecUtils.scale(axis_w,  box_w/2. + xtr_w)
-    else:
-        w_neg = DraftVecUtils.scale(axis_w, - xtr_nw)
-        w_pos = DraftVecUtils.scale(axis_w,   box_w + xtr_w)
-
-    if cd == 1:
-        d_neg = DraftVecUtils.scale(axis_d, -box_d/2. - xtr_nd)
-        d_pos = DraftVecUtils.scale(axis_d,  box_d/2. + xtr_d)
-    else:
-        d_neg = DraftVecUtils.scale(axis_d, - xtr_nd)
-        d_pos = DraftVecUtils.scale(axis_d,   box_d + xtr_d)
+    TopoShape
+        FreeCAD.Object with a shape of a box
 
-    if ch == 1:
-        h_neg = DraftVecUtils.scale(axis_h, -box_h/2. - xtr_nh)
-    else:
-        h_neg = DraftVecUtils.scale(axis_h, - xtr_nh)
-        
+    Notes
+    -----
+    **fc_axis_w** not necessary, unless cw=0, then it indicates the 
+    direction of w, it has to be perpendicular to the previous
 
-    v1 = pos + w_neg + d_neg + h_neg
-    v2 = pos + w_pos + d_neg + h_neg
-    v3 = pos + w_pos + d_pos + h_neg
-    v4 = pos + w_neg + d_pos + h_neg
+    """
+    # normalize the axis, just in case:
+    axis_w, axis_d, axis_h = get_frame_axes(fc_axis_h, fc_axis_d, fc_axis_w)
 
-    # make a wire with the points
-    wire_base = Part.makePolygon([v1,v2,v3,v4,v1])
+    # coordinates of the box from pos, without the extra mm
+    # if not centered, the first vertex of the base is on pos
+    w0 = -box_w/2. if cw == 1 else 0
+    d0 = -box_d/2. if cd == 1 else 0
+    h0 = -box_h/2. if ch == 1 else 0
 
-    # make the face of the wire
-    shp_facebase = Part.Face(wire_base)
-    # length of the extrusion
-    v_extr = DraftVecUtils.scale(axis_h, box_h + xtr_h + xtr_nh)
-    shp_box = shp_facebase.extrude(v_extr)
+    shp_box = shp_box_frame(w0 - xtr_nw, w0 + box_w + xtr_w,
+                            d0 - xtr_nd, d0 + box_d + xtr_d,
+                            h0 - xtr_nh, h0 + box_h + xtr_h,
+                            axis_w, axis_d, axis_h, pos)
 
     return(shp_box)
 
@@ -1614,7 +2242,6 @@ def shp_boxdir_fillchmfplane (
 
     """
 
-    doc = FreeCAD.ActiveDocument
     # normalize axes:
     # axis_l.normalize() could be used, but would change the vector
     # used as parameter
@@ -1699,7 +2326,6 @@ def shp_boxdir_fillchmfplane (
         else:
             #logger.debug('%s', str(edg_list))
             shp_fillchmf = shp_box.makeChamfer(radius, edg_list)
-        doc.recompute()
         return shp_fillchmf
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -2235,18 +2861,7 @@ def shp_cyl (r, h, normal = VZ, pos = V0):
         FreeCAD Shape of a cylinder
 
     """
-    cir =  Part.makeCircle (r,   # Radius
-                            pos,     # Position
-                            normal)  # direction
-
-    #print "circle: %", cir_out.Curve
-
-    wire_cir = Part.Wire(cir)
-    face_cir = Part.Face(wire_cir)
-
-    dir_extrus = DraftVecUtils.scaleTo(normal, h)
-    shpcyl = face_cir.extrude(dir_extrus)
-
+    shpcyl = shp_cyl_frame(r, 0, h, DraftVecUtils.scaleTo(normal, 1), pos)
     return shpcyl
 
 
@@ -2291,23 +2906,11 @@ def shp_cylcenxtr (r, h, normal = VZ,
     """
     # Normalize the normal, in case it is not one:
     nnormal = DraftVecUtils.scaleTo(normal, 1)
-    if ch == 1: # we have to move the circle half the height down + xtr_bot
-        basepos = pos - DraftVecUtils.scaleTo(nnormal, h/2. + xtr_bot)
+    if ch == 1: # we have to move the base half the height down + xtr_bot
+        h0 = - h/2. - xtr_bot
     else:
-        basepos = pos - DraftVecUtils.scaleTo(nnormal, xtr_bot)
-
-    cir =  Part.makeCircle (r,   # Radius
-                            basepos,     # Position
-                            nnormal)  # direction
-
-    #print "circle: %", cir.Curve
-
-    wire_cir = Part.Wire(cir)
-    face_cir = Part.Face(wire_cir)
-
-    dir_extrus = DraftVecUtils.scaleTo(normal, h+xtr_bot+xtr_top)
-    shpcyl = face_cir.extrude(dir_extrus)
-
+        h0 = - xtr_bot
+    shpcyl = shp_cyl_frame(r, h0, h0 + h + xtr_bot + xtr_top, nnormal, pos)
     return shpcyl
 
 
@@ -2481,22 +3084,13 @@ def shp_cyl_gen (r, h, axis_h = VZ,
         else :
             logger.error('axis_rb not defined while pos_rb ==1')
 
-    if pos_h == 0: # we have to move the circle half the height down + xtr_bot
-        h_to_o = DraftVecUtils.scale(axis_h, -(h/2. + xtr_bot))
+    if pos_h == 0: # we have to move the base half the height down + xtr_bot
+        h0 = -(h/2. + xtr_bot)
     else:
-        h_to_o = DraftVecUtils.scale(axis_h, - xtr_bot)
-
-    pos_o = pos + h_to_o + ra_to_o + rb_to_o
+        h0 = - xtr_bot
 
-    cir =  Part.makeCircle (r + xtr_r,   # Radius
-                            pos_o,        # Position
-                            axis_h)      # direction
-
-    wire_cir = Part.Wire(cir)
-    face_cir = Part.Face(wire_cir)
-
-    extrude_dir = DraftVecUtils.scale(axis_h, h+xtr_bot+xtr_top)
-    shpcyl = face_cir.extrude(extrude_dir)
+    shpcyl = shp_cyl_frame(r + xtr_r, h0, h0 + h + xtr_bot + xtr_top,
+                           axis_h, pos + ra_to_o + rb_to_o)
 
     return shpcyl
 
@@ -2730,22 +3324,8 @@ def shp_cylholedir (r_out, r_in, h, normal = VZ, pos = V0):
         FreeCAD Shape of a cylinder with hole
     """
 
-    cir_out =  Part.makeCircle (r_out,   # Radius
-                                pos,     # Position
-                                normal)  # direction
-    cir_in =  Part.makeCircle (r_in,   # Radius
-                                pos,     # Position
-                                normal)  # direction
-
-
-    wire_cir_out = Part.Wire(cir_out)
-    wire_cir_in  = Part.Wire(cir_in)
-    face_cir_out = Part.Face(wire_cir_out)
-    face_cir_in  = Part.Face(wire_cir_in)
-
-    face_cir_hole = face_cir_out.cut(face_cir_in)
-    dir_extrus = DraftVecUtils.scaleTo(normal, h)
-    shp_cyl_hole = face_cir_hole.extrude(dir_extrus)
+    shp_cyl_hole = shp_cylhole_frame(r_out, r_in, 0, h,
+                                     DraftVecUtils.scaleTo(normal, 1), pos)
 
     return shp_cyl_hole
 
@@ -2924,11 +3504,12 @@ def shp_cylhole_gen (r_out, r_in, h,
 
     pos_o = pos + (h_o[pos_h] + ra_o[pos_ra] + rb_o[pos_rb]).negative()
 
-    shp_hollowcyl = shp_cylholedir (r_out = r_out + xtr_r_out,
-                                    r_in  = r_in + xtr_r_in,
-                                    h =  h+xtr_bot+xtr_top,
-                                    normal = axis_h,
-                                    pos = pos_o)
+    shp_hollowcyl = shp_cylhole_frame (r_out = r_out + xtr_r_out,
+                                       r_in  = r_in + xtr_r_in,
+                                       h0 = 0,
+                                       h1 = h + xtr_bot + xtr_top,
+                                       axis_h = axis_h,
+                                       pos = pos_o)
 
     return shp_hollowcyl
 
@@ -2943,6 +3524,132 @@ def shp_cylhole_gen (r_out, r_in, h,
 #                       #pos = FreeCAD.Vector(1,2,3))
 #Part.show(cyl)
 
+
+# ------------------- def shp_gtpulley_face
+# toothed faces of the GT pulleys already made, at the origin, on the XY
+# plane: {(pitch, n_teeth): face}
+_gtface_dict = {}
+
+
+def shp_gtpulley_face (pitch, n_teeth):
+    """
+    Creates the face of the toothed section of a GT pulley, on the XY plane,
+    centered on the origin, without the shaft hole.
+    One tooth (groove and land) is made from the belt dictionary kcomp.GT,
+    and it is repeated by a polar pattern, so there is a single wire and
+    a single face, without booleans.
+    The groove has the profile of the tooth of the belt (see kcomp.GT2):
+    tip arc, flank arcs tangent to it, and root fillets tangent to the
+    flanks and to the land circle.
+    The faces are cached by (pitch, n_teeth), returns a copy
+
+    ::
+
+          land    root                     root    land
+        _________                               _________
+                 \_  flank             flank  _/
+                   \                          /
+                    \_         tip          _/
+                       \__________________/
+
+    Parameters
+    ----------
+    pitch : int
+        Pitch of the belt, 2 or 3 (keys of kcomp.GT)
+    n_teeth : int
+        Number of teeth of the pulley
+
+    Returns
+    --------
+    Shape Face
+        FreeCAD Shape Face of the toothed section,
+        None if the grooves do not fit in the pulley
+    """
+
+    key = (pitch, n_teeth)
+    if key in _gtface_dict:
+        return _gtface_dict[key].copy()
+
+    belt_dict = kcomp.GT[pitch]
+    # radius of the land (outer) and of the bottom of the grooves
+    out_r = n_teeth * pitch / (2 * math.pi) - belt_dict['PLD']
+    in_r = out_r - belt_dict['TOOTH_H']
+    tip_r = belt_dict['TOOTH_R']
+    root_r = belt_dict['ROOT_R']
+    step = 2 * math.pi / n_teeth
+
+    # the groove of the first tooth is centered on axis X. Its profile
+    # is calculated on the side of negative Y, and mirrored
+    # center of the tip arc
+    tip_c = FreeCAD.Vector(in_r + tip_r, 0, 0)
+    # center of the flank arc, on the land line, on the other side
+    flank_c = FreeCAD.Vector(out_r, belt_dict['FLANK_B'], 0)
+    # radius of the flank, tangent to the tip arc
+    flank_r = tip_r + (tip_c - flank_c).Length
+    # center of the root fillet: tangent to the flank (outside) and to the
+    # land circle (inside)
+    root_c_r = out_r - root_r
+    dist_c = flank_c.Length
+    cos_root = ((root_c_r**2 + dist_c**2 - (flank_r + root_r)**2)
+                / (2 * root_c_r * dist_c))
+    if abs(cos_root) >= 1:
+        logger.warning('GT' + str(pitch) + ' pulley of ' + str(n_teeth)
+                       + ' teeth: grooves do not fit')
+        return None
+    root_ang = (math.atan2(flank_c.y, flank_c.x) - math.acos(cos_root))
+    if - root_ang >= step / 2.:
+        logger.warning('GT' + str(pitch) + ' pulley of ' + str(n_teeth)
+                       + ' teeth: grooves do not fit')
+        return None
+    root_c = FreeCAD.Vector(root_c_r * math.cos(root_ang),
+                            root_c_r * math.sin(root_ang), 0)
+
+    # tangent points: land-root, root-flank, flank-tip
+    pt_land = DraftVecUtils.scale(root_c, out_r / root_c_r)
+    pt_root = flank_c + DraftVecUtils.scaleTo(root_c - flank_c, flank_r)
+    pt_flank = flank_c + DraftVecUtils.scaleTo(tip_c - flank_c, flank_r)
+
+    def arc_mid(cen, rad, pt1, pt2):
+        """ middle point of the short arc from pt1 to pt2 """
+        return cen + DraftVecUtils.scaleTo((pt1 + pt2) * 0.5 - cen, rad)
+
+    def mirror(pt):
+        return FreeCAD.Vector(pt.x, - pt.y, 0)
+
+    def arc_edge(pt1, pt_mid, pt2):
+        return Part.Arc(pt1, pt_mid, pt2).toShape()
+
+    land_ang = math.atan2(pt_land.y, pt_land.x)
+    pt_land_next = FreeCAD.Vector(out_r * math.cos(step + land_ang),
+                                  out_r * math.sin(step + land_ang), 0)
+    tooth_edges = [
+        arc_edge(pt_land, arc_mid(root_c, root_r, pt_land, pt_root), pt_root),
+        arc_edge(pt_root, arc_mid(flank_c, flank_r, pt_root, pt_flank),
+                 pt_flank),
+        arc_edge(pt_flank, FreeCAD.Vector(in_r, 0, 0), mirror(pt_flank)),
+        arc_edge(mirror(pt_flank),
+                 mirror(arc_mid(flank_c, flank_r, pt_root, pt_flank)),
+                 mirror(pt_root)),
+        arc_edge(mirror(pt_root),
+                 mirror(arc_mid(root_c, root_r, pt_land, pt_root)),
+                 mirror(pt_land)),
+        arc_edge(mirror(pt_land),
+                 FreeCAD.Vector(out_r * math.cos(step / 2.),
+                                out_r * math.sin(step / 2.), 0),
+                 pt_land_next)]
+    # polar pattern
+    edge_list = []
+    for tooth_i in range(n_teeth):
+        for edge in tooth_edges:
+            edge_i = edge.copy()
+            edge_i.rotate(V0, VZ, math.degrees(tooth_i * step))
+            edge_list.append(edge_i)
+
+    shp_face = Part.Face(Part.Wire(edge_list))
+    _gtface_dict[key] = shp_face
+    return shp_face.copy()
+
+
 def shp_cylhole_arc (r_out, r_in, h,
                      axis_h = VZ, axis_ra = None, axis_rb = None,
                      end_angle = 360,
@@ -3124,11 +3831,12 @@ def shp_cylhole_arc (r_out, r_in, h,
 
     pos_o = pos + (h_o[pos_h] + ra_o[pos_ra] + rb_o[pos_rb]).negative()
 
-    shp_hollowcyl = shp_cylholedir (r_out = r_out + xtr_r_out,
-                                    r_in  = r_in + xtr_r_in,
-                                    h =  h+xtr_bot+xtr_top,
-                                    normal = axis_h,
-                                    pos = pos_o)
+    shp_hollowcyl = shp_cylhole_frame (r_out = r_out + xtr_r_out,
+                                       r_in  = r_in + xtr_r_in,
+                                       h0 = 0,
+                                       h1 = h + xtr_bot + xtr_top,
+                                       axis_h = axis_h,
+                                       pos = pos_o)
 
     if end_angle < 360:
         #
@@ -4645,6 +5353,37 @@ def shp_rndrect_face (x, y, r=0.5, pos_z=0):
 #      \_____/  
 #      
 
+def sim_xy_arr (pts):
+    """
+    Batch version of the points of wire_sim_xy, with numpy arrays.
+    From the points on the positive quadrant of XY (clockwise), returns
+    the points of the closed polygon symmetrical to both X and Y axes.
+    If the first or the last points are not on the axis, a new point is
+    added
+
+    Parameters
+    ----------
+    pts : numpy array (n, 3)
+        Points of the positive quadrant, in order clockwise
+
+    Returns
+    -------
+    numpy array (m, 3)
+        Points of the closed polygon, the first point is repeated at the end
+    """
+    quad = np.asarray(pts, dtype=float)
+    if quad[0, 0] != 0:
+        quad = np.vstack(((0, quad[0, 1], quad[0, 2]), quad))
+    if quad[-1, 1] != 0:
+        quad = np.vstack((quad, (quad[-1, 0], 0, quad[-1, 2])))
+    # the 4 quadrants clockwise, the first point of each one is the same
+    # as the last point of the previous one
+    quad4 = quad[::-1] * (1, -1, 1)
+    quad3 = quad * (-1, -1, 1)
+    quad2 = quad[::-1] * (-1, 1, 1)
+    return np.vstack((quad, quad4[1:], quad3[1:], quad2[1:]))
+
+
 def wire_sim_xy (vecList):
     """
     Creates a wire (shape), from a list of points on the positive quadrant of XY
@@ -4669,49 +5408,13 @@ def wire_sim_xy (vecList):
         created
     """
 
-    edgList = []
-    if vecList[0].x != 0:
-        # the first element is not on the Y axis,so we create a first point
-        vec = FreeCAD.Vector (0, vecList[0].y, vecList[0].z)
-        # In Freecad 0.17 Line is an infinite Line, change to LineSegment
-        seg = Part.LineSegment(vec, vecList[0]) # segment
-        edg = seg.toShape() # edge
-        edgList.append(edg) # append to the edge list
-    listlen = len(vecList)
-    for index, vec in enumerate(vecList):
+    for vec in vecList:
         if vec.x < 0 or vec.y < 0:
             logger.error('WireSimXY with negative points')
-        if index < listlen-1: # it is not the last element
-            seg = Part.LineSegment(vec, vecList[index+1])
-            edg = seg.toShape()
-            edgList.append(edg)
-        index += 1
-    if vecList[-1].y != 0: # the last element is not on the X axis
-        vec = FreeCAD.Vector (vecList[-1].x, 0, vecList[-1].z)
-        seg = Part.LineSegment(vecList[-1], vec)
-        edg = seg.toShape()
-        edgList.append(edg)
-    # the wire for the first cuadrant, quarter
-    quwire = Part.Wire(edgList)
-    # mirror on Y axis
-    MirY = FreeCAD.Matrix()
-    MirY.scale(FreeCAD.Vector(-1,1,1))
-    mir_quwire = quwire.transformGeometry(MirY)
-    # another option
-    # mir_quwire   = quwire.mirror(FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
-
-    #halfwire = Part.Wire([quwire, mir_quwire]) # get the half wire
-    halfwire = Part.Wire([mir_quwire, quwire]) # get the half wire
-    # otherwise it doesn't work because the edges are not aligned
-    halfwire.fixWire() 
-    # mirror on X axis
-    MirX = FreeCAD.Matrix()
-    MirX.scale(FreeCAD.Vector(1,-1,1))
-    mir_halfwire = halfwire.transformGeometry(MirX)
-    totwire = Part.Wire([mir_halfwire, halfwire]) # get the total wire
-    totwire.fixWire() 
-
-    return totwire
+    # the polygon is made with all the points, instead of mirroring the
+    # wire of the quarter
+    sim_pts = sim_xy_arr(vecl_arr(vecList))
+    return Part.makePolygon(arr_vecl(sim_pts))
 
 # ------------------- end def wire_sim_xy
 
@@ -5538,6 +6241,46 @@ def wire_beltclamp (d, w, corner_r,
     """
 
 
+def regpolygon_arr (n_sides, radius, fc_normal=VZ, fc_verx1=VX, pos=V0):
+    """
+    Batch version of regpolygon_dir_vecl, with numpy arrays.
+    Calculates the vertices of regular polygons, the first vertex is
+    repeated at the end to close the wire.
+    radius and pos can be arrays of many polygons, they are broadcasted
+
+    Parameters
+    ----------
+    n_sides : int
+        Number of sides of the polygons
+    radius : numpy array (...) or float
+        Circumradius of the polygons
+    fc_normal : FreeCAD.Vector
+        Direction of the normal
+    fc_verx1 : FreeCAD.Vector
+        Direction of the first vertex
+    pos : numpy array (..., 3) or FreeCAD.Vector
+        Position of the centers
+
+    Returns
+    --------
+    numpy array (..., n_sides + 1, 3)
+        The vertices of the polygons
+    """
+
+    axis_n = unit_arr(vec_arr(fc_normal))
+    axis_u = unit_arr(vec_arr(fc_verx1))
+    axis_v = np.cross(axis_n, axis_u)
+    angles = np.arange(n_sides + 1) * (2 * math.pi / n_sides)
+    angles[-1] = 0  # the first vertex will be also the last one
+    # unit vertices (n_sides + 1, 3)
+    unit_pts = (np.cos(angles)[:, None] * axis_u
+                + np.sin(angles)[:, None] * axis_v)
+    radius = np.asarray(radius, dtype=float)
+    pos = vec_arr(pos)
+    return (pos[..., None, :]
+            + radius[..., None, None] * unit_pts)
+
+
 def regpolygon_vecl (n_sides, radius, x_angle=0):
 
     """
@@ -5563,21 +6306,10 @@ def regpolygon_vecl (n_sides, radius, x_angle=0):
 
     """
 
-    v = FreeCAD.Vector(radius, 0, 0)
-    if x_angle != 0:
-        # rotate the polygon
-        x_angle_rad = math.radians(x_angle)
-        # uses radians, rotates around Z axis
-        # It seems that the angle of the function is wrong, changing the sign
-        v = DraftVecUtils.rotate2D(v,-x_angle_rad)
-    vec_vertex_list = [v]
-    # divide the 360 degrees by the number of sides
-    polygon_angle = 2*math.pi / n_sides
-    for i in xrange(n_sides):
-        v = DraftVecUtils.rotate2D(v,polygon_angle)
-        # the first vertex will be also the last one
-        vec_vertex_list.append(v)
-    return (vec_vertex_list)
+    # It seems that the angle of the function is wrong, changing the sign
+    x_angle_rad = - math.radians(x_angle)
+    verx1 = (math.cos(x_angle_rad), math.sin(x_angle_rad), 0)
+    return arr_vecl(regpolygon_arr(n_sides, radius, VZ, verx1))
 
 
 def regpolygon_dir_vecl (n_sides, radius, fc_normal, fc_verx1, pos):
@@ -5609,27 +6341,12 @@ def regpolygon_dir_vecl (n_sides, radius, fc_normal, fc_verx1, pos):
         List of FreeCAD.Vector of the vertices
     """
 
-    # normalize the normal direction
-    nnormal = DraftVecUtils.scaleTo(fc_normal,1)
-
     # check if the vectors are perpendicular
-    if not fc_isperp(nnormal, fc_verx1):
+    if not fc_isperp(fc_normal, fc_verx1):
         logger.error('Vectors are Not perpendicular')
-    #direction of the first vertex scaled to the radius
-    n1dir_rad = DraftVecUtils.scaleTo(fc_verx1,radius)
-
-    vertex_list = []
-    # divide the 360 degrees by the number of sides
-    polygon_angle = 2*math.pi / n_sides
-    for i in range(n_sides):
-        rot_angle = i*polygon_angle
-        # Rotate n1dir, and then add to pos
-        vertex = pos + DraftVecUtils.rotate(n1dir_rad,rot_angle,nnormal)
-        vertex_list.append(vertex)
-    # the first vertex will be also the last one
-    vertex_list.append(vertex_list[0])
-        
-    return (vertex_list)
+
+    return arr_vecl(regpolygon_arr(n_sides, radius, fc_normal, fc_verx1,
+                                   pos))
 
 
 
@@ -5869,16 +6586,14 @@ def shp_regprism_dirxtr (n_sides, radius, length,
     if centered == 0:
         if xtr_bot > 0:
             # bring back the extra distance
-            pos = pos - DraftVecUtils.scaleTo(nnorm,xtr_bot)
-    else: #centered, find the new center
-        movcenter = (xtr_top - xtr_bot)/2.
-        pos = pos + DraftVecUtils.scaleTo(nnorm,movcenter) 
-
-    shp_rpolygon_face = shp_regpolygon_dir_face (n_sides, radius,
-                                                  nnorm, fc_verx1,
-                                                  pos)
-    shp_rprism = shp_extrud_face(shp_rpolygon_face,
-                                 totlen, nnorm,centered)
+            h0 = - xtr_bot
+        else:
+            h0 = 0
+    else: #centered
+        h0 = - length/2. - xtr_bot
+
+    shp_rprism = shp_regprism_frame(n_sides, radius, h0, h0 + totlen,
+                                    nnorm, fc_verx1, pos)
     return shp_rprism
 
 
@@ -6985,8 +7700,6 @@ def shp_boltnut_dir_hole (r_shank,        l_bolt,
     FreeCAD Object
         FreeCAD Object of a Nut Hole
     """
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
 
     # normalize
     nnormal = DraftVecUtils.scaleTo(fc_normal,1)
@@ -7378,6 +8091,222 @@ def shp_aluwire_dir (width, thick, slot, insquare,
 
     return (shp_aluwire)
 
+
+# ------------------- def shp_aluface_dir
+# faces of the aluminum profiles already made, at the origin:
+# {(width, thick, slot, insquare, indiam, axis_x, axis_y): face}
+_aluface_dict = {}
+
+
+def shp_aluface_dir (width, thick, slot, insquare, indiam,
+                     fc_axis_x=VX, fc_axis_y=VY,
+                     pos=V0):
+    """
+    Creates the face of the cross-section of an aluminum profile: the wire
+    of shp_aluwire_dir with the inner hole, centered on pos.
+    The faces are cached by their dimensions and orientation, so the
+    profiles of a frame (same profile, different lengths) make the face
+    just once, the others are a copy moved to pos
+
+    Parameters
+    ----------
+    width : float
+        Total width of the profile, it is a square
+    thick : float
+        Thickness of the side
+    slot : float
+        Width of the rail
+    insquare : float
+        Width of the inner square
+    indiam : float
+        Diameter of the inner hole. If 0, there is no hole
+    fc_axis_x : FreeCAD.Vector
+        Generic X axis of the face, can be any
+    fc_axis_y : FreeCAD.Vector
+        Generic Y axis of the face, perpendicular to fc_axis_x
+    pos : FreeCAD.Vector
+        Position of the center of the face
+
+    Returns
+    --------
+    Shape Face
+        FreeCAD Shape Face of the aluminium profile cross-section
+    """
+
+    axis_x = DraftVecUtils.scaleTo(fc_axis_x, 1)
+    axis_y = DraftVecUtils.scaleTo(fc_axis_y, 1)
+    key = (width, thick, slot, insquare, indiam,
+           tuple(round(coord, 9) for coord in axis_x),
+           tuple(round(coord, 9) for coord in axis_y))
+    shp_face = _aluface_dict.get(key)
+    if shp_face is None:
+        shp_wire = shp_aluwire_dir(width, thick, slot, insquare,
+                                   fc_axis_x=axis_x,
+                                   fc_axis_y=axis_y,
+                                   ref_x=1, ref_y=1,
+                                   pos=V0)
+        shp_face = Part.Face(shp_wire)
+        if indiam > 0:
+            wire_hole = Part.Wire(Part.makeCircle(indiam/2., V0,
+                                                  axis_x.cross(axis_y)))
+            shp_face = shp_face.cut(Part.Face(wire_hole))
+        _aluface_dict[key] = shp_face
+    shp_face = shp_face.copy()
+    if pos != V0:
+        shp_face.translate(pos)
+    return shp_face
+
+
+def shp_aluprof_lengths (width, thick, slot, insquare, indiam,
+                         length_list,
+                         fc_axis_l=VX, fc_axis_x=VY, fc_axis_y=V0,
+                         pos_list=None):
+    """
+    Creates the shapes of aluminum profiles of the same cross-section and
+    orientation for a list of lengths, extruding the cached face
+    (see shp_aluface_dir). Equal lengths are extruded once, and then
+    copied to their positions
+
+    Parameters
+    ----------
+    width, thick, slot, insquare, indiam : float
+        Dimensions of the profile, see shp_aluface_dir
+    length_list : list of float
+        Lengths of the profiles
+    fc_axis_l : FreeCAD.Vector
+        Direction of the extrusion (length)
+    fc_axis_x : FreeCAD.Vector
+        Generic X axis of the cross-section, perpendicular to fc_axis_l
+    fc_axis_y : FreeCAD.Vector
+        Generic Y axis of the cross-section, if V0: fc_axis_l x fc_axis_x
+    pos_list : list of FreeCAD.Vector
+        Position of the center of the start of each profile.
+        If None, all of them at the origin
+
+    Returns
+    --------
+    list of Shape
+        The shapes of the profiles, in the same order as length_list
+    """
+
+    if fc_axis_y == V0:
+        fc_axis_y = fc_axis_l.cross(fc_axis_x)
+    if pos_list is None:
+        pos_list = [V0] * len(length_list)
+    shp_face = shp_aluface_dir(width, thick, slot, insquare, indiam,
+                               fc_axis_x=fc_axis_x, fc_axis_y=fc_axis_y)
+    shp_dict = {}
+    shp_list = []
+    for length, pos in zip(length_list, pos_list):
+        if length not in shp_dict:
+            shp_dict[length] = shp_face.extrude(
+                                   DraftVecUtils.scaleTo(fc_axis_l, length))
+        shp_prof = shp_dict[length].copy()
+        shp_prof.translate(pos)
+        shp_list.append(shp_prof)
+    return shp_list
+
+
+# ------------------- def shp_aluwire_simple_dir
+
+def shp_aluwire_simple_dir (width, thick, slot,
+                           fc_axis_x=VX, fc_axis_y=VY,
+                           ref_x = 1, ref_y = 1,
+                           pos=V0):
+    """
+    Creates a wire (shape) of a simplified aluminum profile: the outer
+    square with the 4 rail slots, without the inner square and the inner
+    hole. Same arguments as shp_aluwire_dir (it has the same outline)
+    ::
+
+                      Y
+                      |_ X
+         :----- width ----:
+         :       slot     :
+         :      :--:      :
+         :______:  :______:
+         |      |__|      |
+         |__            __|
+          __|    o     |__
+         |       __       |
+         |______|  |______| ....thick
+
+     points of the first quadrant, the others are symmetric:
+         1 ______ 2
+          |      |
+         0       |
+                 |
+             4___| 3
+
+    Parameters
+    ----------
+    width : float
+        Total width of the profile, it is a square
+    thick : float
+        Thickness of the side, depth of the slots
+    slot : float
+        Width of the rail
+    fc_axis_x : FreeCAD.Vector
+        Generic X axis, can be any
+    fc_axis_y : FreeCAD.Vector
+        Generic Y axis, can be any perpendicular to fc_axis_x
+    ref_x : int
+        Reference (zero) on the fc_axis_x
+
+            * 1: reference (zero) at the center
+            * 2: reference (zero) at the side, the other end side will be on the
+              direction of fc_axis_x
+
+    ref_y : int
+        Reference (zero) on the fc_axis_y, same as ref_x
+    pos : FreeCAD.Vector
+        Position of the reference
+
+    Returns
+    --------
+    Shape Wire
+        FreeCAD Shape Wire of the simplified aluminium profile
+    """
+
+    axis_x = DraftVecUtils.scaleTo(fc_axis_x, 1)
+    axis_y = DraftVecUtils.scaleTo(fc_axis_y, 1)
+
+    # Get the center position
+    if ref_x == 2:
+        ref2center_x = DraftVecUtils.scale(axis_x, width/2.)
+    else:
+        ref2center_x = V0
+    if ref_y == 2:
+        ref2center_y = DraftVecUtils.scale(axis_y, width/2.)
+    else:
+        ref2center_y = V0
+
+    center_pos = pos + ref2center_x + ref2center_y
+
+    # same symmetry as shp_aluwire_dir: x values are the y values reversed
+    y = [width/2. - thick,   # y0, x4
+         width/2.,           # y1, x3
+         width/2.,           # y2, x2
+         slot/2.,            # y3, x1
+         slot/2.]            # y4, x0
+    n = len(y)-1
+
+    vec = []
+    for sign_x, sign_y, swap in ((1, 1, 0), (1, -1, 1),
+                                 (-1, -1, 0), (-1, 1, 1)):
+        for ind in range(len(y)):
+            if swap == 0:
+                x_i, y_i = y[n-ind], y[ind]
+            else:
+                x_i, y_i = y[ind], y[n-ind]
+            point = (center_pos + DraftVecUtils.scale(axis_x, sign_x * x_i)
+                                + DraftVecUtils.scale(axis_y, sign_y * y_i))
+            vec.append(point)
+    # The first point has to be the last to close the wire
+    vec.append(vec[0])
+
+    return Part.makePolygon(vec)
+
     
   
 # -------------------- NutHole -----------------------------
@@ -7634,7 +8563,6 @@ def shp_nuthole (nut_r, nut_h, hole_h,
     Shape 
         FreeCAD Shape of a nut hole
     """
-    doc = FreeCAD.ActiveDocument
     # normalize axis:
     axis_nut = DraftVecUtils.scaleTo(fc_axis_nut,1)
     axis_hole = DraftVecUtils.scaleTo(fc_axis_hole,1)
@@ -7716,7 +8644,6 @@ def shp_nuthole (nut_r, nut_h, hole_h,
 
     shp_nuthole = shp_nut.fuse(shp_hole)
     shp_nuthole = shp_nuthole.removeSplitter()
-    doc.recompute() 
     return shp_nuthole
 
 #doc = FreeCAD.newDocument()
@@ -8055,9 +8982,6 @@ def shp_filletchamfer_dir (shp, fc_axis = VZ,  fillet = 1, radius=1):
         FreeCAD Shape with fillet/chamfer made
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     # normalize the axis:
     nnorm = DraftVecUtils.scaleTo(fc_axis,1)
@@ -8086,7 +9010,6 @@ def shp_filletchamfer_dir (shp, fc_axis = VZ,  fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8118,9 +9041,6 @@ def shp_filletchamfer_dirs (shp, fc_axis_l, fillet = 1, radius=1):
         FreeCAD Shape with fillet/chamfer made
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     n_axis_list = []
     for axis in fc_axis_l:
@@ -8150,11 +9070,10 @@ def shp_filletchamfer_dirs (shp, fc_axis_l, fillet = 1, radius=1):
 
     if len(edgelist) != 0:
         if fillet == 1:
-            #logger.debug('%', str(edgelist))
+            #logger.debug('%s', str(edgelist))
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8190,9 +9109,6 @@ def shp_filletchamfer_dirpt (shp, fc_axis = VZ, fc_pt = V0,  fillet = 1,
         FreeCAD Shape with fillet/chamfer made
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     # normalize the axis:
     nnorm = DraftVecUtils.scaleTo(fc_axis,1)
@@ -8228,11 +9144,10 @@ def shp_filletchamfer_dirpt (shp, fc_axis = VZ, fc_pt = V0,  fillet = 1,
 
     if len(edgelist) != 0:
         if fillet == 1:
-            #logger.debug('%', str(edgelist))
+            #logger.debug('%s', str(edgelist))
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8266,9 +9181,6 @@ def shp_filletchamfer_dirpts (shp, fc_axis, fc_pts,  fillet = 1,
         FreeCAD Shape with fillet/chamfer made
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     # normalize the axis:
     nnorm = DraftVecUtils.scaleTo(fc_axis,1)
@@ -8306,11 +9218,10 @@ def shp_filletchamfer_dirpts (shp, fc_axis, fc_pts,  fillet = 1,
 
     if len(edgelist) != 0:
         if fillet == 1:
-            #logger.debug('%', str(edgelist))
+            #logger.debug('%s', str(edgelist))
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8342,9 +9253,6 @@ def shp_cir_fillchmf (shp, circen_pos = V0,  fillet = 1, radius=1):
         FreeCAD Shape with fillet/chamfer made
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     for edge in shp.Edges:
         # get the edges, if it is a cylinder, 2 edges will have just one
@@ -8364,7 +9272,6 @@ def shp_cir_fillchmf (shp, circen_pos = V0,  fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8392,9 +9299,6 @@ def shp_cylfilletchamfer (shp, fillet = 1, radius=1):
         FreeCAD Shape with fillet/chamfer made
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     for edge in shp.Edges:
         # get the edges, if it is a cylinder, 2 edges will have just one
@@ -8409,7 +9313,6 @@ def shp_cylfilletchamfer (shp, fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8476,9 +9379,6 @@ def shp_filletchamfer (shp, e_len, fillet = 1, radius=1, axis='x',
     Shape
         FreeCAD Shape with fillet/chamfer made
     """
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may have problems if you don't do it
     edgelist = []
     #logger.debug('filletchamfer: elen: %s',  e_len)
     for edge_ind, edge in enumerate(shp.Edges):
@@ -8530,11 +9430,10 @@ def shp_filletchamfer (shp, e_len, fillet = 1, radius=1, axis='x',
 
     if len(edgelist) != 0:
         if fillet == 1:
-            logger.debug('%', str(edgelist))
+            logger.debug('%s', str(edgelist))
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -8714,6 +9613,46 @@ def filletchamfer (fco, e_len, name, fillet = 1, radius=1, axis='x',
 
 #
 
+# (yaw, pitch, roll) of calc_rot for each pair (vec1, vec2) of axis
+# directions, vec1 (0,0,0) means that it doesn't matter
+ROT_YPR = {
+    ((1,0,0), (0,1,0)): (0, 0, 90),
+    ((1,0,0), (0,-1,0)): (0, 0, -90),
+    ((1,0,0), (0,0,1)): (0, 0, 180),
+    ((1,0,0), (0,0,-1)): (0, 0, 0),
+    ((-1,0,0), (0,1,0)): (180, 0, -90),  # negative because of the yaw
+    ((-1,0,0), (0,-1,0)): (180, 0, 90),  # positive because of the yaw
+    ((-1,0,0), (0,0,1)): (180, 0, 180),
+    ((-1,0,0), (0,0,-1)): (180, 0, 0),
+    ((0,1,0), (1,0,0)): (90, 0, -90),
+    ((0,1,0), (-1,0,0)): (90, 0, 90),
+    ((0,1,0), (0,0,1)): (90, 0, 180),
+    ((0,1,0), (0,0,-1)): (90, 0, 0),
+    ((0,-1,0), (1,0,0)): (-90, 0, 90),
+    ((0,-1,0), (-1,0,0)): (-90, 0, -90),
+    ((0,-1,0), (0,0,1)): (-90, 0, 180),
+    ((0,-1,0), (0,0,-1)): (-90, 0, 0),
+    ((0,0,1), (1,0,0)): (0, -90, 0),
+    ((0,0,1), (-1,0,0)): (0, -90, 180),
+    ((0,0,1), (0,1,0)): (0, -90, 90),
+    ((0,0,1), (0,-1,0)): (0, -90, -90),
+    ((0,0,-1), (1,0,0)): (0, 90, 180),
+    ((0,0,-1), (-1,0,0)): (0, 90, 0),
+    ((0,0,-1), (0,1,0)): (0, 90, 90),
+    ((0,0,-1), (0,-1,0)): (0, 90, -90),
+    ((0,0,0), (1,0,0)): (0, -90, 0),
+    ((0,0,0), (-1,0,0)): (0, 90, 0),
+    ((0,0,0), (0,1,0)): (0, 0, 90),
+    ((0,0,0), (0,-1,0)): (0, 0, -90),
+    ((0,0,0), (0,0,1)): (0, 0, 180),
+    ((0,0,0), (0,0,-1)): (0, 0, 0),  # the same position
+    }
+
+# the rotations of the table, calculated once. calc_rot returns copies
+_rot_table = dict((key, FreeCAD.Rotation(*ypr))
+                  for key, ypr in ROT_YPR.items())
+
+
 def calc_rot (vec1, vec2):
     """
     Having an object with an orientation defined by 2 vectors
@@ -8764,112 +9703,41 @@ def calc_rot (vec1, vec2):
 
     """
            
-    # rotation calculation
-    if vec1 == (1,0,0):
-        yaw = 0
-        pitch = 0
-        if vec2 == (0,1,0):
-            roll  = 90
-        elif vec2 == (0,-1,0):
-            roll  = -90
-        elif vec2 == (0,0,1):
-            roll  = 180
-        elif vec2 == (0,0,-1):
-            roll  = 0
-        else:
-            print("error 1 in yaw-pitch-roll")
-    elif vec1 == (-1,0,0):
-        yaw = 180
-        pitch = 0
-        if vec2 == (0,1,0):
-            roll  = -90 #negative because of the yaw
-        elif vec2 == (0,-1,0):
-            roll  = 90 # positive because of the yaw = 180
-        elif vec2 == (0,0,1):
-            roll = 180
-        elif vec2 == (0,0,-1):
-            roll  = 0
-        else:
-            print("error 2 in yaw-pitch-roll")
-    elif vec1 == (0,1,0):
-        yaw = 90
-        pitch = 0
-        if vec2 == (1,0,0):
-            roll  = -90
-        elif vec2 == (-1,0,0):
-            roll  = 90
-        elif vec2 == (0,0,1):
-            roll  = 180
-        elif vec2 == (0,0,-1):
-            roll  = 0
-        else:
-            print("error 3 in yaw-pitch-roll")
-    elif vec1 == (0,-1,0):
-        yaw = -90
-        pitch = 0
-        if vec2 == (1,0,0):
-            roll  = 90 
-        elif vec2 == (-1,0,0):
-            roll  = -90 
-        elif vec2 == (0,0,1):
-            roll  = 180
-        elif vec2 == (0,0,-1):
-            roll  = 0
-        else:
-            print("error 4 in yaw-pitch-roll")
-    elif vec1 == (0,0,1):
-        pitch = -90
-        yaw = 0
-        if vec2 == (1,0,0):
-            roll  = 0 
-        elif vec2 == (-1,0,0):
-            roll  = 180 
-        elif vec2 == (0,1,0):
-            roll  = 90
-        elif vec2 == (0,-1,0):
-            roll  = -90
-        else:
-            print("error 5 in yaw-pitch-roll")
-    elif vec1 == (0,0,-1):
-        pitch = 90
-        yaw = 0
-        if vec2 == (1,0,0):
-            roll  = 180 
-        elif vec2 == (-1,0,0):
-            roll  = 0 
-        elif vec2 == (0,1,0):
-            roll  = 90
-        elif vec2 == (0,-1,0):
-            roll  = -90
-        else:
-            print("error 6 in yaw-pitch-roll")
-    elif vec1 == (0,0,0): # it doesn't matter the direction of vec1
-        yaw = 0
-        if vec2 == (1,0,0):
-            pitch = -90
-            roll  = 0 
-        elif vec2 == (-1,0,0):
-            pitch = 90
-            roll  = 0 
-        elif vec2 == (0,1,0):
-            pitch = 0
-            roll  = 90
-        elif vec2 == (0,-1,0):
-            pitch = 0
-            roll  = -90
-        elif vec2 == (0,0,1):
-            pitch = 0
-            roll  = 180
-        elif vec2 == (0,0,-1):
-            pitch = 0
-            roll  = 0 # the same position
-        else:
-            print("error 7 in yaw-pitch-roll")
+    # fast path: axis directions (the dictionary keys work with floats too)
+    rot = _rot_table.get((tuple(vec1), tuple(vec2)))
+    if rot is not None:
+        return FreeCAD.Rotation(rot)
+    return calc_rot_gen(vec1, vec2)
 
 
+def calc_rot_gen (vec1, vec2):
+    """
+    Same as calc_rot, for any perpendicular directions, not only
+    along the axes. It is the fallback of calc_rot: the rotation that takes
+    (1,0,0) to vec1 and (0,0,-1) to vec2
 
-    vrot = FreeCAD.Rotation(yaw,pitch,roll)
-    return vrot
+    Parameters
+    ----------
+    vec1 : tuple or FreeCAD.Vector
+        Direction, it can be (0,0,0) if it doesn't matter
+    vec2 : tuple or FreeCAD.Vector
+        Direction
+
+    Returns
+    --------
+    FreeCAD.Rotation
+    """
+
+    fc_vec1 = FreeCAD.Vector(*tuple(vec1))
+    fc_vecz = FreeCAD.Vector(*tuple(vec2)).negative()
+    if fc_vecz.Length == 0:
+        logger.error('calc_rot: vec2 is null')
+        return FreeCAD.Rotation()
+    if fc_vec1.Length == 0:  # it doesn't matter the direction of vec1
+        return FreeCAD.Rotation(VZ, fc_vecz)
+    if not fc_isperp(fc_vec1, fc_vecz):
+        logger.error('calc_rot: vectors are not perpendicular')
+    return FreeCAD.Rotation(fc_vec1, fc_vecz.cross(fc_vec1), fc_vecz, 'ZXY')
 
 
 def get_fcvectup (tup):
@@ -8935,6 +9803,9 @@ def calc_rot_z (v_refz, v_refx):
     return vrot
     
 
+# rotations of get_rot between axis directions, already calculated
+_get_rot_dict = {}
+
 def get_rot (v1, v2):
     """ 
     Calculate the rotation from v1 to v2
@@ -8965,12 +9836,49 @@ def get_rot (v1, v2):
     nv1 = DraftVecUtils.scaleTo(v1,1.)
     nv2 = DraftVecUtils.scaleTo(v2,1.)
 
-    if DraftVecUtils.equals(nv1,nv2.negative()):
-        # we have to flip, but DraftVecUtils.getRotation doesn't get it done
-        # for this case
-        return FreeCAD.Rotation(VX,180)
-    else:
-        return DraftVecUtils.getRotation(nv1,nv2)
+    key = (DraftVecUtils.tup(nv1), DraftVecUtils.tup(nv2))
+    rot = _get_rot_dict.get(key)
+    if rot is None:
+        if DraftVecUtils.equals(nv1,nv2.negative()):
+            # we have to flip, but DraftVecUtils.getRotation doesn't get it
+            # done for this case
+            rot = FreeCAD.Rotation(VX,180)
+        else:
+            rot = DraftVecUtils.getRotation(nv1,nv2)
+        # only the axis directions are kept, the others are rarely repeated
+        if _axis_ind(key[0]) is not None and _axis_ind(key[1]) is not None:
+            _get_rot_dict[key] = rot
+    if isinstance(rot, FreeCAD.Rotation):
+        return FreeCAD.Rotation(rot)
+    return rot
+
+
+# dimensions (0: Length, 1: Width, 2: Height) that end on the axes X, Y, Z
+# for each pair of axis indexes of (vec1, vec2) of calc_desp_ncen
+# the axis index -1 is vec1 (0,0,0)
+_DESP_DIMS = {
+    (0, 1): (0, 2, 1),
+    (0, 2): (0, 1, 2),
+    (1, 0): (2, 0, 1),
+    (1, 2): (1, 0, 2),
+    (2, 0): (2, 1, 0),
+    (2, 1): (1, 2, 0),
+    (-1, 0): (2, 1, 0),  # Pitch = -90. in calc_rot
+    (-1, 1): (0, 2, 1),  # Roll = +-90. in calc_rot
+    (-1, 2): (1, 0, 2),  # Nothing. Roll 0 or 180
+    }
+
+
+def _axis_ind (vec):
+    """ Returns the index of the axis of vec (tuple or FreeCAD.Vector)
+    0: X, 1: Y, 2: Z, -1 if (0,0,0), None if it is not on an axis
+    """
+    for ind in range(3):
+        if abs(vec[ind]) == 1:
+            return ind
+    if vec[0] == 0 and vec[1] == 0 and vec[2] == 0:
+        return -1
+    return None
 
 
 #  ---------------- calc_desp_ncen ------------------------
@@ -9087,93 +9995,23 @@ def calc_desp_ncen (Length, Width, Height,
     FreeCAD.Vector
         Vector of the displacement
     """
-    # rotation calculation
-    x = 0
-    y = 0
-    z = 0
-    if abs(vec1[0]) == 1: # X axis: vec1 == (1,0,0) or vec1 == (-1,0,0):
-        if abs(vec2[1]) == 1:   # Y
-            if cx == False:
-                x = Length / 2.0
-            if cy == False:
-                y = Height / 2.0
-            if cz == False:
-                z = Width / 2.0
-        elif abs(vec2[2]) == 1:    # Z
-            if cx == False:
-                x = Length / 2.0
-            if cy == False:
-                y = Width / 2.0
-            if cz == False:
-                z = Height / 2.0
-        else:
-            print("error 1 in calc_desp_ncen")
-    elif abs(vec1[1]) == 1: # Y axis
-        if abs(vec2[0]) == 1:   # X
-            if cx == False:
-                x = Height / 2.0
-            if cy == False:
-                y = Length / 2.0
-            if cz == False:
-                z = Width / 2.0
-        elif abs(vec2[2]) == 1:    # Z
-            if cx == False:
-                x = Width / 2.0
-            if cy == False:
-                y = Length / 2.0
-            if cz == False:
-                z = Height / 2.0
-        else:
-            print("error 2 in calc_desp_ncen")
-    elif abs(vec1[2]) == 1: # Z axis
-        if abs(vec2[0]) == 1:   # X
-            if cx == False:
-                x = Height / 2.0
-            if cy == False:
-                y = Width / 2.0
-            if cz == False:
-                z = Length / 2.0
-        elif abs(vec2[1]) == 1:    # Y
-            if cx == False:
-                x = Width / 2.0
-            if cy == False:
-                y = Height / 2.0
-            if cz == False:
-                z = Length / 2.0
-        else:
-            print("error 3 in calc_desp_ncen")
-    elif (vec1[0]==0 and vec1[1]==0 and vec1[2]==0): 
+    # index of the axis of each vector, -1 if vec1 is (0,0,0)
+    ax1 = _axis_ind(vec1)
+    ax2 = _axis_ind(vec2)
+    if ax1 == -1:
         #It doesn't matter vec1. Probably it is symmetrical on plane XY.
         # So Length and Width are the same
         if Width != Length:
             logger.error('Check rotation vec1=(0,0,0), and Length!=Width')
-        if abs(vec2[0]) == 1:   # X. Pitch = -90. in calc_rot
-            if cx == False:
-                x = Height / 2.0
-            if cy == False:
-                y = Width / 2.0
-            if cz == False:
-                z = Length / 2.0
-        elif abs(vec2[1]) == 1:   # Y. Roll = +-90. in calc_rot
-            if cx == False:
-                x = Length / 2.0
-            if cy == False:
-                y = Height / 2.0
-            if cz == False:
-                z = Width / 2.0
-        elif abs(vec2[2]) == 1:    # Z. Nothing. Roll 0 or 180
-            if cx == False:
-                x = Width / 2.0
-            if cy == False:
-                y = Length / 2.0
-            if cz == False:
-                z = Height / 2.0
-        else:
-            print("error 4 in calc_desp_ncen")
-    else:
-        print("error 5 in calc_desp_ncen")
-
-
+    dims_ind = _DESP_DIMS.get((ax1, ax2))
+    if dims_ind is None:
+        logger.error("error in calc_desp_ncen")
+        return FreeCAD.Vector(0,0,0)
+    dims = (Length, Width, Height)
+    # the centered dimensions are not displaced
+    x = 0 if cx else dims[dims_ind[0]] / 2.0
+    y = 0 if cy else dims[dims_ind[1]] / 2.0
+    z = 0 if cz else dims[dims_ind[2]] / 2.0
     vdesp = FreeCAD.Vector(x,y,z)
     return vdesp
 
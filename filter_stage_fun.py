@@ -122,10 +122,14 @@ import parts
 import partset
 import beltcl
 import kcomp
+import interference_fun
+import build_worker
 
 from fcfun import V0, VX, VY, VZ, V0ROT
 from fcfun import VXN, VYN, VZN
 
+logger = logging.getLogger(__name__)
+
 doc = FreeCAD.ActiveDocument
 
 axis_mov = VY
@@ -228,12 +232,14 @@ def filter_stage_fun(move_l, Filter_Length, Filter_Width, nut_hole, tens_stroke_
     # 4 bolts to attach the filter holder to the linear guide
     # the bolt head has to be touching the hole for the bolt: pos_d = 5
     bolt_head_pos = filter_holder.get_o_to_d(5)
+    filter_bolt_list = []
     for w_i in [-2, 2]:
         for d_i in [-1, 1]:
             # positions of the bolts at the linear guide
             filter_bolt_pos_i = (partLinGuideBlock.get_pos_dwh(d_i, w_i, 3)
                                  + bolt_head_pos)
-            fc_clss.Din912Bolt(metric=bolt_linguide_mtr,
+            filter_bolt_i = fc_clss.Din912Bolt(
+                               metric=bolt_linguide_mtr,
                                shank_l=(bolt_head_pos.Length
                                         + partLinGuideBlock.bolt_l),
                                shank_l_adjust=-1,  # shorter to shank_l
@@ -242,6 +248,7 @@ def filter_stage_fun(move_l, Filter_Length, Filter_Width, nut_hole, tens_stroke_
                                pos=filter_bolt_pos_i,
                                name='filter_bolt_w' + str(w_i) + '_d' + str(d_i)
                                )
+            filter_bolt_list.append(filter_bolt_i)
 
     # rail
     # the rail will be in the direction of:
@@ -532,3 +539,137 @@ def filter_stage_fun(move_l, Filter_Length, Filter_Width, nut_hole, tens_stroke_
         pos=motor_pull_pos)
 
     belt.set_color(fcfun.GRAY_08)
+
+    # the parts that move with the filter, and the belt, that changes
+    # with the movement. See filter_stage_sweep
+    return {'moving': [filter_holder, partLinGuideBlock] + filter_bolt_list,
+            'belt': belt}
+
+
+def filter_stage_sweep(n_samples, move_l, Filter_Length, Filter_Width,
+                       nut_hole, tens_stroke_Var, base_w, wall_thick_Var,
+                       size_motor, h_motor, thik_motor, pos,
+                       xtr_l=0, clear_max=5., min_vol=interference_fun.MIN_VOL,
+                       workers=None):
+    """ Sweeps the moving parts of the filter stage (filter holder with its
+    belt clamp, linear guide block and their bolts) along its travel, and
+    checks the clearances with the static parts.
+    The stage is built once, in a hidden temporary document, and then only
+    the placements of copies of the moving shapes are changed.
+    The belt is not checked, because it changes with the movement
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of positions of the travel to check, at least 2
+    move_l, ..., pos :
+        Arguments of filter_stage_fun
+    xtr_l : float
+        Extra length to sweep at each end of the travel, beyond move_l / 2,
+        to find where the travel limits are
+    clear_max : float
+        Clearances larger than this are not calculated, the pairs of parts
+        whose bounding boxes are farther apart are not checked
+    min_vol : float
+        Common volumes smaller than this are not a collision
+    workers : int
+        Maximum number of FreeCADCmd processes that check the samples
+        (see build_worker.run_calls), distToShape and common do not release
+        the GIL, so threads would not run them in parallel. If None, it is
+        taken from the number of processors. If 1, the samples are checked
+        here, one after the other
+
+    Returns
+    -------
+    Dictionary:
+        'mov_list' : list of the displacements along axis_mov of the samples
+        'clearance' : dictionary, key: (moving name, static name),
+                      value: (minimum clearance, displacement of the minimum)
+                      only the pairs closer than clear_max
+        'collision' : list of tuples (displacement, moving name,
+                      static name, common volume)
+        'travel' : tuple (min displacement, max displacement) of the
+                   samples without collision, from the center of the travel.
+                   None if the center has a collision
+    """
+
+    if n_samples < 2:
+        logger.error('at least 2 samples are needed')
+        return None
+    half_l = move_l / 2. + xtr_l
+    mov_list = [-half_l + 2. * half_l * i / (n_samples - 1)
+                for i in range(n_samples)]
+
+    # build the stage once, in a temporary document
+    doc_act = FreeCAD.ActiveDocument
+    sweep_doc = FreeCAD.newDocument(name='filter_sweep', hidden=True,
+                                    temp=True)
+    try:
+        FreeCAD.setActiveDocument(sweep_doc.Name)
+        part_dict = filter_stage_fun(move_l, Filter_Length, Filter_Width,
+                                     nut_hole, tens_stroke_Var, base_w,
+                                     wall_thick_Var, size_motor, h_motor,
+                                     thik_motor, pos)
+        sweep_doc.recompute()
+        mov_fco_list = [part.fco for part in part_dict['moving']]
+        mov_names = [fco.Name for fco in mov_fco_list]
+        skip_names = mov_names + [part_dict['belt'].fco.Name]
+        # Part.getShape: the parts can be links in instancing mode
+        mov_shp_list = [Part.getShape(fco) for fco in mov_fco_list]
+        stat_list = [(obj.Name, Part.getShape(obj))
+                     for obj in sweep_doc.Objects
+                     if not obj.InList and obj.Name not in skip_names]
+        stat_list = [(name, shp) for name, shp in stat_list if shp.Solids]
+    finally:
+        FreeCAD.closeDocument(sweep_doc.Name)
+        if doc_act is not None:
+            FreeCAD.setActiveDocument(doc_act.Name)
+
+    stat_names = [name for name, _ in stat_list]
+    stat_shp_list = [shp for _, shp in stat_list]
+    # one call for each sample, each shape is passed once to the processes
+    sample_list = build_worker.run_calls(
+                      'interference_fun', 'clearance_sample',
+                      [((mov_shp_list, stat_shp_list,
+                         DraftVecUtils.scale(axis_mov, mov), clear_max), {})
+                       for mov in mov_list],
+                      workers)
+
+    clear_dict = {}
+    collision_list = []
+    collide = []
+    for mov, sample in zip(mov_list, sample_list):
+        sample_collide = False
+        for i_mov, i_stat, dist, vol in sample:
+            key = (mov_names[i_mov], stat_names[i_stat])
+            if key not in clear_dict or dist < clear_dict[key][0]:
+                clear_dict[key] = (dist, mov)
+            if vol > min_vol:
+                collision_list.append((mov, key[0], key[1], vol))
+                sample_collide = True
+        collide.append(sample_collide)
+
+    # travel limits: from the center, the last samples without collision
+    i_cen = min(range(n_samples), key=lambda i: abs(mov_list[i]))
+    if collide[i_cen]:
+        logger.warning('collision at the center of the travel')
+        travel = None
+    else:
+        i_min = i_cen
+        while i_min > 0 and not collide[i_min - 1]:
+            i_min -= 1
+        i_max = i_cen
+        while i_max < n_samples - 1 and not collide[i_max + 1]:
+            i_max += 1
+        travel = (mov_list[i_min], mov_list[i_max])
+        if travel[0] > -move_l / 2. or travel[1] < move_l / 2.:
+            logger.warning('the travel is shorter than move_l: '
+                           + str(travel))
+    for mov, mov_name, stat_name, vol in collision_list:
+        logger.debug('collision at ' + str(mov) + ': ' + mov_name
+                     + ' - ' + stat_name + ' vol: ' + str(vol))
+
+    return {'mov_list': mov_list,
+            'clearance': clear_dict,
+            'collision': collision_list,
+            'travel': travel}
@@ -28,8 +28,45 @@
 import FreeCAD
 import FreeCADGui
 
+import snap_fun
 
-def grafic():
+# Maximum distance to snap the selected point (mm)
+SNAP_R = 10.
+
+
+def snap_select(index=None, r=SNAP_R):
+    """ Moves the selected object so its selected subelement snaps to the
+    nearest compatible point of the other objects (see snap_fun.sub_snap)
+
+    Parameters
+    ----------
+    index : snap_fun.SnapIndex
+        Index of the snap points. If None, it is made with the objects of
+        the active document
+    r : float
+        Maximum distance to snap
+
+    Returns
+    -------
+    int or None
+        Index of the target point in index, None if it has not snapped
+    """
+    sel_ex = FreeCADGui.Selection.getSelectionEx()[0]
+    pick = None
+    if sel_ex.PickedPoints:
+        pick = sel_ex.PickedPoints[0]
+    pt, kind, radius, vdir = snap_fun.sub_snap(sel_ex.SubObjects[0], pick)
+    if index is None:
+        index = snap_fun.SnapIndex()
+        index.add_doc()
+    return snap_fun.mate_batch(index, [(sel_ex.Object, pt, kind, radius,
+                                        vdir)], r)[0]
+
+
+def grafic(index=None, r=SNAP_R):
+    # only one object selected: it snaps to the nearest point
+    if len(FreeCADGui.Selection.getSelection()) == 1:
+        return snap_select(index, r)
     obj_select = FreeCADGui.Selection.getSelection()[0]
     sel = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
     pos1 = obj_select.getGlobalPlacement().Base
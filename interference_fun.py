@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Functions to check the interference between the parts of an assembly
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# Two phases:
+#   - broad phase: a bounding volume hierarchy (BoxTree) of the bounding
+#     boxes of the parts gives the pairs of parts whose boxes overlap
+#   - narrow phase: only for these pairs, the common volume of the shapes
+#     is calculated (OCC common). The pairs are evaluated in parallel, in
+#     FreeCADCmd processes (see build_worker.run_calls), because OCC does
+#     not release the GIL of a thread
+#
+#   Bounding box tuple: (x_min, y_min, z_min, x_max, y_max, z_max)
+#
+
+import logging
+
+import Part
+
+import build_worker
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Maximum number of boxes on a leaf of the BoxTree
+LEAF_SIZE = 4
+
+# Volumes smaller than this (mm3) are not considered an interference
+MIN_VOL = 0.001
+
+
+def bbox_tup(bbox, tol=0):
+    """ Returns the tuple of a FreeCAD.BoundBox, enlarged by tol on
+    each side
+
+    Parameters
+    ----------
+    bbox : FreeCAD.BoundBox
+    tol : float
+        Extra length on each side of the box
+
+    Returns
+    -------
+    Tuple of 6 floats: (x_min, y_min, z_min, x_max, y_max, z_max)
+    """
+
+    return (bbox.XMin - tol, bbox.YMin - tol, bbox.ZMin - tol,
+            bbox.XMax + tol, bbox.YMax + tol, bbox.ZMax + tol)
+
+
+def box_overlap(box1, box2):
+    """ Returns True if the 2 box tuples overlap (touching is overlapping)
+    """
+    return (box1[0] <= box2[3] and box2[0] <= box1[3] and
+            box1[1] <= box2[4] and box2[1] <= box1[4] and
+            box1[2] <= box2[5] and box2[2] <= box1[5])
+
+
+def box_join(box_list):
+    """ Returns the box tuple that contains all the boxes of the list
+    """
+    return (min(box[0] for box in box_list),
+            min(box[1] for box in box_list),
+            min(box[2] for box in box_list),
+            max(box[3] for box in box_list),
+            max(box[4] for box in box_list),
+            max(box[5] for box in box_list))
+
+
+class BoxTree(object):
+    """ Bounding volume hierarchy of axis-aligned boxes.
+    Each node has the box that contains all its boxes. The boxes are
+    split by the median of their centers along the longest axis of the node
+
+    Parameters
+    ----------
+    box_list : list of tuples of 6 floats
+        Boxes (x_min, y_min, z_min, x_max, y_max, z_max)
+    leaf_size : int
+        Maximum number of boxes on a leaf
+
+    Attributes
+    ----------
+    box_list : list of tuples of 6 floats
+    root : tuple
+        Root node. Nodes are tuples: (box, list of indexes, child1, child2)
+        leaves have no children (None) and internal nodes no indexes
+    """
+
+    def __init__(self, box_list, leaf_size=LEAF_SIZE):
+        self.box_list = list(box_list)
+        self.leaf_size = leaf_size
+        if self.box_list:
+            self.root = self.build(list(range(len(self.box_list))))
+        else:
+            self.root = None
+
+    def build(self, index_list):
+        """ Builds the node of the boxes with the indexes of index_list
+        """
+        node_box = box_join([self.box_list[i] for i in index_list])
+        if len(index_list) <= self.leaf_size:
+            return (node_box, index_list, None, None)
+        # longest axis of the node
+        size = [node_box[k + 3] - node_box[k] for k in range(3)]
+        axis = size.index(max(size))
+        index_list.sort(key=lambda i: (self.box_list[i][axis]
+                                       + self.box_list[i][axis + 3]))
+        mid = len(index_list) // 2
+        return (node_box, None,
+                self.build(index_list[:mid]),
+                self.build(index_list[mid:]))
+
+    def query(self, box):
+        """ Returns the list of indexes of the boxes that overlap box
+        """
+        result = []
+        if self.root is None:
+            return result
+        node_stack = [self.root]
+        while node_stack:
+            node_box, index_list, child1, child2 = node_stack.pop()
+            if not box_overlap(node_box, box):
+                continue
+            if index_list is not None:
+                result.extend([i for i in index_list
+                               if box_overlap(self.box_list[i], box)])
+            else:
+                node_stack.append(child1)
+                node_stack.append(child2)
+        return result
+
+    def overlap_pairs(self):
+        """ Returns the sorted list of pairs of indexes (i, j), i < j, of
+        the boxes that overlap
+        """
+        pair_list = []
+        for i, box in enumerate(self.box_list):
+            pair_list.extend([(i, j) for j in self.query(box) if j > i])
+        pair_list.sort()
+        return pair_list
+
+
+def common_vol(shp1, shp2):
+    """ Returns the volume of the common part of 2 shapes
+    """
+    try:
+        return shp1.common(shp2).Volume
+    except Exception as err:  # OCC errors are not specific
+        logger.warning('common failed: ' + str(err))
+        return 0.
+
+
+def clearance_sample(mov_shp_list, stat_shp_list, mov_vec, clear_max):
+    """ Checks the clearances of a sample of a sweep: the moving shapes
+    displaced by mov_vec, with the static shapes. Only the pairs whose
+    bounding boxes are closer than clear_max are checked.
+    It is called by build_worker.run_calls, one call for each sample
+
+    Parameters
+    ----------
+    mov_shp_list : list of TopoShape
+        Moving shapes, at the displacement 0
+    stat_shp_list : list of TopoShape
+        Static shapes
+    mov_vec : FreeCAD.Vector
+        Displacement of the moving shapes in this sample
+    clear_max : float
+        Maximum clearance to calculate
+
+    Returns
+    -------
+    list of tuples (i_mov, i_stat, clearance, vol)
+        Indexes of the shapes in their lists, clearance and volume of the
+        common part (0 if the clearance is not 0)
+    """
+    # broad phase: the static boxes are enlarged by clear_max
+    tree = BoxTree([bbox_tup(shp.BoundBox, clear_max)
+                    for shp in stat_shp_list])
+    result = []
+    for i_mov, mov_shp in enumerate(mov_shp_list):
+        shp = mov_shp.copy()
+        shp.translate(mov_vec)
+        for i_stat in tree.query(bbox_tup(shp.BoundBox)):
+            stat_shp = stat_shp_list[i_stat]
+            try:
+                dist = shp.distToShape(stat_shp)[0]
+            except Exception as err:  # OCC errors are not specific
+                logger.warning('distToShape failed: ' + str(err))
+                continue
+            vol = 0.
+            if dist == 0:
+                vol = common_vol(shp, stat_shp)
+            result.append((i_mov, i_stat, dist, vol))
+    return result
+
+
+def check_interference(shp_list, tol=0, min_vol=MIN_VOL, workers=None):
+    """ Checks the interference between the shapes of a list
+
+    Parameters
+    ----------
+    shp_list : list of TopoShape
+    tol : float
+        Extra length of the bounding boxes, to get the candidates of the
+        broad phase. It does not change the shapes
+    min_vol : float
+        Volumes smaller than this are not considered an interference
+    workers : int
+        Maximum number of processes of the narrow phase. If None, it is
+        taken from the number of processors. If 1, the pairs are evaluated
+        here, one after the other
+
+    Returns
+    -------
+    list of tuples (i, j, vol)
+        Indexes of the interfering shapes in shp_list (i < j) and volume
+        of the common part
+    """
+
+    tree = BoxTree([bbox_tup(shp.BoundBox, tol) for shp in shp_list])
+    pair_list = tree.overlap_pairs()
+    if not pair_list:
+        return []
+
+    # each shape is passed once to the processes, not once per pair
+    vol_list = build_worker.run_calls(
+                   'interference_fun', 'common_vol',
+                   [((shp_list[i], shp_list[j]), {}) for i, j in pair_list],
+                   workers)
+
+    return [(i, j, vol) for (i, j), vol in zip(pair_list, vol_list)
+            if vol > min_vol]
+
+
+def check_obj_interference(obj_list, tol=0, min_vol=MIN_VOL, workers=None):
+    """ Checks the interference between FreeCAD objects, see
+    check_interference. The shapes are taken with Part.getShape, so the
+    links (App::Link, parts in instancing mode) are checked with the shape
+    of the object they link, and they are placed with the placement of
+    the containers (App::Part) that have them. The objects without solids
+    are not checked
+
+    Parameters
+    ----------
+    obj_list : list of FreeCAD Objects
+
+    Returns
+    -------
+    list of tuples (obj1, obj2, vol)
+        Interfering objects and volume of their common part
+    """
+
+    chk_list = []
+    shp_list = []
+    for obj in obj_list:
+        shp = Part.getShape(obj)
+        if shp.isNull() or not shp.Solids:
+            logger.debug(obj.Name + ' has no solids, it is not checked')
+            continue
+        # placement of the containers, the shape has only its own
+        cont_place = obj.getGlobalPlacement().multiply(
+                                                obj.Placement.inverse())
+        if not cont_place.isIdentity():
+            shp.Placement = cont_place.multiply(shp.Placement)
+        chk_list.append(obj)
+        shp_list.append(shp)
+    return [(chk_list[i], chk_list[j], vol)
+            for i, j, vol in check_interference(shp_list, tol, min_vol,
+                                                workers)]
@@ -1549,11 +1549,45 @@ ENDSTOP_D3V = {'L': 37.8,
 #         diameter: for a GT2 is 
 #
 
+# Profile of the tooth of the belt, the grooves of the pulley have this
+# profile (fcfun.shp_gtpulley_face):
+#
+#      land     ROOT_R             ROOT_R     land
+#     ________                              ________
+#             \_                          _/
+#               \  flank          flank  /
+#                \ (center at          /
+#                 \  +FLANK_B)        /
+#                  \_     tip       _/
+#                     \____________/
+#                         TOOTH_R
+#
+# TOOTH_R: radius of the tip of the tooth, its bottom is TOOTH_H from the
+#          land
+# FLANK_B: the flank arcs are centered on the land line, at FLANK_B from
+#          the axis of the tooth, on the other side. Their radius makes them
+#          tangent to the tip arc (for GT2: 1.0)
+# ROOT_R: radius of the fillets between the flanks and the land
+# The values of GT3 are those of GT2 scaled by the tooth height, so its
+# profile is approximate
+
 GT2 = {'BELT_H': 1.38,  # total height
        'TOOTH_H': 0.75,  # tooth height
-       'PLD': 0.254  # pitch line distance
+       'PLD': 0.254,  # pitch line distance
+       'TOOTH_R': 0.555,  # tooth radius
+       'FLANK_B': 0.40,  # offset of the center of the flank arcs
+       'ROOT_R': 0.15  # radius of the root fillets
+       }
+
+GT3 = {'BELT_H': 2.41,  # total height
+       'TOOTH_H': 1.14,  # tooth height
+       'PLD': 0.381,  # pitch line distance
+       'TOOTH_R': 0.85,  # tooth radius
+       'FLANK_B': 0.61,  # offset of the center of the flank arcs
+       'ROOT_R': 0.23  # radius of the root fillets
        }
 
 GT = {
-      2: GT2
+      2: GT2,
+      3: GT3
      }
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Functions to export shapes to binary STL and 3MF build plates
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# The shapes are tessellated and their triangles are written directly to the
+# file, without creating intermediate Mesh objects.
+# Several shapes can be laid on the same build plate and written in a
+# single file:
+#   - binary STL: all the shapes are written as one triangle soup
+#   - 3MF: each shape is a separated object of the plate
+#
+#        plate_d
+#           :
+#           :________________________
+#           |                        |
+#           |  ___                   |
+#           | |   |  _____   __      |
+#           | |___| |_____| |__|     |   <- row 1
+#           |  ____   ___            |
+#           | |____| |___|           |   <- row 0
+#           x________________________|.....> plate_w
+#
+
+import os
+import struct
+import zipfile
+import logging
+
+import FreeCAD
+
+import kparts
+
+from fcfun import V0
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# default size of the build plate (mm)
+PLATE_W = 200.
+PLATE_D = 200.
+# default separation between the parts on the build plate (mm)
+PLATE_SEP = 5.
+
+# binary STL facet: normal, 3 vertexes and attribute byte count
+STL_FACET = struct.Struct('<12fH')
+
+MF_NS = 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'
+
+MF_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">'
+    '<Default Extension="rels" ContentType='
+    '"application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="model" ContentType='
+    '"application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>'
+    '</Types>')
+
+MF_RELS = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">'
+    '<Relationship Target="/3D/3dmodel.model" Id="rel0" Type='
+    '"http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>'
+    '</Relationships>')
+
+
+def shp_triangles(shp, lin_defl=kparts.LIN_DEFL):
+    """ Tessellates a shape and returns its points and triangles
+
+    Parameters
+    ----------
+    shp : TopoShape
+        Shape to tessellate. Its placement is taken into account
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    Tuple of 2 lists:
+        list of the points as tuples of 3 floats
+        list of the triangles as tuples of 3 indexes to the list of points
+    """
+
+    points, facets = shp.tessellate(lin_defl)
+    return [(pt.x, pt.y, pt.z) for pt in points], facets
+
+
+def tri_normal(p1, p2, p3):
+    """ Returns the unit normal of a triangle, as a tuple of 3 floats
+    (0, 0, 0) if the triangle is degenerated
+    """
+
+    ux, uy, uz = p2[0] - p1[0], p2[1] - p1[1], p2[2] - p1[2]
+    vx, vy, vz = p3[0] - p1[0], p3[1] - p1[1], p3[2] - p1[2]
+    nx = uy * vz - uz * vy
+    ny = uz * vx - ux * vz
+    nz = ux * vy - uy * vx
+    norm = (nx * nx + ny * ny + nz * nz) ** 0.5
+    if norm == 0:
+        return (0., 0., 0.)
+    return (nx / norm, ny / norm, nz / norm)
+
+
+def write_stl_bin(filename, shp_list, lin_defl=kparts.LIN_DEFL):
+    """ Writes a list of shapes in one binary STL file.
+    The triangles of each shape are streamed to the file as soon as the
+    shape is tessellated, so only one shape tessellation is kept in memory
+
+    Parameters
+    ----------
+    filename : str
+        Name of the STL file, including the path
+    shp_list : list of TopoShape
+        Shapes to write, they should be already at their print position
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    int
+        Number of triangles written
+    """
+
+    n_tri = 0
+    with open(filename, 'wb') as stl_file:
+        header = 'binary STL: ' + os.path.basename(filename)
+        stl_file.write(header.encode('ascii', 'replace')[:80].ljust(80, b' '))
+        # number of triangles, unknown until all the shapes are written
+        stl_file.write(struct.pack('<I', 0))
+        for shp in shp_list:
+            points, facets = shp_triangles(shp, lin_defl)
+            for i1, i2, i3 in facets:
+                p1 = points[i1]
+                p2 = points[i2]
+                p3 = points[i3]
+                stl_file.write(STL_FACET.pack(*(tri_normal(p1, p2, p3)
+                                                + p1 + p2 + p3 + (0,))))
+            n_tri += len(facets)
+        stl_file.seek(80)
+        stl_file.write(struct.pack('<I', n_tri))
+    return n_tri
+
+
+def write_3mf(filename, shp_list, name_list=None, lin_defl=kparts.LIN_DEFL):
+    """ Writes a list of shapes in one 3MF file, each shape is an object
+    of the build plate. The model is streamed to the zip file, shape by shape
+
+    Parameters
+    ----------
+    filename : str
+        Name of the 3MF file, including the path
+    shp_list : list of TopoShape
+        Shapes to write, they should be already at their position on the plate
+    name_list : list of str
+        Names of the objects, if None, they will be named part_1, part_2, ...
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    int
+        Number of triangles written
+    """
+
+    if name_list is None:
+        name_list = ['part_' + str(i + 1) for i in range(len(shp_list))]
+
+    n_tri = 0
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('[Content_Types].xml', MF_CONTENT_TYPES)
+        zip_file.writestr('_rels/.rels', MF_RELS)
+        with zip_file.open('3D/3dmodel.model', 'w') as model:
+            model.write(('<?xml version="1.0" encoding="UTF-8"?>\n'
+                         '<model unit="millimeter" xml:lang="en-US" '
+                         'xmlns="' + MF_NS + '"><resources>').encode('utf-8'))
+            for obj_id, (shp, name) in enumerate(zip(shp_list, name_list), 1):
+                points, facets = shp_triangles(shp, lin_defl)
+                model.write(('<object id="%d" name="%s" type="model">'
+                             '<mesh><vertices>'
+                             % (obj_id, xml_escape(name))).encode('utf-8'))
+                model.write(''.join(['<vertex x="%.6g" y="%.6g" z="%.6g"/>'
+                                     % pt for pt in points]).encode('utf-8'))
+                model.write(b'</vertices><triangles>')
+                model.write(''.join(['<triangle v1="%d" v2="%d" v3="%d"/>'
+                                     % tri for tri in facets]).encode('utf-8'))
+                model.write(b'</triangles></mesh></object>')
+                n_tri += len(facets)
+            model.write(b'</resources><build>')
+            for obj_id in range(1, len(shp_list) + 1):
+                model.write(('<item objectid="%d"/>' % obj_id).encode('utf-8'))
+            model.write(b'</build></model>')
+    return n_tri
+
+
+def xml_escape(text):
+    """ Escapes the characters that cannot be in a xml attribute
+    """
+    return (str(text).replace('&', '&amp;').replace('<', '&lt;')
+            .replace('>', '&gt;').replace('"', '&quot;'))
+
+
+def shp_print_pos(shp, rot=None):
+    """ Returns a copy of the shape rotated to its print orientation and
+    resting on the plane z = 0, with its bounding box starting at
+    x = 0, y = 0.
+    The copy is moved by its placement, the geometry is not rebuilt
+
+    Parameters
+    ----------
+    shp : TopoShape
+        Shape to place
+    rot : FreeCAD.Rotation
+        Rotation to its print orientation. If None, it is not rotated
+
+    Returns
+    -------
+    TopoShape
+    """
+
+    shp_cpy = shp.copy()
+    if rot is not None:
+        shp_cpy.Placement = FreeCAD.Placement(V0, rot).multiply(
+                                                         shp_cpy.Placement)
+    bbox = shp_cpy.BoundBox
+    shp_cpy.Placement = FreeCAD.Placement(
+                            FreeCAD.Vector(-bbox.XMin, -bbox.YMin, -bbox.ZMin),
+                            FreeCAD.Rotation()).multiply(shp_cpy.Placement)
+    return shp_cpy
+
+
+def plate_layout(shp_list, plate_w=PLATE_W, plate_d=PLATE_D, sep=PLATE_SEP):
+    """ Lays the shapes on build plates, in rows along plate_w.
+    The shapes have to be at their print position (see shp_print_pos).
+    When a plate is full, a new plate is started
+
+    Parameters
+    ----------
+    shp_list : list of TopoShape
+        Shapes to lay, already at their print orientation
+    plate_w : float
+        Size of the plate along X
+    plate_d : float
+        Size of the plate along Y
+    sep : float
+        Separation between the shapes
+
+    Returns
+    -------
+    list of lists of int and TopoShape
+        For each plate, a list of tuples with the index of the shape in
+        shp_list and the copy of the shape moved to its place on the plate
+    """
+
+    plate_list = []
+    plate = []
+    x_pos = 0
+    y_pos = 0
+    row_d = 0
+    # larger parts first, it fills the rows better
+    order = sorted(range(len(shp_list)),
+                   key=lambda i: -shp_list[i].BoundBox.YLength)
+    for shp_i in order:
+        shp = shp_list[shp_i]
+        bbox = shp.BoundBox
+        if bbox.XLength > plate_w or bbox.YLength > plate_d:
+            logger.warning('Shape ' + str(shp_i) + ' larger than the plate')
+        if x_pos > 0 and x_pos + bbox.XLength > plate_w:
+            # new row
+            x_pos = 0
+            y_pos += row_d + sep
+            row_d = 0
+        if y_pos > 0 and y_pos + bbox.YLength > plate_d:
+            # new plate
+            plate_list.append(plate)
+            plate = []
+            y_pos = 0
+        shp_cpy = shp.copy()
+        shp_cpy.translate(FreeCAD.Vector(x_pos - bbox.XMin,
+                                         y_pos - bbox.YMin,
+                                         - bbox.ZMin))
+        plate.append((shp_i, shp_cpy))
+        x_pos += bbox.XLength + sep
+        row_d = max(row_d, bbox.YLength)
+    if plate:
+        plate_list.append(plate)
+    return plate_list
+
+
+def export_plate(filename, shp_list, rot_list=None, name_list=None,
+                 plate_w=PLATE_W, plate_d=PLATE_D, sep=PLATE_SEP,
+                 lin_defl=kparts.LIN_DEFL):
+    """ Orients the shapes, lays them on build plates and writes each plate
+    in a binary STL or 3MF file, depending on the extension of filename.
+    If there is more than one plate, the files are numbered:
+    name_1.stl, name_2.stl, ...
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file, with extension .stl or .3mf
+    shp_list : list of TopoShape
+        Shapes to export
+    rot_list : list of FreeCAD.Rotation
+        Print orientation of each shape (None elements are not rotated)
+    name_list : list of str
+        Names of the shapes, only used in 3MF
+    plate_w, plate_d, sep : float
+        See plate_layout
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    list of str
+        Names of the files that have been written
+    """
+
+    base_name, ext = os.path.splitext(filename)
+    ext = ext.lower()
+    if ext not in ('.stl', '.3mf'):
+        logger.error('Not supported extension: ' + ext)
+        return []
+    if rot_list is None:
+        rot_list = [None] * len(shp_list)
+    if name_list is None:
+        name_list = ['part_' + str(i + 1) for i in range(len(shp_list))]
+
+    prnt_list = [shp_print_pos(shp, rot)
+                 for shp, rot in zip(shp_list, rot_list)]
+    plate_list = plate_layout(prnt_list, plate_w, plate_d, sep)
+
+    file_list = []
+    for plate_i, plate in enumerate(plate_list, 1):
+        if len(plate_list) == 1:
+            plate_filename = base_name + ext
+        else:
+            plate_filename = base_name + '_' + str(plate_i) + ext
+        plate_shps = [shp for _, shp in plate]
+        if ext == '.stl':
+            write_stl_bin(plate_filename, plate_shps, lin_defl)
+        else:
+            write_3mf(plate_filename, plate_shps,
+                      [name_list[shp_i] for shp_i, _ in plate], lin_defl)
+        file_list.append(plate_filename)
+    return file_list
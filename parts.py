@@ -355,9 +355,7 @@ class AluProfBracketPerp (object):
         shp_boltfuse = fcfun.fuseshplist(boltholes)
 
         shp_bracket = shp_box.cut(shp_boltfuse)
-        doc.recompute()
         shp_bracket =shp_bracket.removeSplitter()
-        doc.recompute()
 
         self.shp = shp_bracket
         self.wfco = wfco
@@ -1203,7 +1201,6 @@ class AluProfBracketPerpTwin (object):
 
         shp_twinbr = fcfun.fuseshplist([shp_brlin1, shp_union, shp_brlin2])
         
-        doc.recompute()
         shp_twinbr = shp_twinbr.removeSplitter()
 
         # chamfer the union 
@@ -1222,7 +1219,6 @@ class AluProfBracketPerpTwin (object):
                                                     fillet = 0,
                                                     radius = boltpehead_r )
 
-        doc.recompute()
         shp_twinbr = shp_twinbr.removeSplitter()
 
         bolthole_list = []
@@ -1267,9 +1263,7 @@ class AluProfBracketPerpTwin (object):
         shp_boltpe = fcfun.fuseshplist(bolthole_list)
 
         shp_twinbr = shp_twinbr.cut(shp_boltpe)
-        doc.recompute()
         shp_bracket =shp_twinbr.removeSplitter()
-        doc.recompute()
 
         self.shp = shp_bracket
         self.wfco = wfco
@@ -1515,6 +1509,9 @@ class IdlePulleyHolder (object):
         Height of the endstop. If 0 it will be just on top of the profile
     pos : FreeCAD.Vector
         Object Placement 
+    wfco : int
+        * 1: a FreeCAD object is created
+        * 0: only the shape is created, the document is not used
 
     Attributes
     ----------
@@ -1524,8 +1521,10 @@ class IdlePulleyHolder (object):
         Width of the holder
     height : float
         Height of the holder
-    fcoFat : 
-        Cad object of the compound
+    shp : Shape
+        Shape of the holder
+    fco : 
+        FreeCAD object of the holder, if wfco == 1
 
     """
     def __init__ (self, profile_size, pulleybolt_d, holdbolt_d, above_h,
@@ -1534,9 +1533,11 @@ class IdlePulleyHolder (object):
                   attach_dir = '-y', endstop_side = 0,
                   endstop_posh = 0,
                   pos = V0,
+                  wfco = 1,
                   name = "idlepulleyhold"):
 
         doc = FreeCAD.ActiveDocument
+        self.wfco = wfco
 
         self.profile_size = profile_size
         self.pulleybolt_d = pulleybolt_d
@@ -1754,48 +1755,62 @@ class IdlePulleyHolder (object):
             shp_holes = shp_pulleybolt.multiFuse(holes_list)
             shp_pulleyhold = shp_box.cut(shp_holes)
 
-            pulleyhold_aux = doc.addObject("Part::Feature", name + '_aux')
-            pulleyhold_aux.Shape = shp_pulleyhold
-
             # fillet the top part if it has no endstop. So the belt doesn't
             # hit the corner
             if endstop_side == 0:
                 fillet_r = (width - pulleynut_d_tol - 2 * extra_w) / 2.
-                pulleyhold_aux = fcfun.filletchamfer(
-                                       fco = pulleyhold_aux,
+                shp_fillet = fcfun.shp_filletchamfer(
+                                       shp = shp_pulleyhold,
                                        e_len = depth,
-                                       name = name + '_chmf',
                                        fillet = 1,
                                        radius = fillet_r,
                                        axis = 'y',
                                        zpos_chk = 1,
                                        zpos = above_h)
-                                          
-
-
-            h_nuthole = fcfun.NutHole (nut_r = pulleynut_d_tol/2.,
-                                       nut_h = pulleynut_hole_h,
-                                       hole_h = pulleydepth/2. + TOL,
-                                       name = name + '_nuthole',
-                                       extra = 1,
-                                       nuthole_x = 0,
-                                       cx = 1, cy = 0, holedown = 0)
-            nuthole = h_nuthole.fco
-            nuthole.Placement.Rotation = FreeCAD.Rotation(VX,-90)
-            nuthole.Placement.Base.y = depth - pulleydepth/2. - TOL
-            nuthole.Placement.Base.z = above_h - extra_w
-            
-            pulley_holder = doc.addObject("Part::Cut", name)
-            pulley_holder.Base = pulleyhold_aux    
-            pulley_holder.Tool = nuthole    
-            pulley_holder.Placement.Base = pos
+                if shp_fillet is not None:
+                    shp_pulleyhold = shp_fillet
+
+            # hole for the nut of the pulley bolt, the nut is introduced
+            # from the back (depth)
+            #          Y
+            #          :
+            #    ______:______
+            #   |    |   |    |  nut hole
+            #   |     \_/     |  + pulleydepth/2. + TOL
+            #   |_____________|...... X
+            pos_nuthole = FreeCAD.Vector(0, depth - pulleydepth/2. - TOL,
+                                         above_h - extra_w)
+            shp_nut = fcfun.shp_regprism_dirxtr (
+                                       n_sides = 6,
+                                       radius = pulleynut_d_tol/2.,
+                                       length = pulleynut_hole_h,
+                                       fc_normal = VZN,
+                                       fc_verx1 = VY,
+                                       pos = pos_nuthole)
+            shp_nut_slot = fcfun.shp_box_dir (
+                                       box_w = pulleynut_d_tol * fcfun.COS30,
+                                       box_d = pulleydepth/2. + TOL + 1,
+                                       box_h = pulleynut_hole_h,
+                                       fc_axis_w = VX,
+                                       fc_axis_d = VY,
+                                       fc_axis_h = VZN,
+                                       cw = 1, cd = 0, ch = 0,
+                                       pos = pos_nuthole)
+            shp_pulleyhold = shp_pulleyhold.cut(shp_nut.fuse(shp_nut_slot))
+            shp_pulleyhold.translate(pos)
 
-            self.fco = pulley_holder
-
-        doc.recompute()
+            self.shp = shp_pulleyhold
+            if wfco == 1:
+                # a freeCAD object is created
+                fco_pulleyhold = doc.addObject("Part::Feature", name)
+                fco_pulleyhold.Shape = shp_pulleyhold
+                self.fco = fco_pulleyhold
 
     def color (self, color = (1,1,1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
             
             
@@ -2916,6 +2931,9 @@ class ThinLinBearHouse (object):
         on the bolt or on the axis
     pos : FreeCAD.Vector
         Position of the reference point,
+    wfco : int
+        * 1: the FreeCAD objects are created
+        * 0: only the shapes are created, the document is not used
 
     Attributes
     ----------    
@@ -2930,7 +2948,11 @@ class ThinLinBearHouse (object):
     Dimensions:    
         * H, W, L
 
-    FreeCAD objects:
+    Shapes:
+        * shp_top : Top part of the linear bearing housing
+        * shp_bot : Bottom part of the linear bearing housing
+
+    FreeCAD objects (if wfco == 1):
         * fco_top : Top part of the linear bearing housing
         * fco_bot : Bottom part of the linear bearing housing
 
@@ -3002,10 +3024,12 @@ class ThinLinBearHouse (object):
                  mid_center  = 1,
                  bolt_center  = 0,
                  pos = V0,
+                 wfco = 1,
                  name = 'thinlinbearhouse'
                 ):
 
         self.name = name
+        self.wfco = wfco
         self.base_place = (0,0,0)
         # normalize, just in case
         n1_slide_axis = DraftVecUtils.scaleTo(fc_slide_axis,1)
@@ -3195,7 +3219,6 @@ class ThinLinBearHouse (object):
 
         shp_holes = shp_rodlbear.multiFuse(bolt_holes)       
         shp_lbear_housing = shp_block.cut(shp_holes)
-        doc.recompute()
         # making 2 parts, intersection with 2 boxes:
         shp_box_top = fcfun.shp_box_dir(
                                      box_w = housing_w + 2,
@@ -3207,8 +3230,6 @@ class ThinLinBearHouse (object):
                                      pos = axiscenter_pos)
         shp_lbear_housing_top = shp_lbear_housing.common(shp_box_top)
         shp_lbear_housing_top = shp_lbear_housing_top.removeSplitter() 
-        fco_lbear_top = doc.addObject("Part::Feature", name + '_top') 
-        fco_lbear_top.Shape = shp_lbear_housing_top
 
 
         shp_box_bot = fcfun.shp_box_dir(
@@ -3222,21 +3243,33 @@ class ThinLinBearHouse (object):
                                      pos = axiscenter_pos)
         shp_lbear_housing_bot = shp_lbear_housing.common(shp_box_bot)
         shp_lbear_housing_bot = shp_lbear_housing_bot.removeSplitter()
-        fco_lbear_bot = doc.addObject("Part::Feature", name + '_bot') 
-        fco_lbear_bot.Shape = shp_lbear_housing_bot
 
-        self.fco_top = fco_lbear_top
-        self.fco_bot = fco_lbear_bot
+        self.shp_top = shp_lbear_housing_top
+        self.shp_bot = shp_lbear_housing_bot
+        if wfco == 1:
+            fco_lbear_top = doc.addObject("Part::Feature", name + '_top') 
+            fco_lbear_top.Shape = shp_lbear_housing_top
+            fco_lbear_bot = doc.addObject("Part::Feature", name + '_bot') 
+            fco_lbear_bot.Shape = shp_lbear_housing_bot
+            self.fco_top = fco_lbear_top
+            self.fco_bot = fco_lbear_bot
 
     def BasePlace (self, position = (0,0,0)):
         self.base_place = position
         vpos = FreeCAD.Vector(position)
-        self.fco_top.Placement.Base = vpos
-        self.fco_bot.Placement.Base = vpos
+        if self.wfco == 1:
+            self.fco_top.Placement.Base = vpos
+            self.fco_bot.Placement.Base = vpos
+        else:
+            self.shp_top.Placement.Base = vpos
+            self.shp_bot.Placement.Base = vpos
 
     def color (self, color = (1,1,1)):
-        self.fco_top.ViewObject.ShapeColor = color
-        self.fco_bot.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco_top.ViewObject.ShapeColor = color
+            self.fco_bot.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
     def export_stl (self, name = ""):
         #filepath = os.getcwd()
@@ -3337,6 +3370,10 @@ class LinBearHouse (object):
         4: axis_center=1
            mid_center =0
 
+    wfco: 1: the FreeCAD objects fco_top and fco_bot are created
+          0: only the shapes shp_top and shp_bot are created, the document
+             is not used
+
     """
 
 
@@ -3353,6 +3390,7 @@ class LinBearHouse (object):
                  axis_center = 1,
                  mid_center  = 1,
                  pos = V0,
+                 wfco = 1,
                  name = 'linbearhouse'
                 ):
 
@@ -3368,6 +3406,7 @@ class LinBearHouse (object):
         self.bolt_d =  d_lbearhousing['bolt_d']
         axis_h = self.axis_h
         self.name = name
+        self.wfco = wfco
 
 
         # normalize, just in case they are not
@@ -3486,7 +3525,6 @@ class LinBearHouse (object):
         shp_holes = shp_rodlbear.multiFuse(bolt_holes)       
         shp_lbear_housing = shp_housing_fllt.cut(shp_holes)
         #Part.show(shp_lbear_housing)
-        doc.recompute()
         # making 2 parts, intersection with 2 boxes:
         shp_box_top = fcfun.shp_box_dir(
                                      box_w = housing_w + 2,
@@ -3498,8 +3536,6 @@ class LinBearHouse (object):
                                      pos = axiscenter_pos)
         shp_lbear_housing_top = shp_lbear_housing.common(shp_box_top)
         shp_lbear_housing_top = shp_lbear_housing_top.removeSplitter() 
-        fco_lbear_top = doc.addObject("Part::Feature", name + '_top') 
-        fco_lbear_top.Shape = shp_lbear_housing_top
 
         shp_box_bot = fcfun.shp_box_dir(
                                      box_w = housing_w + 2,
@@ -3512,16 +3548,24 @@ class LinBearHouse (object):
                                      pos = axiscenter_pos)
         shp_lbear_housing_bot = shp_lbear_housing.common(shp_box_bot)
         shp_lbear_housing_bot = shp_lbear_housing_bot.removeSplitter()
-        fco_lbear_bot = doc.addObject("Part::Feature", name + '_bot') 
-        fco_lbear_bot.Shape = shp_lbear_housing_bot
 
-        self.fco_top = fco_lbear_top
-        self.fco_bot = fco_lbear_bot
-        doc.recompute()
+        self.shp_top = shp_lbear_housing_top
+        self.shp_bot = shp_lbear_housing_bot
+        if wfco == 1:
+            fco_lbear_top = doc.addObject("Part::Feature", name + '_top') 
+            fco_lbear_top.Shape = shp_lbear_housing_top
+            fco_lbear_bot = doc.addObject("Part::Feature", name + '_bot') 
+            fco_lbear_bot.Shape = shp_lbear_housing_bot
+            self.fco_top = fco_lbear_top
+            self.fco_bot = fco_lbear_bot
+            doc.recompute()
 
     def color (self, color = (1,1,1)):
-        self.fco_top.ViewObject.ShapeColor = color
-        self.fco_bot.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco_top.ViewObject.ShapeColor = color
+            self.fco_bot.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
     def export_stl (self, name = ""):
         #filepath = os.getcwd()
@@ -5185,6 +5229,7 @@ class Plate3CageCubes (object):
         pos: FreeCAD.Vector with the position of the reference. 
                Center of the hole of the middle plate, on the face touching
                the cagecube
+        wfco: 1: a FreeCAD object is created, 0: only the shape is created
         name: str with the name of the FreeCAD.Object
 
     """
@@ -5213,6 +5258,7 @@ class Plate3CageCubes (object):
                  holes_tol = 0,
                  moreboltholes = 0,
                  pos = V0,
+                 wfco = 1,
                  name = 'Plate3CageCubes'
                 ):
 
@@ -5487,14 +5533,19 @@ class Plate3CageCubes (object):
         shp_holes = fcfun.fuseshplist(holes_list)
         shp_plate = shp_box.cut(shp_holes)
 
-
-        doc = FreeCAD.ActiveDocument
-        fco_plate =  doc.addObject("Part::Feature", name) 
-        fco_plate.Shape = shp_plate
-        self.fco = fco_plate
+        self.shp = shp_plate
+        self.wfco = wfco
+        if wfco == 1:
+            doc = FreeCAD.ActiveDocument
+            fco_plate =  doc.addObject("Part::Feature", name) 
+            fco_plate.Shape = shp_plate
+            self.fco = fco_plate
 
     def color (self, color = (1,1,1)):
-        self.fco.ViewObject.ShapeColor = color
+        if self.wfco == 1:
+            self.fco.ViewObject.ShapeColor = color
+        else:
+            logger.debug("Object with no fco")
 
     # exports the shape to STL format
     def export_stl (self, name = ""):
@@ -5736,9 +5787,7 @@ class hallestop_holder (object):
         shp_boltfuse = fcfun.fuseshplist(boltholes)
 
         shp_bracket = shp_box.cut(shp_boltfuse)
-        doc.recompute()
         shp_bracket =shp_bracket.removeSplitter()
-        doc.recompute()
 
         self.shp = shp_bracket
         self.wfco = wfco
@@ -5945,9 +5994,14 @@ class sensor_holder (object):
         shp_solid = fcfun.fuseshplist(shp_list)
         shp_final = shp_solid.cut(shp_holes)
         shp_final = shp_final.removeSplitter()
-        
-        fco_sensor_holder = FreeCAD.ActiveDocument.addObject("Part::Feature", name )
-        fco_sensor_holder.Shape = shp_final
+
+        self.shp = shp_final
+        self.wfco = wfco
+        if wfco == 1:
+            fco_sensor_holder = FreeCAD.ActiveDocument.addObject(
+                                                        "Part::Feature", name )
+            fco_sensor_holder.Shape = shp_final
+            self.fco = fco_sensor_holder
         
  
 #sensor_holder()
@@ -84,6 +84,7 @@ class BearWashSet(fc_clss.PartsSet):
         
     group : int
         1: make a group
+        2: make a container (App::Part), see fc_clss.PartsSet.make_fco_group
         0: leave as individual components
         
     pos : FreeCAD.Vector
@@ -274,8 +275,7 @@ class BearWashSet(fc_clss.PartsSet):
                                             name='idlpull_lwash_tp')
             self.append_part(lwash_t)
 
-            if group == 1:
-                self.make_group()
+            self.make_fco_group(group)
 
 
 # doc = FreeCAD.newDocument()
@@ -370,6 +370,7 @@ class Din912BoltWashSet(fc_clss.PartsSet):
         
     group : int
         1: make a group
+        2: make a container (App::Part), see fc_clss.PartsSet.make_fco_group
         0: leave as individual components
         
     pos : FreeCAD.Vector
@@ -530,8 +531,7 @@ class Din912BoltWashSet(fc_clss.PartsSet):
                                            pos_h=-1,  # base of cylinder
                                            pos=self.get_pos_h(2))
         self.append_part(washer)
-        if group == 1:
-            self.make_group()
+        self.make_fco_group(group)
 
 
 # boltwash = Din912BoltWashSet(metric = 3, shank_l = 20,
@@ -592,6 +592,7 @@ class Din934NutWashSet(fc_clss.PartsSet):
 
     group : int
         1: make a group
+        2: make a container (App::Part), see fc_clss.PartsSet.make_fco_group
         0: leave as individual components
         
     pos : FreeCAD.Vector
@@ -715,8 +716,7 @@ class Din934NutWashSet(fc_clss.PartsSet):
                                            pos_h=-1,  # base of cylinder
                                            pos=self.pos_o)
         self.append_part(washer)
-        if group == 1:
-            self.make_group()
+        self.make_fco_group(group)
 
 
 # nut_wash = Din934NutWashSet(metric =4,
@@ -1088,8 +1088,7 @@ class NemaMotorPulleySet(fc_clss.PartsSet):
         self.set_part_place(gt_pulley, self.get_o_to_h(6))
 
         self.place_fcos()
-        if group == 1:
-            self.make_group()
+        self.make_fco_group(group)
 
     def get_nema_motor(self):
         """ gets the nema motor"""
@@ -1446,8 +1445,7 @@ class NemaMotorPulleyHolderSet(fc_clss.PartsSet):
                             + self.get_o_to_d(3))
 
         self.place_fcos()
-        if group == 1:
-            self.make_group()
+        self.make_fco_group(group)
 
     def get_nema_holder(self):
         """ gets the nema holder"""
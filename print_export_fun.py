@@ -6,128 +6,84 @@
 # ----------------------------------------------------------------------------
 # -- This function set the object to the print position and export the object.
 
+import os
+import json
+import math
+
 import FreeCAD
 import FreeCADGui
+import Part
 import MeshPart
 from PySide import QtWidgets
 import kparts
+import fcfun
+import build_worker
+import mesh_export_fun
+import print_orient_fun
 
 
-def print_export(obj_select):
-    show_message = True
-    place_old = obj_select.Placement
-
-    # _________Motor_Holder_________
-    if 'motorholder' in obj_select.Name or 'nema_holder' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 180)
-        centre = FreeCAD.Vector(0, 0, 0)
+def get_prnt_ax(obj):
+    """ Returns the print axis of an object, in the frame of its shape
+    (Shape of the object or of the link, with its placement).
+    It is the property PrintAxis of the object, or of the object it links,
+    that the parts of the library have (see fc_clss.SinglePart)
 
-    # _________Idler_Tensioner_________
-    elif 'idler_tensioner' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-        centre = FreeCAD.Vector(0, 0, 0)
-
-    # _________Tensioner_Holder_________
-    elif 'tensioner_holder' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), -90)
-        centre = FreeCAD.Vector(0, 0, 0)
-
-    # _________Filter_Holder_________
-    elif 'filter_holder' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
+    Parameters
+    ----------
+    obj : FreeCAD Object
 
-    # _________Nema_Holder_________
-    # elif 'nema_holder' in obj_select.Name:
-    #    pos = obj_select.Placement.Base
-    #    rot = FreeCAD.Rotation(FreeCAD.Vector(0,1,0),180) 
-    #    centre = FreeCAD.Vector(0,0,0)
+    Returns
+    -------
+    FreeCAD.Vector
+        None if the object has no print axis
+    """
 
-    # _________Linbearhouse_________
-    elif 'linbear' in obj_select.Name:
-        if 'top' in obj_select.Name:
-            pos = obj_select.Placement.Base
-            rot = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 180)
-            centre = FreeCAD.Vector(0, 0, 0)
+    shp_obj = getattr(obj, 'LinkedObject', None) or obj
+    prnt_ax = getattr(shp_obj, 'PrintAxis', None)
+    if prnt_ax is None:
+        return None
+    # the shape is moved by the placement of the object (or of the link)
+    return obj.Placement.Rotation.multVec(prnt_ax)
 
-        elif 'bot' in obj_select.Name:
-            pos = obj_select.Placement.Base
-            rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-            centre = FreeCAD.Vector(0, 0, 0)
 
-        else:
-            message = QtWidgets.QMessageBox()
-            message.Critical()
-            message.setWindowTitle('Critial error')
-            message.setText('Not position set for this model')
-            message.setStandardButtons(QtWidgets.QMessageBox.Ok)
-            message.setDefaultButton(QtWidgets.QMessageBox.Ok)
-            message.exec_()
+def get_print_rot(obj_select):
+    """ Returns the rotation to set the object to its print position.
+    It is calculated from its geometry (see print_orient_fun), so any
+    object with a shape gets an orientation
 
-    # _________Bracket_________
-    elif 'bracket' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
-    
-    # _________Bracket_3_________
-    # elif bracket3 in obj_select.Name:
-    #    pos = obj_select.Placement.Base
-    #    rot = FreeCAD.Rotation(FreeCAD.Vector(0,0,0),0)
-    #    centre = FreeCAD.Vector(0,0,0)
-
-    # _________Bracket_Twin_________
-    # elif bracket_twin in obj_select.Name:
-    #    pos = obj_select.Placement.Base
-    #    rot = FreeCAD.Rotation(FreeCAD.Vector(0,0,0),0)
-    #    centre = FreeCAD.Vector(0,0,0)
-
-    # _________Shaft_________
-    elif 'shaft' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
+    Parameters
+    ----------
+    obj_select : FreeCAD Object
 
-    # _________IdlepulleyHold_________
-    elif 'idlepulleyhold' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
+    Returns
+    -------
+    FreeCAD.Rotation
+        None if the object has no shape to print
+    """
 
-    # _________Simple_End_Stop_Holder_________
-    elif 'simple_endstop_holder' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
+    if not hasattr(obj_select, 'Shape') or obj_select.Shape.isNull():
+        return None
+    return print_orient_fun.get_print_rot_shp(obj_select.Shape,
+                                              get_prnt_ax(obj_select))
 
-    # _________Stop_Holder_________
-    elif 'stop_holder' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
 
-    # _________Belt_Clamp_________
-    elif 'belt_clamp' in obj_select.Name:
-        pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 0), 0)
-        centre = FreeCAD.Vector(0, 0, 0)
+def print_export(obj_select):
+    show_message = True
+    place_old = obj_select.Placement
 
-    # _________Sensor_Holder_________
-    elif 'sensorholder' in obj_select.Name:
+    rot = get_print_rot(obj_select)
+    if rot is not None:
         pos = obj_select.Placement.Base
-        rot = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
+        # the rotation is calculated on the shape at its current placement
+        rot = rot.multiply(obj_select.Placement.Rotation)
         centre = FreeCAD.Vector(0, 0, 0)
 
-    # _________Not_Name_________
+    # _________No_Shape_________
     else:
         message = QtWidgets.QMessageBox()
         message.setIcon(QtWidgets.QMessageBox.Icon.Warning)
         message.setWindowTitle('Sorry')
-        message.setText('This object is not a workbench object.\n')
+        message.setText('This object has no shape to print.\n')
         message.setStandardButtons(QtWidgets.QMessageBox.Ok)
         message.setDefaultButton(QtWidgets.QMessageBox.Ok)
         message.exec_()
@@ -169,3 +125,182 @@ def print_export(obj_select):
             message.setStandardButtons(QtWidgets.QMessageBox.Ok)
             message.setDefaultButton(QtWidgets.QMessageBox.Ok)
             message.exec_()
+
+
+def print_export_plate(obj_list, filename,
+                       plate_w=mesh_export_fun.PLATE_W,
+                       plate_d=mesh_export_fun.PLATE_D,
+                       sep=mesh_export_fun.PLATE_SEP):
+    """ Exports a list of objects, at their print position, to build plates
+    in binary STL or 3MF files (depending on the extension of filename).
+    The objects are not moved, the shapes are tessellated and written
+    without creating Mesh objects.
+    The print orientations of all the objects are calculated in one batch
+
+    Parameters
+    ----------
+    obj_list : list of FreeCAD Objects
+    filename : str
+        Name of the file, with extension .stl or .3mf
+    plate_w, plate_d, sep : float
+        Size of the build plate and separation between the parts
+
+    Returns
+    -------
+    list of str
+        Names of the files that have been written
+    """
+
+    return mesh_export_fun.export_plate(
+                filename,
+                shp_list=[Part.getShape(obj) for obj in obj_list],
+                rot_list=print_orient_fun.get_print_rot_shplist(
+                             [Part.getShape(obj) for obj in obj_list],
+                             [get_prnt_ax(obj) for obj in obj_list]),
+                name_list=[obj.Name for obj in obj_list],
+                plate_w=plate_w, plate_d=plate_d, sep=sep)
+
+
+# name of the manifest file written by print_export_batch
+MANIFEST_NAME = 'manifest.json'
+
+
+def get_print_objs(obj_list):
+    """ Returns the list of objects to print from a list of objects:
+    groups and compounds are expanded to their children, and only the
+    objects with solids are taken. Each object is taken once.
+    The links (App::Link, parts in instancing mode) are taken with the
+    shape of the object they link
+
+    Parameters
+    ----------
+    obj_list : list of FreeCAD Objects
+        It can be the selection, a group or all the objects of a document
+
+    Returns
+    -------
+    list of FreeCAD Objects
+    """
+
+    prnt_list = []
+    name_set = set()
+    obj_stack = list(reversed(obj_list))
+    while obj_stack:
+        obj = obj_stack.pop()
+        if obj.Name in name_set:
+            continue
+        name_set.add(obj.Name)
+        # groups (App::DocumentObjectGroup, App::Part) and compounds
+        child_list = getattr(obj, 'Group', None) or getattr(obj, 'Links', None)
+        if child_list:
+            obj_stack.extend(reversed(child_list))
+        elif Part.getShape(obj).Solids:
+            prnt_list.append(obj)
+    return prnt_list
+
+
+def get_doc_print_objs(doc=None):
+    """ Returns the list of objects to print of a document: the objects
+    that are not used by other objects (the top of each tree), expanding
+    groups and compounds
+
+    Parameters
+    ----------
+    doc : FreeCAD document
+        If None, the active document
+
+    Returns
+    -------
+    list of FreeCAD Objects
+    """
+
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    return get_print_objs([obj for obj in doc.Objects if not obj.InList])
+
+
+def print_export_batch(obj_list, folder_name, workers=None, dedupe=False):
+    """ Exports a list of objects to STL files, one per object, at their
+    print position, without dialogs.
+    The objects are not moved: the print orientations are calculated in
+    one batch, and copies of the shapes are tessellated and written in
+    parallel, in FreeCADCmd processes (see build_worker.run_calls).
+    A manifest (MANIFEST_NAME) with the exported files is written
+    in the folder.
+    With dedupe, the objects with the same geometry (see
+    fcfun.shp_dedupe) share the file of the first of them, so each
+    different shape is tessellated and written only once
+
+    Parameters
+    ----------
+    obj_list : list of FreeCAD Objects
+        Selection, groups or document objects, see get_print_objs
+    folder_name : str
+        Directory where the files are written
+    workers : int
+        Maximum number of processes to tessellate and write, if None, it
+        is taken from the number of processors. If 1, the files are
+        written here, one after the other
+    dedupe : bool
+        True: the objects with the same geometry share one file. When the
+        handedness of the shapes cannot be told (see fcfun.shp_chirality),
+        they share it only if they coincide at their print positions, so
+        mirrored parts are not taken as the same part
+        False: a file for each object
+
+    Returns
+    -------
+    list of dict
+        The entries of the manifest, one for each exported object, with
+        the rotation of the object to its print position.
+        With dedupe, the entries have the fingerprint of the shape, and the
+        repeated objects have the file of the exported one
+    """
+
+    obj_list = get_print_objs(obj_list)
+    if not obj_list:
+        return []
+    shp_list = [Part.getShape(obj) for obj in obj_list]
+    # the rotation of each object, the repeated ones can be at any position
+    rot_list = print_orient_fun.get_print_rot_shplist(
+                   shp_list, [get_prnt_ax(obj) for obj in obj_list])
+    # the copies are made here, the processes only tessellate and write
+    prnt_list = [mesh_export_fun.shp_print_pos(shp, rot)
+                 for shp, rot in zip(shp_list, rot_list)]
+    if dedupe:
+        fp_list, first_list = fcfun.shp_dedupe(shp_list,
+                                               check_list=prnt_list)
+    else:
+        fp_list = [None] * len(obj_list)
+        first_list = list(range(len(obj_list)))
+    # only the first object of each geometry is exported
+    uniq_list = [obj_i for obj_i, first_i in enumerate(first_list)
+                 if obj_i == first_i]
+    file_list = [os.path.join(folder_name, obj_list[obj_i].Name + '.stl')
+                 for obj_i in uniq_list]
+
+    n_tri_list = build_worker.run_calls(
+                     'mesh_export_fun', 'write_stl_bin',
+                     [((filename, [prnt_list[obj_i]]), {})
+                      for filename, obj_i in zip(file_list, uniq_list)],
+                     workers)
+
+    # index of the exported object in uniq_list
+    uniq_dict = {obj_i: uniq_i for uniq_i, obj_i in enumerate(uniq_list)}
+    manifest = []
+    for obj, fp, first_i, rot in zip(obj_list, fp_list, first_list,
+                                     rot_list):
+        uniq_i = uniq_dict[first_i]
+        axis = rot.Axis
+        entry = {'name': obj.Name,
+                 'label': obj.Label,
+                 'file': os.path.basename(file_list[uniq_i]),
+                 'triangles': n_tri_list[uniq_i],
+                 'rot_axis': [axis.x, axis.y, axis.z],
+                 'rot_angle': math.degrees(rot.Angle)}
+        if fp is not None:
+            entry['fingerprint'] = fp
+        manifest.append(entry)
+    with open(os.path.join(folder_name, MANIFEST_NAME), 'w') as man_file:
+        json.dump(manifest, man_file, indent=2)
+    return manifest
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Functions to find the print orientation of a shape
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# The shape is tessellated once, and then each candidate orientation is
+# evaluated on the triangles:
+#   - overhang area: triangles facing down, that are not on the bed
+#   - contact area: triangles facing down, that are on the bed
+#   - height of the part
+#
+# The candidates are the up directions (the direction that will point to Z
+# on the printer). The 24 axis-aligned orientations have only 6 different
+# up directions, the rotation around the vertical axis doesn't change the
+# overhang, contact area or height. So, by default, the 6 axis directions
+# are evaluated, and the prnt_ax of the part can be added as a candidate.
+#
+#          up (axis that will be Z)
+#           :
+#         __:__
+#        |     |__      <- overhang (facing down, not on the bed)
+#        |________|     <- contact (facing down, on the bed)
+#     ========================== bed
+#
+
+import logging
+
+import numpy as np
+
+import FreeCAD
+
+import kparts
+
+from fcfun import VX, VY, VZ, VXN, VYN, VZN
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Up directions evaluated by default
+UP_DIR_LIST = [VZ, VZN, VX, VXN, VY, VYN]
+
+# A triangle is an overhang if its normal points down more than this:
+# cos(45) -> triangles with less than 45 degrees from the horizontal
+OVERHANG_COS = 0.7071
+# A triangle facing down is flat if its normal points down more than this
+FLAT_COS = 0.999
+# Distance to the bed to consider that a flat triangle is on the bed
+CONTACT_TOL = 0.05
+
+# Weights of the criteria, areas are relative to the total area,
+# and height relative to the diagonal of the bounding box
+OVERHANG_W = 1.
+CONTACT_W = 0.5
+HEIGHT_W = 0.2
+# Scores closer than this are considered a tie
+SCORE_TOL = 1e-6
+
+
+def shp_facet_arr(shp, lin_defl=kparts.LIN_DEFL):
+    """ Tessellates the shape and returns the arrays to evaluate the
+    orientations
+
+    Parameters
+    ----------
+    shp : TopoShape
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    Tuple of 4 numpy arrays:
+        points : (n_points, 3) coordinates of the points
+        normals : (n_tri, 3) unit normals of the triangles
+        areas : (n_tri,) areas of the triangles
+        centers : (n_tri, 3) centroids of the triangles
+    """
+
+    points, facets = shp.tessellate(lin_defl)
+    points = np.array([(pt.x, pt.y, pt.z) for pt in points], dtype=float)
+    if len(facets) == 0:
+        empty = np.zeros((0, 3))
+        return points.reshape(-1, 3), empty, np.zeros(0), empty
+    tri = points[np.array(facets, dtype=int)]  # (n_tri, 3 vertexes, 3)
+    cross = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    norm = np.linalg.norm(cross, axis=1)
+    areas = norm / 2.
+    normals = cross / np.where(norm > 0, norm, 1.)[:, None]
+    centers = tri.mean(axis=1)
+    return points, normals, areas, centers
+
+
+def get_up_arr(prnt_ax=None):
+    """ Returns the array of candidate up directions: the 6 axis directions
+    and prnt_ax, if given and it is not one of them
+    """
+
+    up_list = [(v.x, v.y, v.z) for v in UP_DIR_LIST]
+    if prnt_ax is not None and prnt_ax.Length > 0:
+        prnt_ax = FreeCAD.Vector(prnt_ax).normalize()
+        prnt_tup = (prnt_ax.x, prnt_ax.y, prnt_ax.z)
+        if prnt_tup not in up_list:
+            up_list.append(prnt_tup)
+    return np.array(up_list, dtype=float)
+
+
+def get_rot_up(up_vec):
+    """ Returns the rotation that takes up_vec to the Z axis
+    """
+    return FreeCAD.Rotation(FreeCAD.Vector(*up_vec), VZ)
+
+
+def get_print_rot_shp(shp, prnt_ax=None, lin_defl=kparts.LIN_DEFL):
+    """ Returns the best print orientation of a shape
+
+    Parameters
+    ----------
+    shp : TopoShape
+    prnt_ax : FreeCAD.Vector
+        Print axis of the part (the direction that should point up).
+        It is added to the candidates, and it wins in case of a tie
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    FreeCAD.Rotation
+        Rotation to take the shape to its print orientation
+    """
+
+    return get_print_rot_shplist([shp], [prnt_ax], lin_defl)[0]
+
+
+def get_print_rot_shplist(shp_list, prnt_ax_list=None,
+                          lin_defl=kparts.LIN_DEFL):
+    """ Returns the best print orientation of each shape of a list.
+    All the triangles of all the shapes are evaluated together, and the
+    results are reduced by shape
+
+    Parameters
+    ----------
+    shp_list : list of TopoShape
+    prnt_ax_list : list of FreeCAD.Vector
+        Print axis of each part, None elements or a None list if not known
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    list of FreeCAD.Rotation
+    """
+
+    if prnt_ax_list is None:
+        prnt_ax_list = [None] * len(shp_list)
+
+    # shapes with the same candidates are evaluated in the same batch
+    batch_dict = {}
+    for shp_i, prnt_ax in enumerate(prnt_ax_list):
+        up_arr = get_up_arr(prnt_ax)
+        batch_dict.setdefault(up_arr.tobytes(), (up_arr, []))[1].append(shp_i)
+    best_list = [None] * len(shp_list)
+    for up_arr, shp_i_list in batch_dict.values():
+        for shp_i, score in zip(shp_i_list,
+                                eval_orient_batch(
+                                     [shp_list[i] for i in shp_i_list],
+                                     up_arr, lin_defl)):
+            # in case of a tie, the first candidate is taken (VZ: not
+            # rotated), but prnt_ax (the last one, if it is there) is preferred
+            best = int(np.argmin(score))
+            if (len(up_arr) > len(UP_DIR_LIST)
+                    and score[-1] <= score[best] + SCORE_TOL):
+                best = len(up_arr) - 1
+            best_list[shp_i] = up_arr[best]
+    return [get_rot_up(up_vec) for up_vec in best_list]
+
+
+def eval_orient_batch(shp_list, up_arr, lin_defl=kparts.LIN_DEFL):
+    """ Evaluates the same candidate up directions on a list of shapes
+
+    Parameters
+    ----------
+    shp_list : list of TopoShape
+    up_arr : numpy array (n_up, 3)
+        Unit vectors of the candidate up directions
+    lin_defl : float
+        Linear deflection of the tessellation
+
+    Returns
+    -------
+    numpy array (n_shp, n_up)
+        Score of each orientation for each shape, the lower, the better
+    """
+
+    n_up = len(up_arr)
+    n_shp = len(shp_list)
+    arr_list = [shp_facet_arr(shp, lin_defl) for shp in shp_list]
+    pt_id = np.concatenate([np.full(len(arr[0]), i)
+                            for i, arr in enumerate(arr_list)] + [[]])
+    tri_id = np.concatenate([np.full(len(arr[2]), i)
+                             for i, arr in enumerate(arr_list)] + [[]])
+    pt_id = pt_id.astype(int)
+    tri_id = tri_id.astype(int)
+    points = np.concatenate([arr[0] for arr in arr_list] + [np.zeros((0, 3))])
+    normals = np.concatenate([arr[1] for arr in arr_list] + [np.zeros((0, 3))])
+    areas = np.concatenate([arr[2] for arr in arr_list] + [np.zeros(0)])
+    centers = np.concatenate([arr[3] for arr in arr_list] + [np.zeros((0, 3))])
+
+    if len(areas) == 0:
+        return np.zeros((n_shp, n_up))
+
+    # heights of the points for each up direction, reduced by shape
+    pt_h = points @ up_arr.T  # (n_points, n_up)
+    bed_h = np.full((n_shp, n_up), np.inf)
+    top_h = np.full((n_shp, n_up), - np.inf)
+    np.minimum.at(bed_h, pt_id, pt_h)
+    np.maximum.at(top_h, pt_id, pt_h)
+    height = top_h - bed_h
+
+    tri_h = centers @ up_arr.T - bed_h[tri_id]  # (n_tri, n_up)
+    tri_cos = normals @ up_arr.T  # (n_tri, n_up)
+    facing_down = tri_cos < - OVERHANG_COS
+    on_bed = (tri_cos < - FLAT_COS) & (tri_h < CONTACT_TOL)
+    overhang = np.zeros((n_shp, n_up))
+    contact = np.zeros((n_shp, n_up))
+    np.add.at(overhang, tri_id,
+              np.where(facing_down & ~on_bed, areas[:, None], 0))
+    np.add.at(contact, tri_id, np.where(on_bed, areas[:, None], 0))
+
+    area_tot = np.bincount(tri_id, weights=areas, minlength=n_shp)
+    pt_min = np.full((n_shp, 3), np.inf)
+    pt_max = np.full((n_shp, 3), - np.inf)
+    np.minimum.at(pt_min, pt_id, points)
+    np.maximum.at(pt_max, pt_id, points)
+    diag = np.linalg.norm(pt_max - pt_min, axis=1)
+    # shapes without triangles get a score of 0 for all the orientations
+    area_tot = np.where(area_tot > 0, area_tot, np.inf)
+    diag = np.where(np.isfinite(diag) & (diag > 0), diag, np.inf)
+    height = np.where(np.isfinite(height), height, 0)
+
+    score = (OVERHANG_W * overhang / area_tot[:, None]
+             - CONTACT_W * contact / area_tot[:, None]
+             + HEIGHT_W * height / diag[:, None])
+    return score
@@ -17,6 +17,7 @@ import sys
 import math
 import inspect
 import logging
+import numpy as np
 
 # directory this file is
 filepath = os.getcwd()
@@ -35,6 +36,48 @@ from fcfun import VXN, VYN, VZN
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Level of detail (LOD) of the shapes of the purchased components
+# (motors, pulleys, profiles, bolts, ...), that are usually just context
+# in an assembly:
+LOD_ENV = 0  # bounding envelope: only the outer size (box or cylinder)
+LOD_SIMPLE = 1  # simplified solid: main bodies, without small features
+LOD_FULL = 2  # full detail
+# key of the document Meta where the LOD of the document is kept
+LOD_META = 'lod'
+
+
+def set_doc_lod(lod, doc=None):
+    """ Sets the default LOD of the components that will be created in
+    the document. It is saved with the document. To build again the
+    components that are already in the document, see
+    fc_clss.rebuild_doc_lod
+
+    Parameters
+    -----------
+    lod : int
+        LOD_ENV, LOD_SIMPLE or LOD_FULL
+    doc : FreeCAD document
+        If None, the active document
+    """
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    meta = doc.Meta
+    meta[LOD_META] = str(lod)
+    doc.Meta = meta
+
+
+def get_lod(lod=None, doc=None):
+    """ Returns lod, or the LOD of the document if lod is None.
+    If the document has no LOD, it is LOD_FULL
+    """
+    if lod is not None:
+        return lod
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    if doc is not None and LOD_META in doc.Meta:
+        return int(doc.Meta[LOD_META])
+    return LOD_FULL
+
 
 class Obj3D(object):
     """ This is the the basic class, that provides reference axes and 
@@ -93,6 +136,22 @@ class Obj3D(object):
 
         self.pos_o_adjust = V0
 
+    # features that are not built at each LOD: {lod: tuple of features}
+    # each class with LOD declares its own
+    lod_drop = {}
+    lod = LOD_FULL
+
+    def set_lod(self, lod=None):
+        """ Sets the attribute lod: the given lod, or the LOD of the
+        document if None. See get_lod
+        """
+        self.lod = get_lod(lod)
+
+    def lod_has(self, feature):
+        """ Returns True if the feature is built at the LOD of the object
+        """
+        return feature not in self.lod_drop.get(self.lod, ())
+
     def vec_d(self, d):
         """ creates a vector along axis_d (depth) with the length of argument d
 
@@ -173,6 +232,7 @@ class Obj3D(object):
         self.pos_o = self.pos + vec_to_pos_o
         if adjust == 1:
             self.pos_o_adjust = vec_to_pos_o  # self.pos_o - self.pos
+        self.reset_pos_table()
 
     def get_o_to_d(self, pos_d):
         """ returns the vector from origin pos_o to pos_d
@@ -329,12 +389,152 @@ class Obj3D(object):
 
     def get_pos_dwh(self, pos_d, pos_w, pos_h):
         """ returns the absolute position of the pos_d, pos_w, pos_h point
+        It is taken from the table of points, see make_pos_table
         """
+        tbl, off_d, off_w, off_h = self.get_pos_table()
+        ind_d = pos_d + off_d
+        ind_w = pos_w + off_w
+        ind_h = pos_h + off_h
+        if (0 <= ind_d < tbl.shape[0] and 0 <= ind_w < tbl.shape[1]
+                and 0 <= ind_h < tbl.shape[2]):
+            pt = tbl[ind_d, ind_w, ind_h]
+            if not np.isnan(pt[0]):
+                return FreeCAD.Vector(pt[0], pt[1], pt[2])
+        # not in the table: the key is not defined, it will log the error
         pos = (self.pos_o + self.get_o_to_d(pos_d)
                + self.get_o_to_w(pos_w)
                + self.get_o_to_h(pos_h))
         return pos
 
+    def get_pos_dwh_arr(self, pos_d, pos_w, pos_h):
+        """ returns the absolute positions of many points at once
+
+        Parameters:
+        -----------
+        pos_d, pos_w, pos_h : int or array of int
+            They are broadcast together, as numpy does
+
+        Returns:
+        --------
+        numpy array (..., 3)
+            Coordinates of the points, nan if the point is not defined
+        """
+        tbl, off_d, off_w, off_h = self.get_pos_table()
+        ind_d, ind_w, ind_h = np.broadcast_arrays(
+                                        np.asarray(pos_d, dtype=int) + off_d,
+                                        np.asarray(pos_w, dtype=int) + off_w,
+                                        np.asarray(pos_h, dtype=int) + off_h)
+        valid = ((ind_d >= 0) & (ind_d < tbl.shape[0])
+                 & (ind_w >= 0) & (ind_w < tbl.shape[1])
+                 & (ind_h >= 0) & (ind_h < tbl.shape[2]))
+        pts = np.full(ind_d.shape + (3,), np.nan)
+        pts[valid] = tbl[ind_d[valid], ind_w[valid], ind_h[valid]]
+        return pts
+
+    def _axis_table(self, o_dict, cen):
+        """ returns the array of the vectors from the origin to the points
+        along an axis (n, 3), and the offset of pos 0 in the array.
+        For symmetrical axes (cen == 1) the array goes from -max to max,
+        the points not defined are nan
+        """
+        key_list = [key for key in o_dict
+                    if isinstance(key, int) and key >= 0
+                    and o_dict[key] is not None]
+        if not key_list:
+            return np.zeros((1, 3)), 0
+        n_max = max(key_list)
+        if cen == 1:
+            off = n_max
+            tbl = np.full((2 * n_max + 1, 3), np.nan)
+            vec_0 = o_dict.get(0)
+            for key in key_list:
+                vec = o_dict[key]
+                tbl[off - key] = (vec.x, vec.y, vec.z)
+                if key > 0 and vec_0 is not None:
+                    # see get_o_to_d: A = 2B - C
+                    tbl[off + key] = (2 * vec_0.x - vec.x,
+                                      2 * vec_0.y - vec.y,
+                                      2 * vec_0.z - vec.z)
+        else:
+            off = 0
+            tbl = np.full((n_max + 1, 3), np.nan)
+            for key in key_list:
+                vec = o_dict[key]
+                tbl[key] = (vec.x, vec.y, vec.z)
+        return tbl, off
+
+    def make_pos_table(self):
+        """ makes the table of all the (pos_d, pos_w, pos_h) points
+        of the object: a numpy array (n_d, n_w, n_h, 3) with the absolute
+        position of each point, so get_pos_dwh is just an index.
+        It is made when it is needed the first time (get_pos_table)
+        """
+        tbl_d, off_d = self._axis_table(self.d_o, getattr(self, 'd0_cen', 0))
+        tbl_w, off_w = self._axis_table(self.w_o, getattr(self, 'w0_cen', 0))
+        tbl_h, off_h = self._axis_table(self.h_o, getattr(self, 'h0_cen', 0))
+        pos_o = self.pos_o
+        tbl = (np.array((pos_o.x, pos_o.y, pos_o.z))
+               + tbl_d[:, None, None, :]
+               + tbl_w[None, :, None, :]
+               + tbl_h[None, None, :, :])
+        self._pos_table = (tbl, off_d, off_w, off_h)
+        self._pos_table_key = self._get_pos_table_key()
+        return self._pos_table
+
+    def _get_pos_table_key(self):
+        """ returns what the table depends on: pos_o and the number of
+        points. If the vectors of the points are changed, without adding
+        points, call reset_pos_table
+        """
+        return (tuple(self.pos_o), len(self.d_o), len(self.w_o),
+                len(self.h_o))
+
+    def get_pos_table(self):
+        """ returns the table of points (see make_pos_table) and the
+        offsets of pos_d = 0, pos_w = 0, pos_h = 0 in the table.
+        It is made again if pos_o or the number of points have changed
+        """
+        pos_table = getattr(self, '_pos_table', None)
+        if (pos_table is None
+                or self._pos_table_key != self._get_pos_table_key()):
+            pos_table = self.make_pos_table()
+        return pos_table
+
+    def reset_pos_table(self):
+        """ discards the table of points, it will be made again when
+        needed. Call it after changing the vectors of d_o, w_o or h_o
+        """
+        self._pos_table = None
+
+    def get_local_place(self):
+        """ returns the placement of the local frame of the part: at pos_o
+        and rotated to the axes of the part. For parts with only axis_h
+        (cylinders) the rotation around it is the one from VZ to axis_h
+        """
+        if self.axis_h is not None and self.axis_h.Length > 0:
+            axis_h = self.axis_h
+        else:
+            axis_h = VZ
+        if (self.axis_d is not None and self.axis_d.Length > 0
+                and fcfun.fc_isperp(self.axis_d, axis_h)):
+            rot = FreeCAD.Rotation(self.axis_d, axis_h.cross(self.axis_d),
+                                   axis_h, 'ZXY')
+        else:
+            rot = FreeCAD.Rotation(VZ, axis_h)
+        return FreeCAD.Placement(self.pos_o, rot)
+
+    def shp_needed(self, shp_args):
+        """ returns True if the shape has to be built. The parts that are
+        links to an existing master object take the shape from it, see
+        fc_clss.SinglePart.shp_needed
+
+        Parameters
+        -----------
+        shp_args : dict
+            Arguments of the class, they define the shape
+        """
+        return True
+
 
 class ShpCyl(Obj3D):
     """
@@ -744,6 +944,10 @@ class ShpCylHole(Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        self.prnt_ax = self.axis_h
+        if not self.shp_needed({i: values[i] for i in args if i != 'self'}):
+            return
+
         shpcyl = fcfun.shp_cylholedir(r_out=r_out + xtr_r_out,  # ext radius
                                       r_in=r_in + xtr_r_in,  # internal radius
                                       h=h + xtr_bot + xtr_top,  # height
@@ -751,7 +955,6 @@ class ShpCylHole(Obj3D):
                                       pos=self.pos_o)  # Position
 
         self.shp = shpcyl
-        self.prnt_ax = self.axis_h
 
 
 # cyl = ShpCylHole (r_in=2, r_out=6, h=4,
@@ -953,6 +1156,10 @@ class ShpPrismHole(Obj3D):
             self.axis_apo = DraftVecUtils.rotate(self.axis_d, math.pi / n_sides,
                                                  self.axis_h)
 
+        self.prnt_ax = self.axis_h
+        if not self.shp_needed({i: values[i] for i in args if i != 'self'}):
+            return
+
         shp_prism = fcfun.shp_regprism_dirxtr(n_sides=n_sides,
                                               radius=r_out + xtr_r_out,
                                               length=h,
@@ -971,7 +1178,6 @@ class ShpPrismHole(Obj3D):
             self.shp = shp_prism.cut(shp_cyl)
         else:
             self.shp = shp_prism
-        self.prnt_ax = self.axis_h
 
 
 # prism = ShpPrismHole (n_sides = 4,
@@ -1067,6 +1273,11 @@ class ShpBolt(Obj3D):
     pos : FreeCAD.Vector
         Position of the bolt, taking into account where the pos_h, pos_d, pos_w
         are
+    lod : int
+        Level of detail, if None, the LOD of the document (see get_lod)
+        LOD_FULL: all the features
+        LOD_SIMPLE: no hex socket, no thinner thread
+        LOD_ENV: a cylinder of the head radius along the whole bolt
 
     Attributes:
     -----------
@@ -1107,6 +1318,9 @@ class ShpBolt(Obj3D):
 
     """
 
+    lod_drop = {LOD_SIMPLE: ('socket', 'thread'),
+                LOD_ENV: ('socket', 'thread', 'head')}
+
     def __init__(self,
                  shank_r,
                  shank_l,
@@ -1120,9 +1334,11 @@ class ShpBolt(Obj3D):
                  head_out=0,
                  axis_h=VZ, axis_d=None, axis_w=None,
                  pos_h=0, pos_d=0, pos_w=0,
-                 pos=V0):
+                 pos=V0,
+                 lod=None):
 
         Obj3D.__init__(self, axis_d, axis_w, axis_h)
+        self.set_lod(lod)
 
         # save the arguments as attributes:
         frame = inspect.currentframe()
@@ -1168,6 +1384,27 @@ class ShpBolt(Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        if socket_l > 0 and socket_2ap > 0 and self.lod_has('socket'):
+            # diameter of the socket (circumdiameter)
+            self.cos30 = 0.86603
+            self.socket_dm = socket_2ap / self.cos30
+            self.socket_r = self.socket_dm / 2.
+            if (self.axis_d is None) or (self.axis_d == V0):
+                # just make an axis_d
+                self.axis_d = fcfun.get_fc_perpend1(self.axis_h)
+
+        if not self.shp_needed({i: values[i] for i in args if i != 'self'}):
+            if self.lod_has('head'):
+                self.prnt_ax = self.axis_h
+            return
+
+        if not self.lod_has('head'):  # envelope
+            self.shp = fcfun.shp_cylcenxtr(r=head_r, h=self.tot_l,
+                                           normal=self.axis_h,
+                                           ch=0, xtr_top=0, xtr_bot=0,
+                                           pos=self.pos_o)
+            return
+
         if head_type == 0:  # cylindrical
             shp_head = fcfun.shp_cylcenxtr(r=head_r, h=head_l,
                                            normal=self.axis_h,
@@ -1191,15 +1428,7 @@ class ShpBolt(Obj3D):
                     xtr_top=0, xtr_bot=0,
                     pos=self.pos_o)
 
-        if socket_l > 0 and socket_2ap > 0:  # there is socket
-            # diameter of the socket (circumdiameter)
-            self.cos30 = 0.86603
-            self.socket_dm = socket_2ap / self.cos30
-            self.socket_r = self.socket_dm / 2.
-            if (self.axis_d is None) or (self.axis_d == V0):
-                # just make an axis_d
-                self.axis_d = fcfun.get_fc_perpend1(self.axis_h)
-
+        if socket_l > 0 and socket_2ap > 0 and self.lod_has('socket'):
             shp_socket = fcfun.shp_regprism_dirxtr(
                 n_sides=6, radius=self.socket_r,
                 length=socket_l,
@@ -1210,7 +1439,8 @@ class ShpBolt(Obj3D):
                 pos=self.pos_o)
             shp_head = shp_head.cut(shp_socket)
 
-        if thread_l == 0 or thread_l >= shank_l:  # all the shank is threaded
+        if (thread_l == 0 or thread_l >= shank_l  # all the shank is threaded
+                or not self.lod_has('thread')):
             shp_shank = fcfun.shp_cylcenxtr(r=shank_r, h=shank_l,
                                             normal=self.axis_h,
                                             ch=0,  # not centered
@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# -- Spatial index of the snap points of the parts, to assemble them
+# ----------------------------------------------------------------------------
+# -- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# The snap points of the parts of an assembly are kept in a KD-tree, so
+# the points near a given point are found without checking all of them.
+# There are 3 kinds of snap points:
+#   - KIND_REF: reference points of the shp_clss objects, all the
+#     (pos_d, pos_w, pos_h) combinations (see Obj3D.make_pos_table)
+#   - KIND_HOLE: ends of the holes (concave cylindrical faces), with the
+#     direction of the axis and the radius of the hole
+#   - KIND_FACE: centers of the planar faces, with their normal
+#
+# A snap query returns the nearest compatible point within a distance:
+# same kind and, for holes, same radius and parallel axis. Many parts can
+# be snapped at once (mate_batch), with one transaction and one recompute.
+# The KD-tree is built once: the points of the moved parts are updated in
+# place and checked one by one, until they are too many (MOVED_REBUILD)
+# and the KD-tree is built again
+#
+
+import logging
+import math
+
+import numpy as np
+
+import FreeCAD
+import Part
+
+import fcfun
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+KIND_REF = 'ref'
+KIND_HOLE = 'hole'
+KIND_FACE = 'face'
+
+# Maximum number of points on a leaf of the KDTree
+LEAF_SIZE = 8
+
+# Tolerance of the radius of compatible holes (mm)
+RADIUS_TOL = 0.05
+# Tolerance of the angle of compatible axes (degrees)
+ANGLE_TOL = 1.
+
+# Types of the objects that contain others without using their shapes
+CONTAINER_TYPES = ('App::Part', 'App::DocumentObjectGroup')
+
+# Fraction of moved points that makes the KD-tree to be built again
+MOVED_REBUILD = 0.25
+
+
+class KDTree(object):
+    """ KD-tree of 3D points, split by the median along the longest
+    axis of each node
+
+    Parameters
+    ----------
+    pts : numpy array (n, 3)
+    leaf_size : int
+        Maximum number of points on a leaf
+
+    Attributes
+    ----------
+    pts : numpy array (n, 3)
+    root : tuple
+        Root node. Nodes are tuples: (box_min, box_max, indexes, child1,
+        child2). Leaves have no children (None) and internal nodes no
+        indexes
+    """
+
+    def __init__(self, pts, leaf_size=LEAF_SIZE):
+        # a copy: the points of the tree do not change
+        self.pts = np.array(pts, dtype=float).reshape(-1, 3)
+        self.leaf_size = leaf_size
+        if len(self.pts):
+            self.root = self.build(np.arange(len(self.pts)))
+        else:
+            self.root = None
+
+    def build(self, ind_arr):
+        """ Builds the node of the points with the indexes of ind_arr
+        """
+        node_pts = self.pts[ind_arr]
+        box_min = node_pts.min(axis=0)
+        box_max = node_pts.max(axis=0)
+        if len(ind_arr) <= self.leaf_size:
+            return (box_min, box_max, ind_arr, None, None)
+        axis = int(np.argmax(box_max - box_min))
+        order = np.argsort(node_pts[:, axis], kind='stable')
+        mid = len(ind_arr) // 2
+        return (box_min, box_max, None,
+                self.build(ind_arr[order[:mid]]),
+                self.build(ind_arr[order[mid:]]))
+
+    def query_ball(self, pt, r):
+        """ Returns the array of the indexes of the points at a distance
+        of pt less or equal than r
+        """
+        if self.root is None:
+            return np.zeros(0, dtype=int)
+        pt = np.asarray(pt, dtype=float)
+        r2 = r * r
+        result = []
+        node_stack = [self.root]
+        while node_stack:
+            box_min, box_max, ind_arr, child1, child2 = node_stack.pop()
+            # distance from the point to the box of the node
+            gap = np.maximum(np.maximum(box_min - pt, pt - box_max), 0)
+            if gap.dot(gap) > r2:
+                continue
+            if ind_arr is not None:
+                diff = self.pts[ind_arr] - pt
+                result.append(ind_arr[(diff * diff).sum(axis=1) <= r2])
+            else:
+                node_stack.append(child1)
+                node_stack.append(child2)
+        if not result:
+            return np.zeros(0, dtype=int)
+        return np.concatenate(result)
+
+
+def vec_arr(vec):
+    """ Returns the numpy array of a FreeCAD.Vector """
+    return np.array((vec.x, vec.y, vec.z))
+
+
+def hole_list(shp):
+    """ Returns the holes of a shape: the concave cylindrical faces
+
+    Returns
+    -------
+    list of tuples (pt_list, axis, radius)
+        pt_list: centers of the circular edges of the hole (its ends)
+        axis: FreeCAD.Vector, unit vector of the axis of the hole
+    """
+    result = []
+    for face in shp.Faces:
+        surf = face.Surface
+        if not isinstance(surf, Part.Cylinder):
+            continue
+        u0, u1, v0, v1 = face.ParameterRange
+        pt = face.valueAt((u0 + u1) / 2., (v0 + v1) / 2.)
+        normal = face.normalAt((u0 + u1) / 2., (v0 + v1) / 2.)
+        axis = surf.Axis
+        # vector from the axis to the point of the face
+        radial = pt - surf.Center
+        radial = radial - axis * radial.dot(axis)
+        if normal.dot(radial) >= 0:  # convex: a shaft, not a hole
+            continue
+        pt_list = [edge.Curve.Center for edge in face.Edges
+                   if isinstance(edge.Curve, Part.Circle)]
+        if not pt_list:
+            pt_list = [face.CenterOfMass]
+        result.append((pt_list, axis, surf.Radius))
+    return result
+
+
+def face_list(shp):
+    """ Returns the centers and normals of the planar faces of a shape
+
+    Returns
+    -------
+    list of tuples (center, normal)
+    """
+    result = []
+    for face in shp.Faces:
+        if not isinstance(face.Surface, Part.Plane):
+            continue
+        u0, u1, v0, v1 = face.ParameterRange
+        result.append((face.CenterOfMass,
+                       face.normalAt((u0 + u1) / 2., (v0 + v1) / 2.)))
+    return result
+
+
+class SnapIndex(object):
+    """ Spatial index of the snap points of the parts. The points are
+    added with add_point, add_obj3d, add_shape or add_doc, and then the
+    KD-tree is built when the first query is made (or with build)
+
+    Attributes
+    ----------
+    pts : numpy array (n, 3)
+        Positions of the points
+    dirs : numpy array (n, 3)
+        Axes of the holes, normals of the faces, zeros for KIND_REF
+    radii : numpy array (n,)
+        Radius of the holes, 0 for the others
+    kinds : list of str
+        Kind of each point: KIND_REF, KIND_HOLE, KIND_FACE
+    owners : list
+        Owner of each point: a FreeCAD object or any other object
+    labels : list of str
+        Name of the point in its owner, e.g. 'd1w0h3'
+    moved_ind : set of int
+        Indexes of the points that have been moved since the KD-tree was
+        built, their position in the KD-tree is not valid
+    """
+
+    def __init__(self):
+        self._pt_list = []
+        self._dir_list = []
+        self._radius_list = []
+        self.kinds = []
+        self.owners = []
+        self.labels = []
+        # indexes of the points of each owner, key: id of the owner
+        self._owner_dict = {}
+        self.moved_ind = set()
+        self.tree = None
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add_point(self, pt, kind, owner, label='', vdir=None, radius=0.):
+        """ Adds a snap point
+
+        Parameters
+        ----------
+        pt : FreeCAD.Vector
+        kind : str
+            KIND_REF, KIND_HOLE or KIND_FACE
+        owner :
+            FreeCAD object or other object that has the point
+        label : str
+            Name of the point
+        vdir : FreeCAD.Vector
+            Axis of the hole or normal of the face
+        radius : float
+            Radius of the hole
+        """
+        self._pt_list.append((pt.x, pt.y, pt.z))
+        if vdir is None:
+            self._dir_list.append((0., 0., 0.))
+        else:
+            vdir = FreeCAD.Vector(vdir)
+            if vdir.Length > 0:
+                vdir.normalize()
+            self._dir_list.append((vdir.x, vdir.y, vdir.z))
+        self._radius_list.append(radius)
+        self.kinds.append(kind)
+        self.owners.append(owner)
+        self.labels.append(label)
+        self._owner_dict.setdefault(id(owner), []).append(len(self.kinds) - 1)
+        self.tree = None
+
+    def add_obj3d(self, obj, owner=None):
+        """ Adds all the reference points of a shp_clss object, from its
+        table of points (Obj3D.get_pos_table)
+
+        Parameters
+        ----------
+        obj : shp_clss.Obj3D
+        owner :
+            Owner of the points, if None, obj
+        """
+        if owner is None:
+            owner = obj
+        tbl, off_d, off_w, off_h = obj.get_pos_table()
+        for ind in zip(*np.nonzero(~np.isnan(tbl[..., 0]))):
+            pt = tbl[ind]
+            label = ('d' + str(ind[0] - off_d) + 'w' + str(ind[1] - off_w)
+                     + 'h' + str(ind[2] - off_h))
+            self.add_point(FreeCAD.Vector(pt[0], pt[1], pt[2]), KIND_REF,
+                           owner, label)
+
+    def add_shape(self, shp, owner, holes=1, faces=1):
+        """ Adds the ends of the holes and the centers of the planar faces
+        of a shape
+
+        Parameters
+        ----------
+        shp : TopoShape
+            Shape in the assembly frame
+        owner :
+            Owner of the points
+        holes, faces : int
+            1: add them, 0: not
+        """
+        if holes == 1:
+            for ind, (pt_list, axis, radius) in enumerate(hole_list(shp)):
+                for pt in pt_list:
+                    self.add_point(pt, KIND_HOLE, owner, 'hole' + str(ind),
+                                   axis, radius)
+        if faces == 1:
+            for ind, (center, normal) in enumerate(face_list(shp)):
+                self.add_point(center, KIND_FACE, owner, 'face' + str(ind),
+                               normal)
+
+    def add_doc(self, doc=None, holes=1, faces=1):
+        """ Adds the holes and faces of the solids of a document.
+        The containers (CONTAINER_TYPES) and the objects that are used by
+        other objects (except by containers) are not added, their shapes
+        are in the objects that use them.
+        The links (App::Link) are added with the shape of the object they
+        link. The shapes are taken at their global placement
+
+        Parameters
+        ----------
+        doc : FreeCAD document
+            If None, the active document
+        """
+        if doc is None:
+            doc = FreeCAD.ActiveDocument
+        for obj in doc.Objects:
+            if is_container(obj) or [obj_in for obj_in in obj.InList
+                                     if not is_container(obj_in)]:
+                continue
+            shp = Part.getShape(obj)
+            if not shp.Solids:
+                continue
+            # the shape has the placement of obj, not of its containers
+            shp.Placement = get_parent_place(obj).multiply(shp.Placement)
+            self.add_shape(shp, obj, holes, faces)
+
+    def get_owner_ind(self, owner):
+        """ Returns the list of the indexes of the points of an owner """
+        return self._owner_dict.get(id(owner), [])
+
+    def move_owner(self, owner, vec):
+        """ Moves the points of an owner along vec, after the owner has
+        been moved. The KD-tree is not built again: the moved points are
+        checked one by one in the queries (see moved_ind)
+        """
+        ind_list = self.get_owner_ind(owner)
+        for ind in ind_list:
+            x, y, z = self._pt_list[ind]
+            self._pt_list[ind] = (x + vec.x, y + vec.y, z + vec.z)
+        if self.tree is not None and ind_list:
+            self.pts[ind_list] += vec_arr(vec)
+            self.moved_ind.update(ind_list)
+
+    def build(self):
+        """ Builds the arrays and the KD-tree of the points """
+        self.pts = np.array(self._pt_list, dtype=float).reshape(-1, 3)
+        self.dirs = np.array(self._dir_list, dtype=float).reshape(-1, 3)
+        self.radii = np.array(self._radius_list, dtype=float)
+        self.kind_arr = np.array(self.kinds, dtype=object)
+        self.tree = KDTree(self.pts)
+        self.moved_ind = set()
+
+    def query(self, pt, r, kind=None, radius=None, vdir=None,
+              owner_excl=None, radius_tol=RADIUS_TOL, angle_tol=ANGLE_TOL):
+        """ Returns the compatible points within a distance, sorted by
+        distance
+
+        Parameters
+        ----------
+        pt : FreeCAD.Vector
+        r : float
+            Maximum distance
+        kind : str
+            If not None, only points of this kind
+        radius : float
+            If not None, only points with this radius (holes)
+        vdir : FreeCAD.Vector
+            If not None, only points with a parallel direction (either
+            sense)
+        owner_excl :
+            Points of this owner are not returned (e.g. the part to move)
+        radius_tol : float
+            Tolerance of the radius
+        angle_tol : float
+            Tolerance of the angle of the directions (degrees)
+
+        Returns
+        -------
+        list of tuples (dist, ind)
+            Distance and index of the points
+        """
+        if (self.tree is None
+                or len(self.moved_ind) > MOVED_REBUILD * len(self)):
+            self.build()
+        pt = vec_arr(pt)
+        ind_arr = self.tree.query_ball(pt, r)
+        if self.moved_ind:
+            # the moved points are not where the KD-tree has them
+            moved_arr = np.array(sorted(self.moved_ind), dtype=int)
+            diff = self.pts[moved_arr] - pt
+            ind_arr = np.concatenate((
+                          ind_arr[np.isin(ind_arr, moved_arr, invert=True)],
+                          moved_arr[(diff * diff).sum(axis=1) <= r * r]))
+        if kind is not None:
+            ind_arr = ind_arr[self.kind_arr[ind_arr] == kind]
+        if radius is not None:
+            ind_arr = ind_arr[np.abs(self.radii[ind_arr] - radius)
+                              <= radius_tol]
+        if vdir is not None and vdir.Length > 0:
+            vdir = vec_arr(vdir) / vdir.Length
+            cos_tol = math.cos(math.radians(angle_tol))
+            ind_arr = ind_arr[np.abs(self.dirs[ind_arr].dot(vdir)) >= cos_tol]
+        if owner_excl is not None:
+            ind_arr = ind_arr[np.isin(ind_arr,
+                                      self.get_owner_ind(owner_excl),
+                                      invert=True)]
+        dist_arr = np.linalg.norm(self.pts[ind_arr] - pt, axis=1)
+        order = np.argsort(dist_arr, kind='stable')
+        return [(float(dist_arr[i]), int(ind_arr[i])) for i in order]
+
+    def nearest(self, pt, r, **kwargs):
+        """ Returns the index of the nearest compatible point within r,
+        None if there is none. The arguments are the ones of query
+        """
+        result = self.query(pt, r, **kwargs)
+        if not result:
+            return None
+        return result[0][1]
+
+    def get_point(self, ind):
+        """ Returns the point ind as a FreeCAD.Vector """
+        if self.tree is None:
+            self.build()
+        pt = self.pts[ind]
+        return FreeCAD.Vector(pt[0], pt[1], pt[2])
+
+
+def sub_snap(sub, pick=None):
+    """ Returns the point of a subelement of a shape (e.g. the one
+    selected) to snap it, and the arguments of SnapIndex.query to find
+    the compatible points:
+      - hole (concave cylindrical face): the end of the hole nearest to
+        pick, with its radius and axis
+      - circular edge: its center, as the end of a hole
+      - planar face: its center and normal
+      - vertex: its point, any kind
+      - others: the center of mass, any kind
+
+    Parameters
+    ----------
+    sub : TopoShape
+        Face, edge or vertex
+    pick : FreeCAD.Vector
+        Picked point, to choose the end of the holes. If None, the first
+
+    Returns
+    -------
+    tuple (pt, kind, radius, vdir)
+    """
+    if isinstance(sub, Part.Face):
+        hole_tup_list = hole_list(sub)
+        if hole_tup_list:
+            pt_list, axis, radius = hole_tup_list[0]
+            pt = pt_list[0]
+            if pick is not None:
+                pt = min(pt_list, key=lambda pt_i: (pt_i - pick).Length)
+            return pt, KIND_HOLE, radius, axis
+        face_tup_list = face_list(sub)
+        if face_tup_list:
+            center, normal = face_tup_list[0]
+            return center, KIND_FACE, None, normal
+    elif isinstance(sub, Part.Edge) and isinstance(sub.Curve, Part.Circle):
+        return sub.Curve.Center, KIND_HOLE, sub.Curve.Radius, sub.Curve.Axis
+    elif isinstance(sub, Part.Vertex):
+        return sub.Point, None, None, None
+    return sub.CenterOfMass, None, None, None
+
+
+def is_container(obj):
+    """ Returns True if the FreeCAD object is a container, see
+    CONTAINER_TYPES
+    """
+    return any(obj.isDerivedFrom(cont_type) for cont_type in CONTAINER_TYPES)
+
+
+def get_parent_place(obj):
+    """ Returns the placement of the containers (App::Part) that have
+    a FreeCAD object, the identity if it is not in a container
+    """
+    return obj.getGlobalPlacement().multiply(obj.Placement.inverse())
+
+
+def mate_batch(index, mate_list, r, doc=None, **kwargs):
+    """ Moves many objects at once, each one so a point of it snaps to the
+    nearest compatible point of another object. All of them are moved in
+    one transaction with one recompute (fcfun.bulk_insert).
+    The mates are made in order, and the points of the objects already
+    moved are updated in the index, so a mate can snap to an object
+    moved by a previous mate
+
+    Parameters
+    ----------
+    index : SnapIndex
+        Index of the target points
+    mate_list : list of tuples (fco, pt, kind, radius, vdir)
+        fco: FreeCAD object to move
+        pt: FreeCAD.Vector, point of fco to snap (e.g. the end of a bolt),
+            in global coordinates
+        kind, radius, vdir: see SnapIndex.query, they can be None
+    r : float
+        Maximum distance to snap
+    doc : FreeCAD document
+        If None, the active document
+    kwargs :
+        Other arguments of SnapIndex.query (radius_tol, angle_tol)
+
+    Returns
+    -------
+    list of int or None
+        Index of the target point of each mate, None if not snapped
+    """
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    target_list = []
+    with fcfun.bulk_insert('Snap', doc):
+        for fco, pt, kind, radius, vdir in mate_list:
+            ind = index.nearest(pt, r, kind=kind, radius=radius, vdir=vdir,
+                                owner_excl=fco, **kwargs)
+            target_list.append(ind)
+            if ind is None:
+                logger.warning(fco.Label + ': no snap point near')
+                continue
+            mov = index.get_point(ind) - pt
+            # the placement of fco is in the frame of its containers
+            place = FreeCAD.Placement(fco.Placement)
+            place.Base = (place.Base + get_parent_place(fco).Rotation
+                          .inverted().multVec(mov))
+            fco.Placement = place
+            index.move_owner(fco, mov)
+    return target_list
@@ -961,8 +961,7 @@ class IdlerTensionerSet(fc_clss.PartsSet):
         nut.parent = self
 
         self.place_fcos()
-        if group == 1:
-            self.make_group()
+        self.make_fco_group(group)
 
     def get_idler_tensioner(self):
         """gets the idler tensioner"""
@@ -2087,8 +2086,7 @@ class TensionerSet(fc_clss.PartsSet):
         tens_bolt.parent = self
 
         self.place_fcos()
-        if group == 1:
-            self.make_group()
+        self.make_fco_group(group)
 
     def get_tensioner_holder(self):
         """ gets the tensioner holder"""
@@ -2121,7 +2119,9 @@ class TensionerSet(fc_clss.PartsSet):
         self.tens_out = self.tens_out_ratio * self.tens_stroke
         idler_tensioner = self.get_idler_tensioner()
         idler_tensioner.extra_mov = idler_tensioner.vec_d(self.tens_out)
-        self.place_fcos()
+        # only the idler tensioner set is placed again (its container if
+        # it has one), the rest of the set does not move
+        idler_tensioner.place_fcos()
 
 
 """